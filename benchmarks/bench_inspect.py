@@ -0,0 +1,66 @@
+"""
+Measure the per-record inspection time of LIDOInspector.
+
+Usage: python benchmarks/bench_inspect.py [number of records]
+"""
+
+import sys
+import time
+from nfdinspector.lido_inspector import LIDOInspector
+
+RECORD: str = (
+    "<lido:lido>"
+    "<lido:lidoRecID lido:type='local'>DE-1_{number}</lido:lidoRecID>"
+    "<lido:category><lido:conceptID>http://terminology.lido-schema.org/lido00096</lido:conceptID>"
+    "<lido:term>Man-Made Object</lido:term></lido:category>"
+    "<lido:descriptiveMetadata xml:lang='de'>"
+    "<lido:objectClassificationWrap><lido:objectWorkTypeWrap><lido:objectWorkType>"
+    "<lido:conceptID>http://vocab.getty.edu/aat/300033618</lido:conceptID><lido:term>Gemälde</lido:term>"
+    "</lido:objectWorkType></lido:objectWorkTypeWrap></lido:objectClassificationWrap>"
+    "<lido:objectIdentificationWrap>"
+    "<lido:titleWrap><lido:titleSet><lido:appellationValue>Bildnis {number}</lido:appellationValue></lido:titleSet></lido:titleWrap>"
+    "<lido:repositoryWrap><lido:repositorySet><lido:repositoryName><lido:legalBodyID>ISIL</lido:legalBodyID>"
+    "<lido:legalBodyName><lido:appellationValue>Museum</lido:appellationValue></lido:legalBodyName></lido:repositoryName>"
+    "<lido:workID>{number}</lido:workID></lido:repositorySet></lido:repositoryWrap>"
+    "<lido:objectDescriptionWrap><lido:objectDescriptionSet><lido:descriptiveNoteValue>Ein Gemälde {number}</lido:descriptiveNoteValue></lido:objectDescriptionSet></lido:objectDescriptionWrap>"
+    "<lido:objectMeasurementsWrap><lido:objectMeasurementsSet><lido:objectMeasurements><lido:measurementsSet>"
+    "<lido:measurementType>Höhe</lido:measurementType><lido:measurementUnit>cm</lido:measurementUnit>"
+    "<lido:measurementValue>10</lido:measurementValue></lido:measurementsSet></lido:objectMeasurements></lido:objectMeasurementsSet></lido:objectMeasurementsWrap>"
+    "</lido:objectIdentificationWrap>"
+    "<lido:eventWrap><lido:eventSet><lido:event><lido:eventType><lido:term>Herstellung</lido:term></lido:eventType>"
+    "<lido:eventDate><lido:date><lido:earliestDate>1900</lido:earliestDate><lido:latestDate>1950</lido:latestDate></lido:date></lido:eventDate>"
+    "<lido:eventMaterialsTech><lido:materialsTech><lido:termMaterialsTech lido:type='material'>"
+    "<lido:term>Öl</lido:term></lido:termMaterialsTech></lido:materialsTech></lido:eventMaterialsTech>"
+    "</lido:event></lido:eventSet></lido:eventWrap>"
+    "</lido:descriptiveMetadata>"
+    "<lido:administrativeMetadata xml:lang='de'><lido:recordWrap>"
+    "<lido:recordID lido:type='local'>DE-1_{number}</lido:recordID>"
+    "<lido:recordType><lido:term>item</lido:term></lido:recordType>"
+    "<lido:recordSource><lido:legalBodyName><lido:appellationValue>Museum</lido:appellationValue></lido:legalBodyName></lido:recordSource>"
+    "<lido:recordInfoSet><lido:recordInfoLink>https://example.org/</lido:recordInfoLink></lido:recordInfoSet>"
+    "</lido:recordWrap></lido:administrativeMetadata>"
+    "</lido:lido>"
+)
+
+
+def corpus(number: int) -> str:
+    return (
+        "<lido:lidoWrap xmlns:lido='http://www.lido-schema.org'>"
+        + "".join(RECORD.format(number=record) for record in range(number))
+        + "</lido:lidoWrap>"
+    )
+
+
+def main(number: int) -> None:
+    li = LIDOInspector()
+    li.read_lido(corpus(number))
+    start: float = time.perf_counter()
+    li.inspect()
+    seconds: float = time.perf_counter() - start
+    print(
+        f"{number} records  {seconds:8.3f} s  {seconds / number * 1e6:8.1f} µs/record"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
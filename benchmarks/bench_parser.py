@@ -0,0 +1,60 @@
+"""
+Compare parsing small LIDO records with a new XML parser per call and with the pooled parsers.
+
+Usage: python benchmarks/bench_parser.py [number of records]
+"""
+
+import sys
+import timeit
+from lxml import etree
+from nfdinspector.lido_inspector import LIDOInspector
+from nfdinspector.metadata_inspector import MetadataInspector
+
+RECORD: bytes = (
+    b"<lido:lidoWrap xmlns:lido='http://www.lido-schema.org'>\n"
+    b"  <lido:lido>\n"
+    b"    <lido:lidoRecID lido:type='local'>DE-1_1</lido:lidoRecID>\n"
+    b"    <lido:descriptiveMetadata xml:lang='de'>\n"
+    b"      <lido:objectIdentificationWrap><lido:titleWrap><lido:titleSet>\n"
+    b"        <lido:appellationValue>Bildnis eines Mannes</lido:appellationValue>\n"
+    b"      </lido:titleSet></lido:titleWrap></lido:objectIdentificationWrap>\n"
+    b"    </lido:descriptiveMetadata>\n"
+    b"  </lido:lido>\n"
+    b"</lido:lidoWrap>\n"
+)
+
+
+def new_parser() -> None:
+    parser = etree.XMLParser(remove_blank_text=True, ns_clean=True)
+    etree.fromstring(RECORD, parser)
+
+
+def pooled_parser() -> None:
+    MetadataInspector.read_xml(RECORD)
+
+
+def read_lido(inspector: LIDOInspector) -> None:
+    inspector.read_lido(RECORD)
+
+
+def main(number: int) -> None:
+    li = LIDOInspector()
+    results: dict = {
+        "new parser per record": timeit.timeit(new_parser, number=number),
+        "pooled parser": timeit.timeit(pooled_parser, number=number),
+        "pooled parser, read_lido": timeit.timeit(lambda: read_lido(li), number=number),
+    }
+    MetadataInspector.configure_parser({"remove_blank_text": False})
+    results["pooled parser, remove_blank_text=False"] = timeit.timeit(
+        pooled_parser, number=number
+    )
+    baseline: float = results["new parser per record"]
+    for name, seconds in results.items():
+        print(
+            f"{name:<42} {seconds:8.3f} s  {number / seconds:10.0f} records/s"
+            f"  {baseline / seconds:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
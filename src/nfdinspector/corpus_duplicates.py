@@ -0,0 +1,205 @@
+import heapq
+import os
+import struct
+from .duplicate_index import DuplicateIndex
+
+
+class CorpusDuplicates:
+    """
+    Exact duplicates across the shards of a corpus that is larger than memory.
+
+    Every shard writes the digests of its texts together with its shard number and the
+    position of the record in the shard to sorted run files on disk (see add_shard). The runs
+    of all shards are then merged with an external sort (see merge), so texts that occur in
+    several records end up next to each other without keeping the corpus in memory. At most
+    fan_in run files are open at a time, more run files are merged in several passes. Only the
+    positions of the duplicates are kept per shard, so they can be fed back into the
+    inspections of the shards (see LIDOInspector.apply_corpus_duplicates).
+    """
+
+    entry = struct.Struct(f">B{DuplicateIndex.digest_size}sII")
+
+    def __init__(
+        self, directory: str, run_size: int = 1000000, fan_in: int = 64
+    ) -> None:
+        """
+        Construct CorpusDuplicates with a directory for the run files.
+
+        :param directory: Directory for the run files, created if missing
+        :type directory: str
+        :param run_size: Maximum number of entries sorted in memory per run file
+        :type run_size: int, default 1000000
+        :param fan_in: Maximum number of run files merged at once
+        :type fan_in: int, default 64
+        :raises ValueError: If run_size is not positive or fan_in is less than 2
+        """
+        if run_size < 1:
+            raise ValueError(f"run_size must be positive: {run_size}")
+        if fan_in < 2:
+            raise ValueError(f"fan_in must be at least 2: {fan_in}")
+        os.makedirs(directory, exist_ok=True)
+        self._directory: str = directory
+        self._run_size: int = run_size
+        self._fan_in: int = fan_in
+        self._runs: list = []
+        self._run_number: int = 0
+        self._shards: int = 0
+        self._duplicates: dict = {}
+
+    @property
+    def directory(self) -> str:
+        """Get the directory of the run files."""
+        return self._directory
+
+    @property
+    def runs(self) -> list:
+        """Get the file paths of the run files."""
+        return self._runs
+
+    @property
+    def fan_in(self) -> int:
+        """Get the maximum number of run files merged at once."""
+        return self._fan_in
+
+    @property
+    def shards(self) -> int:
+        """Get the number of added shards."""
+        return self._shards
+
+    def add_shard(self, texts) -> int:
+        """
+        Write the digests of the texts of a shard to sorted run files.
+
+        Empty texts are ignored like with DuplicateIndex.
+
+        :param texts: Tuples of field number (0 to 255), text and position of the record in the shard
+        :type texts: Iterable[tuple]
+        :return: Number of the shard
+        :rtype: int
+        """
+        shard: int = self._shards
+        self._shards += 1
+        run: list = []
+        for field, text, position in texts:
+            if text == "":
+                continue
+            run.append(
+                self.entry.pack(field, DuplicateIndex.digest(text), shard, position)
+            )
+            if len(run) >= self._run_size:
+                self.write_run(run)
+                run = []
+        if run:
+            self.write_run(run)
+        return shard
+
+    def write_run(self, entries: list) -> None:
+        """
+        Sort entries and write them to a new run file.
+
+        :param entries: Packed entries (see entry)
+        :type entries: list
+        """
+        entries.sort()
+        file_path: str = self.run_path()
+        with open(file_path, "wb") as file:
+            file.writelines(entries)
+        self._runs.append(file_path)
+
+    def run_path(self) -> str:
+        """
+        Get the file path of a new run file.
+
+        :return: File path in the directory of the run files
+        :rtype: str
+        """
+        file_path: str = os.path.join(self.directory, f"run-{self._run_number:06d}.bin")
+        self._run_number += 1
+        return file_path
+
+    def merge_runs(self, runs: list) -> str:
+        """
+        Merge run files into a new run file and remove them.
+
+        :param runs: File paths to run files
+        :type runs: list
+        :return: File path to the merged run file
+        :rtype: str
+        """
+        file_path: str = self.run_path()
+        with open(file_path, "wb") as file:
+            file.writelines(heapq.merge(*(self.read_run(run) for run in runs)))
+        for run in runs:
+            os.remove(run)
+        return file_path
+
+    def read_run(self, file_path: str):
+        """
+        Read the entries of a run file.
+
+        :param file_path: File path to a run file
+        :type file_path: str
+        :return: Generator of packed entries in sorted order
+        :rtype: Iterator[bytes]
+        """
+        with open(file_path, "rb") as file:
+            while entry := file.read(self.entry.size):
+                yield entry
+
+    def merge(self) -> None:
+        """
+        Merge the run files of all shards and find the texts that occur in more than one record.
+
+        The run files are read sequentially, so only one entry per run file is in memory at a
+        time. If there are more than fan_in run files, groups of fan_in run files are merged
+        into new run files first (see merge_runs), until fan_in run files are left.
+        """
+        while len(self._runs) > self._fan_in:
+            self._runs = [
+                self.merge_runs(self._runs[start : start + self._fan_in])
+                for start in range(0, len(self._runs), self._fan_in)
+            ]
+        self._duplicates = {}
+        key_size: int = 1 + DuplicateIndex.digest_size
+        group: list = []
+        for entry in heapq.merge(*(self.read_run(run) for run in self._runs)):
+            if group and entry[:key_size] != group[0][:key_size]:
+                self.collect(group)
+                group = []
+            group.append(entry)
+        self.collect(group)
+
+    def collect(self, group: list) -> None:
+        """
+        Collect the positions of a group of entries with the same field and digest if they are duplicates.
+
+        :param group: Packed entries with the same field and digest
+        :type group: list
+        """
+        if len(group) < 2:
+            return
+        for entry in group:
+            field, _, shard, position = self.entry.unpack(entry)
+            self._duplicates.setdefault(shard, {}).setdefault(field, set()).add(
+                position
+            )
+
+    def duplicates(self, shard: int) -> dict:
+        """
+        Get the positions of the records of a shard with duplicate texts in the corpus (see merge).
+
+        :param shard: Number of the shard
+        :type shard: int
+        :return: Sets of positions per field number
+        :rtype: dict
+        """
+        return self._duplicates.get(shard, {})
+
+    def clear(self) -> None:
+        """Remove the run files and the duplicates."""
+        for file_path in self._runs:
+            os.remove(file_path)
+        self._runs = []
+        self._run_number = 0
+        self._shards = 0
+        self._duplicates = {}
@@ -0,0 +1,183 @@
+from datetime import date
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DateChecks:
+    """
+    Plausibility checks of many normalized dates at once with NumPy.
+
+    The earliest and latest dates (see MetadataInspector.date_bounds) are kept in datetime64
+    arrays with NaT for missing dates, together with the number of the record of every date.
+    The checks are evaluated as vectorized operations over all dates and return a flag per
+    date, which can be mapped back to the records (see records).
+
+    NumPy is an optional dependency, which is installed with the extra 'numpy'.
+    """
+
+    def __init__(self, bounds, records, starts=None) -> None:
+        """
+        Construct DateChecks from the bounds of the dates and their records.
+
+        :param bounds: Tuples of earliest and latest date (None if missing)
+        :type bounds: Iterable[tuple]
+        :param records: Number of the record of every date
+        :type records: Iterable[int]
+        :param starts: First day of the latest date of every date (see MetadataInspector.date_bounds with starts), the latest dates if None
+        :type starts: Iterable[datetime.date | None] | None
+        :raises ImportError: If NumPy is not installed
+        """
+        if numpy is None:
+            raise ImportError(
+                "DateChecks requires NumPy, install it with 'pip install nfdinspector[numpy]'"
+            )
+        bounds = list(bounds)
+        self._earliest = numpy.array(
+            [earliest for earliest, _ in bounds], dtype="datetime64[D]"
+        )
+        self._latest = numpy.array(
+            [latest for _, latest in bounds], dtype="datetime64[D]"
+        )
+        self._records = numpy.fromiter(records, dtype=numpy.int64, count=len(bounds))
+        self._starts = (
+            self._latest
+            if starts is None
+            else numpy.array(list(starts), dtype="datetime64[D]")
+        )
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def earliest(self):
+        """Get the earliest dates as datetime64 array."""
+        return self._earliest
+
+    @property
+    def latest(self):
+        """Get the latest dates as datetime64 array."""
+        return self._latest
+
+    def missing(self):
+        """
+        Flag dates without earliest and latest date.
+
+        :return: Flag per date
+        :rtype: numpy.ndarray
+        """
+        return numpy.isnat(self._earliest) & numpy.isnat(self._latest)
+
+    def missing_earliest(self):
+        """
+        Flag dates without earliest date.
+
+        :return: Flag per date
+        :rtype: numpy.ndarray
+        """
+        return numpy.isnat(self._earliest)
+
+    def missing_latest(self):
+        """
+        Flag dates without latest date.
+
+        :return: Flag per date
+        :rtype: numpy.ndarray
+        """
+        return numpy.isnat(self._latest)
+
+    def future(self, today: date | None = None):
+        """
+        Flag dates in the future.
+
+        Like with EADInspector.is_future, a date is in the future if its earliest date or the
+        first day of its latest date is after today, so that dates in the current month or
+        year are not in the future.
+
+        :param today: Current day, date.today() if None
+        :type today: datetime.date | None
+        :return: Flag per date
+        :rtype: numpy.ndarray
+        """
+        day = numpy.datetime64(date.today() if today is None else today, "D")
+        return (self._earliest > day) | (self._starts > day)
+
+    def inverted(self):
+        """
+        Flag dates whose earliest date is after their latest date.
+
+        :return: Flag per date
+        :rtype: numpy.ndarray
+        """
+        return self._earliest > self._latest
+
+    def contained(self, children, parents):
+        """
+        Flag pairs of dates where a child date lies within a parent date.
+
+        Like with EADInspector.is_consistent_date, a child date without earliest and latest
+        date and missing ends of a child date are unconstrained, but a child end is not
+        within a missing parent end.
+
+        :param children: Indices of the child dates
+        :type children: numpy.ndarray
+        :param parents: Indices of the parent dates, one per child date
+        :type parents: numpy.ndarray
+        :return: Flag per pair
+        :rtype: numpy.ndarray
+        """
+        child_earliest = self._earliest[children]
+        child_latest = self._latest[children]
+        parent_earliest = self._earliest[parents]
+        parent_latest = self._latest[parents]
+        open_earliest = numpy.isnat(child_earliest)
+        open_latest = numpy.isnat(child_latest)
+        return (open_earliest & open_latest) | (
+            (
+                open_earliest
+                | (~numpy.isnat(parent_earliest) & (child_earliest >= parent_earliest))
+            )
+            & (
+                open_latest
+                | (~numpy.isnat(parent_latest) & (child_latest <= parent_latest))
+            )
+        )
+
+    def consistent(self, children, parents, groups, size: int):
+        """
+        Flag groups of pairs of dates where the child date lies within at least one of the parent dates.
+
+        :param children: Indices of the child dates
+        :type children: Sequence[int]
+        :param parents: Indices of the parent dates, one per child date
+        :type parents: Sequence[int]
+        :param groups: Group of every pair
+        :type groups: Sequence[int]
+        :param size: Number of groups
+        :type size: int
+        :return: Flag per group, False for groups without pairs
+        :rtype: numpy.ndarray
+        """
+        flags = numpy.zeros(size, dtype=bool)
+        numpy.logical_or.at(
+            flags,
+            numpy.asarray(groups, dtype=numpy.int64),
+            self.contained(
+                numpy.asarray(children, dtype=numpy.int64),
+                numpy.asarray(parents, dtype=numpy.int64),
+            ),
+        )
+        return flags
+
+    def records(self, flags) -> set:
+        """
+        Map flags of dates to their records.
+
+        :param flags: Flag per date
+        :type flags: numpy.ndarray
+        :return: Numbers of the records with at least one flagged date
+        :rtype: set
+        """
+        return set(self._records[flags].tolist())
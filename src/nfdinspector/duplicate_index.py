@@ -0,0 +1,138 @@
+import hashlib
+
+
+class DuplicateIndex:
+    """
+    Counts of texts for finding duplicates incrementally.
+
+    Every text is counted once per record it occurs in, so records can be added and removed
+    one at a time and the duplicate texts (counted at least twice) stay correct without
+    counting all records again. Empty texts are ignored like with LIDOInspector.duplicates.
+
+    Instead of the texts, their BLAKE2b digests of 16 bytes are counted in a dict. So a
+    counted text takes the same memory however long it is, and only the duplicate texts
+    themselves are kept.
+    """
+
+    __slots__ = ("_counts", "_duplicates")
+
+    digest_size: int = 16
+
+    def __init__(self, texts=()) -> None:
+        """
+        Construct DuplicateIndex and count texts.
+
+        :param texts: Texts to count
+        :type texts: Iterable[str], default ()
+        """
+        self._duplicates: set = set()
+        self.clear()
+        self.update(texts)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._duplicates
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @property
+    def duplicates(self) -> set:
+        """Get the set of duplicate texts. The set is kept up to date by add and remove."""
+        return self._duplicates
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+        """
+        Get the digest of a text.
+
+        :param text: Text
+        :type text: str
+        :return: BLAKE2b digest of the UTF-8 encoded text
+        :rtype: bytes
+        """
+        return hashlib.blake2b(
+            text.encode("utf-8"), digest_size=DuplicateIndex.digest_size
+        ).digest()
+
+    def count(self, text: str) -> int:
+        """
+        Get the count of a text.
+
+        :param text: Counted text
+        :type text: str
+        :return: Number of times the text was added and not removed
+        :rtype: int
+        """
+        return self._counts.get(self.digest(text), 0)
+
+    def add(self, text: str) -> bool:
+        """
+        Count a text.
+
+        :param text: Text to count, ignored if empty
+        :type text: str
+        :return: True if the text has become a duplicate, False if not
+        :rtype: bool
+        """
+        if text == "":
+            return False
+        digest: bytes = self.digest(text)
+        count: int = self._counts.get(digest, 0) + 1
+        self._counts[digest] = count
+        if count == 2:
+            self._duplicates.add(text)
+            return True
+        return False
+
+    def remove(self, text: str) -> bool:
+        """
+        Uncount a text.
+
+        :param text: Text to uncount, ignored if empty
+        :type text: str
+        :return: True if the text is no longer a duplicate, False if not
+        :rtype: bool
+        :raises KeyError: If the text is not counted
+        """
+        if text == "":
+            return False
+        digest: bytes = self.digest(text)
+        count: int | None = self._counts.get(digest)
+        if count is None:
+            raise KeyError(text)
+        if count > 1:
+            self._counts[digest] = count - 1
+        else:
+            del self._counts[digest]
+        if count == 2:
+            self._duplicates.discard(text)
+            return True
+        return False
+
+    def update(self, texts) -> set:
+        """
+        Count multiple texts.
+
+        :param texts: Texts to count
+        :type texts: Iterable[str]
+        :return: Texts that have become duplicates
+        :rtype: set
+        """
+        return {text for text in texts if self.add(text)}
+
+    def difference_update(self, texts) -> set:
+        """
+        Uncount multiple texts.
+
+        :param texts: Texts to uncount
+        :type texts: Iterable[str]
+        :return: Texts that are no longer duplicates
+        :rtype: set
+        :raises KeyError: If a text is not counted
+        """
+        return {text for text in texts if self.remove(text)}
+
+    def clear(self) -> None:
+        """Remove all counts."""
+        self._counts: dict = {}
+        self._duplicates.clear()
@@ -1,12 +1,37 @@
 from .metadata_inspector import MetadataInspector
+from .date_checks import DateChecks
+from .near_duplicate_index import NearDuplicateIndex
+import hashlib
 import json
-import re
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from datetime import date
+from lxml import etree
 
 
 class EADInspector(MetadataInspector):
     """Class for inspectors that examine records in EAD-XML."""
 
+    _worker_inspector = None
+    levels: tuple = ("collection", "class", "series", "file", "item", "_")
+    inspection_checks: tuple = (
+        ("id", None, "inspect_id", 1),
+        ("unitid", "unitid", "inspect_unitid", 1),
+        ("unittitle", "unittitle", "inspect_unittitle", 2),
+        ("unitdate", "unitdate", "inspect_unitdates", 3),
+        ("abstract", "abstract", "inspect_abstract", 2),
+        ("genreform", "genreform", "inspect_genreform", 2),
+        ("dimensions", "dimensions", "inspect_dimensions", 2),
+        ("extent", "extent", "inspect_extent", 2),
+        ("scopecontent", "scopecontent", "inspect_scopecontent", 2),
+        ("origination", "origination", "inspect_originations", 2),
+        ("materialspec", "materialspec", "inspect_materialspec", 2),
+        ("language", "language", "inspect_language", 2),
+        ("digital_archival_object", "digital_archival_object", "inspect_daos", 2),
+        ("index", "index", "inspect_index", 2),
+        ("userestrict", "userestrict", "inspect_userestrict", 2),
+    )
+
     def __init__(self, error_lang: str = "en") -> None:
         """
         Construct EADInspector with specific error language.
@@ -18,15 +43,20 @@ class EADInspector(MetadataInspector):
         self._ead_namespace: str = "urn:isbn:1-931666-22-9"
         self._cs: list = []
         self._rights_ead: list = []
+        self._plans: dict = {}
+        self._inspection: dict = {}
+        self._near_duplicate_unittitles: set = set()
+        self._near_duplicate_abstracts: set = set()
         self.configuration: dict = {
             "unitid": {"pattern": ""},
             "unittitle": {
-                "collection": {"inspect": True, "min_word_num": 2},
-                "class": {"inspect": True, "min_word_num": 1},
-                "series": {"inspect": True, "min_word_num": 1},
-                "file": {"inspect": True, "min_word_num": 2},
-                "item": {"inspect": True, "min_word_num": 2},
-                "_": {"inspect": True, "min_word_num": 2},
+                "collection": {"inspect": True, "min_word_num": 2, "similar": False},
+                "class": {"inspect": True, "min_word_num": 1, "similar": False},
+                "series": {"inspect": True, "min_word_num": 1, "similar": False},
+                "file": {"inspect": True, "min_word_num": 2, "similar": False},
+                "item": {"inspect": True, "min_word_num": 2, "similar": False},
+                "_": {"inspect": True, "min_word_num": 2, "similar": False},
+                "near_duplicates": {"similarity": 0.8, "bands": 20, "rows": 6},
             },
             "unitdate": {
                 "collection": {"inspect": True},
@@ -37,12 +67,13 @@ class EADInspector(MetadataInspector):
                 "_": {"inspect": True},
             },
             "abstract": {
-                "collection": {"inspect": True, "min_word_num": 10},
-                "class": {"inspect": False, "min_word_num": 10},
-                "series": {"inspect": False, "min_word_num": 10},
-                "file": {"inspect": True, "min_word_num": 10},
-                "item": {"inspect": True, "min_word_num": 10},
-                "_": {"inspect": True, "min_word_num": 10},
+                "collection": {"inspect": True, "min_word_num": 10, "similar": False},
+                "class": {"inspect": False, "min_word_num": 10, "similar": False},
+                "series": {"inspect": False, "min_word_num": 10, "similar": False},
+                "file": {"inspect": True, "min_word_num": 10, "similar": False},
+                "item": {"inspect": True, "min_word_num": 10, "similar": False},
+                "_": {"inspect": True, "min_word_num": 10, "similar": False},
+                "near_duplicates": {"similarity": 0.8, "bands": 20, "rows": 6},
             },
             "genreform": {
                 "normal": [
@@ -165,6 +196,24 @@ class EADInspector(MetadataInspector):
     def rights_ead(self, rights_ead: list) -> None:
         self._rights_ead = rights_ead
 
+    @property
+    def near_duplicate_unittitles(self) -> set:
+        """Get or set the set of near duplicate unit titles."""
+        return self._near_duplicate_unittitles
+
+    @near_duplicate_unittitles.setter
+    def near_duplicate_unittitles(self, near_duplicate_unittitles: set) -> None:
+        self._near_duplicate_unittitles = near_duplicate_unittitles
+
+    @property
+    def near_duplicate_abstracts(self) -> set:
+        """Get or set the set of near duplicate abstracts."""
+        return self._near_duplicate_abstracts
+
+    @near_duplicate_abstracts.setter
+    def near_duplicate_abstracts(self, near_duplicate_abstracts: set) -> None:
+        self._near_duplicate_abstracts = near_duplicate_abstracts
+
     @property
     def configuration(self) -> dict:
         """Get or set the configuration. The inspection is carried out based on the configuration."""
@@ -173,31 +222,41 @@ class EADInspector(MetadataInspector):
     @configuration.setter
     def configuration(self, configuration: dict) -> None:
         self._configuration = configuration
+        self.compile_configuration()
+
+    @property
+    def plans(self) -> dict:
+        """Get the enabled checks of the rule plan per level as tuples of inspection key, method and number of arguments (see compile_configuration)."""
+        return self._plans
 
-    def read_ead(self, xml_str: str) -> None:
+    def read_ead(self, xml_str) -> None:
         """
-        Parse EAD-XML from a string and assign EAD components to the inspector.
+        Parse EAD-XML from a string, bytes or a binary file and assign EAD components to the inspector.
 
-        :param xml_str: String with EAD-XML syntax
-        :type xml_str: str
+        :param xml_str: String, bytes or memoryview with EAD-XML syntax or binary file object
+        :type xml_str: str | bytes | memoryview | BinaryIO
         """
         xml_root = MetadataInspector.read_xml(xml_str)
+        self.namespace = self.detect_namespace(xml_root)
         self.cs = [comp for comp in xml_root.iter("{*}c")]
-        self.rights_ead = xml_root.find(
-            ".//{*}archdesc/{*}userestrict[@type='ead']//{*}extref"
+        self.rights_ead = self.find(
+            xml_root, ".//{*}archdesc/{*}userestrict[@type='ead']//{*}extref"
         )
 
     def read_ead_file(self, file_path: str) -> None:
         """
         Parse EAD-XML from a file and assign EAD components to the inspector.
 
-        :param file_path: File path to a EAD-XML file
+        Compressed files and archives with a single XML document are read directly.
+
+        :param file_path: File path to a EAD-XML file, compressed EAD-XML file or archive
         :type file_path: str
         """
         xml_root = MetadataInspector.read_xml_file(file_path)
+        self.namespace = self.detect_namespace(xml_root)
         self.cs = [comp for comp in xml_root.iter("{*}c")]
-        self.rights_ead = xml_root.find(
-            ".//{*}archdesc/{*}userestrict[@type='ead']//{*}extref"
+        self.rights_ead = self.find(
+            xml_root, ".//{*}archdesc/{*}userestrict[@type='ead']//{*}extref"
         )
 
     def configure(self, config: dict) -> None:
@@ -206,10 +265,45 @@ class EADInspector(MetadataInspector):
 
         :param config: Dict of configurations with the syntax of the default configurations
         :type config: dict
+        :raises ValueError: If a regular expression of the configuration is invalid
         """
         for key in self.configuration.keys():
             if key in config:
                 self.configure_level(key, config[key])
+        self.compile_configuration()
+
+    def compile_configuration(self) -> None:
+        """
+        Compile the configuration into the rule plan of the inspection.
+
+        The regular expressions are compiled and validated up front, and there is one plan
+        per level with only the checks enabled for that level, so a component is dispatched
+        once to its active checks. The checks are bound to the configuration of their setting
+        and level with the compiled regular expressions (see level_config and
+        compile_setting), which is built once per level, so the checks look up neither the
+        configuration nor whether the level is inspected. The plan is compiled again at the
+        start of every inspection, so changes made directly to the configuration are taken
+        into account.
+
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self._patterns = self.compile_patterns(self.configuration)
+        self._configuration_digest = self.configuration_digest()
+        self._plans = {}
+        for level in self.levels:
+            plan: list = []
+            for key, setting, method, number in self.inspection_checks:
+                config: dict = (
+                    {} if setting is None else self.level_config(setting, level)
+                )
+                if not config.get("inspect", True):
+                    continue
+                arguments: tuple = (
+                    () if setting is None else (self.compile_setting(config),)
+                )
+                plan.append((key, getattr(self, method), number, arguments))
+            self._plans[level] = tuple(plan)
+        self._inspection = dict.fromkeys(key for key, *_ in self.inspection_checks)
 
     def configure_level(self, setting: str, change: dict | list) -> None:
         """
@@ -238,50 +332,658 @@ class EADInspector(MetadataInspector):
         if level in ["normal"]:
             self.configuration[setting][level] = change
             return
+        if level in ["pattern"]:
+            self.configuration[setting][level] = str(change)
+            return
+        if level in ["patterns"]:
+            self.configuration[setting][level] = dict(change)
+            return
+        if level in ["near_duplicates"]:
+            self.configure_near_duplicates(setting, change)
+            return
         if isinstance(change, dict):
             for key, value in change.items():
                 if key not in self.configuration[setting][level]:
                     continue
-                if key in ["inspect", "ref"]:
+                if key in ["inspect", "ref", "similar"]:
                     self.configuration[setting][level][key] = bool(value)
                 elif key in ["min_word_num", "min_num"]:
                     self.configuration[setting][level][key] = int(value)
 
+    def configure_near_duplicates(self, setting: str, change: dict) -> None:
+        """
+        Alter the parameters for finding near duplicates of a setting, which apply to all levels.
+
+        The parameters are validated before they are stored (see NearDuplicateIndex).
+
+        :param setting: Name of the setting, 'unittitle' or 'abstract'
+        :type setting: str
+        :param change: New parameters (similarity, bands, rows)
+        :type change: dict
+        :raises ValueError: If a parameter is invalid
+        """
+        near_duplicates: dict = dict(self.configuration[setting]["near_duplicates"])
+        for key, value in dict(change).items():
+            if key in ["similarity"]:
+                near_duplicates[key] = float(value)
+            elif key in ["bands", "rows"]:
+                near_duplicates[key] = int(value)
+        NearDuplicateIndex(**near_duplicates)
+        self.configuration[setting]["near_duplicates"] = near_duplicates
+
     def config_file(self, file_path: str) -> None:
         """
         Read a configuration file and alter the default configurations of an inspector.
 
         :param file_path: File path to a JSON file with configurations in the required syntax
         :type file_path: str
+        :raises ValueError: If a regular expression of the configuration is invalid
         """
         with open(file_path, "r") as f:
             config = json.load(f)
         self.configure(config)
 
-    def inspect(self) -> None:
-        """Carry out an inspection based on the read-in EAD components."""
+    def inspect(self, workers: int | None = None) -> None:
+        """
+        Carry out an inspection based on the read-in EAD components.
+
+        The inspections are collected from iter_inspections.
+
+        :param workers: Number of worker processes, the components are inspected sequentially if None
+        :type workers: int | None
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self.inspections = list(self.iter_inspections(workers))
+
+    def iter_inspections(self, workers: int | None = None):
+        """
+        Inspect the read-in EAD components and yield every inspection.
+
+        Without workers, every inspection is yielded as soon as it is done, so it can be
+        passed on to to_json or to_csv directly. With workers, the finding aid is split into
+        independent subtrees, which are serialized and inspected in a process pool together
+        with the EAD metadata rights. The components above these subtrees are inspected
+        afterwards with the unit dates returned by the workers, so the inspections are only
+        yielded once all subtrees are done. The inspections are the same and in the same
+        order as without workers. The components must be all components of the read-in
+        finding aid in document order. The cache of the inspector is only used without
+        workers.
+
+        :param workers: Number of worker processes, the components are inspected sequentially if None
+        :type workers: int | None
+        :return: Generator of the inspections in the order of the components
+        :rtype: Iterator[dict]
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self.compile_configuration()
+        self.find_near_duplicate_texts()
+        if workers is None and self.cache is not None:
+            digests: dict = self.component_digests()
+            envelopes: dict = self.unitdate_envelopes(self.cs)
+            for c in self.cs:
+                yield self.inspect_cached_component(c, digests[c], envelopes)
+            self.cache.commit()
+            return
+        if workers is None:
+            envelopes = self.unitdate_envelopes(self.cs)
+            for c in self.cs:
+                yield self.inspect_component(c, self.enveloped_unitdates(c, envelopes))
+            return
+        spine, frontier, children = self.partition_components(workers * 4)
+        positions: dict = {c: position for position, c in enumerate(self.cs)}
+        inspections: list = [None] * len(self.cs)
+        sub_dates: dict = {}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=EADInspector.init_inspection_worker,
+            initargs=(
+                type(self),
+                self.error,
+                self.configuration,
+                (
+                    None
+                    if self.rights_ead is None
+                    else etree.tostring(self.rights_ead, with_tail=False)
+                ),
+                self.near_duplicate_unittitles,
+                self.near_duplicate_abstracts,
+                self.namespace,
+                MetadataInspector.parser_options,
+            ),
+        ) as executor:
+            results = executor.map(
+                EADInspector.inspect_serialized_subtree,
+                (etree.tostring(c, with_tail=False) for c in frontier),
+                chunksize=max(1, len(frontier) // (workers * 4)),
+            )
+            for c, (subtree_inspections, subtree_dates) in zip(frontier, results):
+                position: int = positions[c]
+                inspections[position : position + len(subtree_inspections)] = (
+                    subtree_inspections
+                )
+                sub_dates[c] = subtree_dates
+        for c in sorted(spine, key=positions.get, reverse=True):
+            sub_dates[c] = {}
+            for sub_c in children[c]:
+                unitid: str = self.text(self.find(sub_c, "{*}did/{*}unitid"))
+                if unitid:
+                    sub_dates[c][unitid] = self.normalized_unitdates(
+                        self.findall(sub_c, "{*}did/{*}unitdate")
+                    )
+                sub_dates[c].update(sub_dates[sub_c])
+            inspections[positions[c]] = self.inspect_component(c, sub_dates[c])
+        yield from inspections
+
+    def inspect_incremental(self, state_path: str) -> None:
+        """
+        Carry out an inspection of the read-in EAD components that reuses the inspections of unchanged components.
+
+        The state file stores the Merkle digest of every component (see component_digests)
+        and its inspection per ID. Only new and changed components and the components above
+        them are inspected, the stored inspections are reused for the others. Components with
+        errors in their unit dates are inspected again as well, since dates in the future
+        depend on the current day. The use restriction, which depends on the EAD metadata
+        rights of the finding aid, is inspected again for all components, so the
+        inspections are the same as with inspect. The stored inspections are discarded if the package version, the error
+        language or the configuration have changed. Components without ID are always
+        inspected. The state file is replaced with the current components afterwards.
+
+        :param state_path: File path to the JSON state file, created if missing
+        :type state_path: str
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self.compile_configuration()
+        self.find_near_duplicate_texts()
         self.inspections = []
+        stored: dict = self.load_inspection_state(state_path)
+        digests: dict = self.component_digests()
+        envelopes: dict = self.unitdate_envelopes(self.cs)
+        records: dict = {}
         for c in self.cs:
-            level: str = self.attr(c, "level")
-            if level not in ["collection", "class", "series", "file", "item"]:
-                level = "_"
-            inspection: dict = {}
-            inspection["id"] = self.inspect_id(c)
-            inspection["unitid"] = self.inspect_unitid(c)
-            inspection["unittitle"] = self.inspect_unittitle(c, level)
-            inspection["unitdate"] = self.inspect_unitdates(c, level)
-            inspection["abstract"] = self.inspect_abstract(c, level)
-            inspection["genreform"] = self.inspect_genreform(c, level)
-            inspection["dimensions"] = self.inspect_dimensions(c, level)
-            inspection["extent"] = self.inspect_extent(c, level)
-            inspection["scopecontent"] = self.inspect_scopecontent(c, level)
-            inspection["origination"] = self.inspect_originations(c, level)
-            inspection["materialspec"] = self.inspect_materialspec(c, level)
-            inspection["language"] = self.inspect_language(c, level)
-            inspection["digital_archival_object"] = self.inspect_daos(c, level)
-            inspection["index"] = self.inspect_index(c, level)
-            inspection["userestrict"] = self.inspect_userestrict(c, level)
+            c_id: str = self.attr(c, "id")
+            digest: str = digests[c].hex()
+            previous: list | None = stored.get(c_id) if c_id else None
+            if (
+                previous is not None
+                and previous[0] == digest
+                and previous[1]["unitdate"] is None
+            ):
+                inspection: dict = self.reused_inspection(c, previous[1])
+            else:
+                inspection = self.inspect_component(
+                    c, self.enveloped_unitdates(c, envelopes)
+                )
+            if c_id:
+                records[c_id] = [digest, inspection]
             self.inspections.append(inspection)
+        self.save_inspection_state(state_path, records)
+
+    def inspect_cached_component(
+        self, c, digest: bytes, envelopes: dict | None = None
+    ) -> dict:
+        """
+        Inspect a single EAD component and reuse the inspection of a component with the same subtree from the cache.
+
+        The cache key is the Merkle digest of the component (see component_digests)
+        together with the configuration, the error language and the package version (see
+        cache_key). Cached inspections with errors in the unit dates are not reused, since
+        dates in the future depend on the current day.
+
+        :param c: Component of an EAD record
+        :type c: etree._Element
+        :param digest: Merkle digest of the component
+        :type digest: bytes
+        :param envelopes: Nodes of the components (see unitdate_envelopes), the subordinate unit dates are read from c if None
+        :type envelopes: dict | None
+        :return: Inspection of the component
+        :rtype: dict
+        """
+        key: tuple = self.cache_key(digest.hex())
+        inspection: dict | None = self.cache.get(key)
+        if inspection is not None and inspection["unitdate"] is None:
+            return self.reused_inspection(c, inspection)
+        inspection = self.inspect_component(
+            c, None if envelopes is None else self.enveloped_unitdates(c, envelopes)
+        )
+        self.cache.put(key, inspection)
+        return inspection
+
+    def reused_inspection(self, c, inspection: dict) -> dict:
+        """
+        Reuse a stored inspection of a component with the same subtree.
+
+        The use restriction, which depends on the EAD metadata rights of the finding aid, and
+        the unit title and abstract, if they are checked for near duplicates, are inspected
+        again with the checks of the plan of the level, so checks that are not inspected on
+        the level are not called.
+
+        :param c: Component of an EAD record
+        :type c: etree._Element
+        :param inspection: Stored inspection of the component
+        :type inspection: dict
+        :return: Inspection of the component
+        :rtype: dict
+        """
+        level: str = self.level(c)
+        inspection = dict(inspection)
+        for key, check, _, config in self._plans[level]:
+            if key == "userestrict" or (
+                key in ("unittitle", "abstract") and config[0]["similar"]
+            ):
+                inspection[key] = check(c, level, *config)
+        return inspection
+
+    def component_digests(self) -> dict:
+        """
+        Get the Merkle digests of the read-in EAD components.
+
+        The digest of a component covers its attributes, the canonical form (see
+        record_digest) of its own elements without comments and processing instructions and
+        the digests of its subordinate components, so
+        it changes with any change in its subtree, while the digests of unchanged sibling
+        subtrees stay the same. Every component is serialized only once.
+
+        :return: BLAKE2b digests of 16 bytes per component
+        :rtype: dict
+        """
+        digests: dict = {}
+        for c in reversed(self.cs):
+            digest = hashlib.blake2b(
+                json.dumps(sorted(c.attrib.items())).encode("utf-8"), digest_size=16
+            )
+            for child in c:
+                if not isinstance(child.tag, str):
+                    continue
+                sub_digest: bytes | None = digests.get(child)
+                digest.update(
+                    etree.tostring(child, method="c14n", with_tail=False)
+                    if sub_digest is None
+                    else sub_digest
+                )
+            digests[c] = digest.digest()
+        return digests
+
+    def partition_components(self, subtrees: int) -> tuple:
+        """
+        Split the read-in components into independent subtrees for inspecting them in parallel.
+
+        Starting with the top-level components, the subtrees are replaced by the subtrees of
+        their subordinate components level by level until there are enough of them or no
+        subtree has subordinate components left. Every component above the subtrees is in
+        the spine, also along chains of single subordinate components.
+
+        :param subtrees: Minimum number of subtrees, if the finding aid is deep enough
+        :type subtrees: int
+        :return: Tuple of the components above the subtrees, the root components of the subtrees and the subordinate components per component
+        :rtype: tuple
+        """
+        children: dict = {c: [] for c in self.cs}
+        frontier: list = []
+        for c in self.cs:
+            parent = next(c.iterancestors("{*}c"), None)
+            if parent is None:
+                frontier.append(c)
+            else:
+                children[parent].append(c)
+        spine: list = []
+        while len(frontier) < subtrees:
+            next_frontier: list = []
+            next_spine: list = []
+            for c in frontier:
+                if children[c]:
+                    next_spine.append(c)
+                    next_frontier.extend(children[c])
+                else:
+                    next_frontier.append(c)
+            if not next_spine:
+                break
+            spine.extend(next_spine)
+            frontier = next_frontier
+        return spine, frontier, children
+
+    @staticmethod
+    def init_inspection_worker(
+        inspector_class,
+        error,
+        configuration: dict,
+        rights_ead: bytes | None,
+        near_duplicate_unittitles: set,
+        near_duplicate_abstracts: set,
+        namespace: str | None,
+        parser_options: dict,
+    ) -> None:
+        """
+        Set up the inspector of a worker process (see inspect).
+
+        :param inspector_class: Class of the inspector in the main process
+        :type inspector_class: type
+        :param error: Error object of the inspector in the main process
+        :type error: Error
+        :param configuration: Configuration of the inspector in the main process
+        :type configuration: dict
+        :param rights_ead: Serialized EAD metadata rights, None if there are none
+        :type rights_ead: bytes | None
+        :param near_duplicate_unittitles: Near duplicate unit titles of all components
+        :type near_duplicate_unittitles: set
+        :param near_duplicate_abstracts: Near duplicate abstracts of all components
+        :type near_duplicate_abstracts: set
+        :param namespace: Namespace of the finding aid detected in the main process
+        :type namespace: str | None
+        :param parser_options: Parser options of the main process
+        :type parser_options: dict
+        """
+        MetadataInspector.parser_options = parser_options
+        inspector = inspector_class()
+        inspector.error = error
+        inspector.configuration = configuration
+        inspector.rights_ead = (
+            None if rights_ead is None else MetadataInspector.read_xml(rights_ead)
+        )
+        inspector.near_duplicate_unittitles = near_duplicate_unittitles
+        inspector.near_duplicate_abstracts = near_duplicate_abstracts
+        inspector.namespace = namespace
+        EADInspector._worker_inspector = inspector
+
+    @staticmethod
+    def inspect_serialized_subtree(subtree: bytes) -> tuple:
+        """
+        Inspect all components of a serialized subtree in a worker process (see inspect).
+
+        :param subtree: Serialized EAD component with its subordinate components
+        :type subtree: bytes
+        :return: Tuple of the inspections in document order and the normalized unit dates of the subordinate components
+        :rtype: tuple
+        """
+        inspector = EADInspector._worker_inspector
+        c = MetadataInspector.read_xml(subtree)
+        sub_cs: list = list(c.iterdescendants("{*}c"))
+        envelopes: dict = inspector.unitdate_envelopes([c, *sub_cs])
+        sub_dates: dict = {}
+        for sub_c in sub_cs:
+            if envelopes[sub_c]["unitid"]:
+                sub_dates[envelopes[sub_c]["unitid"]] = envelopes[sub_c]["dates"]
+        inspections: list = [inspector.inspect_component(c, sub_dates)]
+        for sub_c in sub_cs:
+            inspections.append(
+                inspector.inspect_component(
+                    sub_c, inspector.enveloped_unitdates(sub_c, envelopes)
+                )
+            )
+        return inspections, sub_dates
+
+    def has_near_duplicate_checks(self) -> bool:
+        """
+        Check if unit titles or abstracts are checked for near duplicates on any level.
+
+        :return: True if near duplicates are checked, False if not
+        :rtype: bool
+        """
+        return any(
+            self.configuration[setting][level]["similar"]
+            for setting in ("unittitle", "abstract")
+            for level in self.levels
+        )
+
+    def near_duplicate_index(self, setting: str, text=None) -> NearDuplicateIndex:
+        """
+        Create an empty index for finding near duplicates with the parameters of a setting.
+
+        :param setting: Name of the setting, 'unittitle' or 'abstract'
+        :type setting: str
+        :param text: Function that gets the text of a record, the records are the texts if None
+        :type text: Callable | None, default None
+        :return: Index with the parameters for finding near duplicates of the setting
+        :rtype: NearDuplicateIndex
+        :raises ValueError: If the parameters are invalid
+        """
+        return NearDuplicateIndex(
+            **self.configuration[setting]["near_duplicates"], text=text
+        )
+
+    def find_near_duplicates(self, setting: str) -> set:
+        """
+        Find near duplicate texts of the read-in components (see NearDuplicateIndex).
+
+        Only the texts of components on levels with the check enabled are compared. The
+        index keeps the elements of the texts instead of the texts themselves.
+
+        :param setting: Name of the setting, 'unittitle' or 'abstract'
+        :type setting: str
+        :return: All near duplicate texts
+        :rtype: set
+        :raises ValueError: If the parameters are invalid
+        """
+        index: NearDuplicateIndex = self.near_duplicate_index(setting, self.text)
+        for c in self.cs:
+            if self.configuration[setting][self.level(c)]["similar"]:
+                element = self.find(c, f"{{*}}did/{{*}}{setting}")
+                index.add(self.text(element), element)
+        return index.near_duplicates
+
+    def find_near_duplicate_texts(self) -> None:
+        """Find the near duplicate unit titles and abstracts of the read-in components if the check is enabled."""
+        if not self.has_near_duplicate_checks():
+            return
+        self.near_duplicate_unittitles = self.find_near_duplicates("unittitle")
+        self.near_duplicate_abstracts = self.find_near_duplicates("abstract")
+
+    def find_stream_near_duplicates(self, file_path: str) -> None:
+        """
+        Find the near duplicate unit titles and abstracts of an EAD-XML file in streaming mode.
+
+        :param file_path: File path to a EAD-XML file, compressed EAD-XML file or archive
+        :type file_path: str
+        """
+        indexes: dict = {
+            setting: self.near_duplicate_index(setting)
+            for setting in ("unittitle", "abstract")
+        }
+        for _, source in MetadataInspector.open_xml_sources(file_path):
+            for _, element in MetadataInspector.iterparse(
+                source, ("end",), ("{*}c", "{*}unittitle", "{*}abstract")
+            ):
+                setting: str = etree.QName(element).localname
+                if setting == "c":
+                    element.clear(keep_tail=True)
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+                    continue
+                did = element.getparent()
+                c = None if did is None else did.getparent()
+                if (
+                    c is not None
+                    and etree.QName(did).localname == "did"
+                    and etree.QName(c).localname == "c"
+                    and self.configuration[setting][self.level(c)]["similar"]
+                ):
+                    indexes[setting].add(self.text(element))
+        self.near_duplicate_unittitles = indexes["unittitle"].near_duplicates
+        self.near_duplicate_abstracts = indexes["abstract"].near_duplicates
+
+    def level(self, c) -> str:
+        """
+        Get the configured level of a component.
+
+        :param c: Component of an EAD record
+        :type c: etree._Element
+        :return: Level of the component, '_' if the level is not configurable
+        :rtype: str
+        """
+        level: str = self.attr(c, "level")
+        if level not in self._plans:
+            level = "_"
+        return level
+
+    def inspect_component(self, c, sub_dates: dict | None = None) -> dict:
+        """
+        Inspect a single EAD component.
+
+        Only the enabled checks of the plan of its level are called (see
+        compile_configuration), the inspections of the other settings are None.
+
+        :param c: Component of an EAD record
+        :type c: etree._Element
+        :param sub_dates: Normalized unit dates of the subordinate components, read from c if None
+        :type sub_dates: dict | None
+        :return: Inspection of the component
+        :rtype: dict
+        """
+        level: str = self.level(c)
+        arguments: tuple = (c, level, sub_dates)
+        inspection: dict = self._inspection.copy()
+        for key, check, number, config in self._plans[level]:
+            inspection[key] = check(*arguments[:number], *config)
+        return inspection
+
+    def inspect_ead_file(self, file_path: str) -> None:
+        """
+        Carry out an inspection of an EAD-XML file in streaming mode.
+
+        Only the path of open ancestor components is kept in memory. A component is inspected
+        as soon as its own elements are read (subordinate components follow them in EAD) and
+        its unit dates are compared with the unit dates of the ancestors, which complete their
+        consistency check when they end. Finished
+        component subtrees are released, so the memory usage does not grow with the number of
+        components. The inspections are stored in document order like with inspect().
+
+        Compressed files and archives with a single XML document are read directly.
+
+        :param file_path: File path to a EAD-XML file, compressed EAD-XML file or archive
+        :type file_path: str
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self.compile_configuration()
+        self.cs = []
+        self.rights_ead = None
+        self.inspections = []
+        if self.has_near_duplicate_checks():
+            self.find_stream_near_duplicates(file_path)
+        try:
+            for document, (_, source) in enumerate(
+                MetadataInspector.open_xml_sources(file_path)
+            ):
+                if document:
+                    raise ValueError(f"more than one XML document in {file_path}")
+                self.inspect_ead_source(source)
+        finally:
+            self.namespace = None
+
+    def inspect_ead_source(self, source) -> None:
+        """
+        Carry out an inspection of an EAD-XML document in streaming mode (see inspect_ead_file).
+
+        :param source: File path to a EAD-XML file or binary stream (see open_xml_sources)
+        :type source: str | BinaryIO
+        """
+        ancestors: list = []
+        provisional: list = []
+        declared: list = []
+        for event, element in MetadataInspector.iterparse(
+            source, ("start-ns", "start", "end"), ("{*}c", "{*}extref")
+        ):
+            if event == "start-ns":
+                declared.append(element[1])
+                continue
+            if not element.tag.endswith("}c") and element.tag != "c":
+                if event == "end" and self.rights_ead is None:
+                    if self.is_rights_ead(element):
+                        self.rights_ead = deepcopy(element)
+                        if self.has_text(self.rights_ead) or self.attr(
+                            self.rights_ead, f"{{{self.xlink_namespace}}}href"
+                        ):
+                            for inspection in provisional:
+                                inspection["userestrict"] = None
+                        provisional = []
+                continue
+            if event == "start":
+                if ancestors and ancestors[-1]["inspection"] is None:
+                    self.inspect_streamed_component(ancestors, provisional, declared)
+                ancestors.append({"c": element, "inspection": None})
+                continue
+            if ancestors[-1]["inspection"] is None:
+                self.inspect_streamed_component(ancestors, provisional, declared)
+            frame: dict = ancestors.pop()
+            if frame["dates"] is not None:
+                messages: list = [
+                    message
+                    for sub_messages in frame["sub_dates"].values()
+                    for message in sub_messages
+                ]
+                if messages:
+                    frame["inspection"]["unitdate"] = (
+                        frame["inspection"]["unitdate"] or []
+                    ) + messages
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def inspect_streamed_component(
+        self, ancestors: list, provisional: list, declared: list = ()
+    ) -> None:
+        """
+        Inspect the last component of an ancestor path while streaming an EAD-XML file.
+
+        The unit dates of the component are compared with the unit dates of all ancestors
+        and inconsistencies are collected per unit ID in the ancestor frames. A repeated unit
+        ID replaces the inconsistencies in place, so the unit IDs keep the order in which
+        they were first read, like with subordinate_unitdates. The namespace
+        of the component is taken from the namespaces declared in the document so far and
+        checked in the component without its subordinate components (see
+        declared_namespace).
+
+        :param ancestors: Frames of the open components, the inspected component is the last one
+        :type ancestors: list
+        :param provisional: Inspections whose use restriction depends on the not yet read EAD metadata rights
+        :type provisional: list
+        :param declared: Namespace URIs declared in the document so far
+        :type declared: Sequence[str], default ()
+        """
+        frame: dict = ancestors[-1]
+        c = frame["c"]
+        level: str = self.level(c)
+        self.namespace = self.declared_namespace(c, declared, "c")
+        frame["inspection"] = self.inspect_component(c, {})
+        self.inspections.append(frame["inspection"])
+        if self.rights_ead is None and frame["inspection"]["userestrict"] is not None:
+            provisional.append(frame["inspection"])
+        unitdates: list = self.findall(c, "{*}did/{*}unitdate")
+        frame["dates"] = (
+            self.normalized_unitdates(unitdates)
+            if self.configuration["unitdate"][level]["inspect"] and unitdates
+            else None
+        )
+        frame["sub_dates"] = {}
+        dated_ancestors: list = [
+            ancestor for ancestor in ancestors[:-1] if ancestor["dates"] is not None
+        ]
+        unitid: str = self.text(self.find(c, "{*}did/{*}unitid"))
+        if not unitid or not dated_ancestors:
+            return
+        sub_dating: list = self.normalized_unitdates(unitdates)
+        for ancestor in dated_ancestors:
+            messages: list = self.inspect_sub_dating(
+                ancestor["dates"], unitid, sub_dating
+            )
+            ancestor["sub_dates"][unitid] = messages
+
+    def is_rights_ead(self, extref) -> bool:
+        """
+        Check if an external reference contains the EAD metadata rights of the archival description.
+
+        :param extref: XML element of an external reference
+        :type extref: etree._Element
+        :return: True if reference is part of the EAD use restriction of the archival description, False if not
+        :rtype: bool
+        """
+        for userestrict in extref.iterancestors("{*}userestrict"):
+            parent = userestrict.getparent()
+            if (
+                userestrict.get("type") == "ead"
+                and parent is not None
+                and (parent.tag.endswith("}archdesc") or parent.tag == "archdesc")
+            ):
+                return True
+        return False
 
     def inspect_id(self, c) -> str:
         """
@@ -298,25 +1000,29 @@ class EADInspector(MetadataInspector):
             else self.error.miss_info()
         )
 
-    def inspect_unitid(self, c) -> str:
+    def inspect_unitid(self, c, config: dict | None = None) -> str:
         """
         Inspect unit ID.
 
         :param c: Component of an EAD record
         :type c: etree._Element
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
         :return: Unit ID or error message if missing
         :rtype: str
         """
-        unitid = c.find("{*}did/{*}unitid")
+        unitid = self.find(c, "{*}did/{*}unitid")
         if not self.text(unitid):
             return self.error.miss_info()
-        if self.configuration["unitid"]["pattern"] and not re.fullmatch(
-            rf"{self.configuration['unitid']['pattern']}", unitid.text
-        ):
+        if config is None:
+            config = self.configuration["unitid"]
+        if not self.matches(config["pattern"], unitid.text):
             return self.error.pattern(unitid.text)
         return unitid.text
 
-    def inspect_text(self, element, config: dict) -> list | None:
+    def inspect_text(
+        self, element, config: dict, near_duplicates: set = frozenset()
+    ) -> list | None:
         """
         Inspect a text element.
 
@@ -324,6 +1030,8 @@ class EADInspector(MetadataInspector):
         :type element: etree._Element
         :param config: Configuration of the specific inspection.
         :type config: dict
+        :param near_duplicates: Near duplicate texts, only used if the configuration enables the check
+        :type near_duplicates: set, default frozenset()
         :return: List of error messages, None if there are no errors
         :rtype: list | None
         """
@@ -332,11 +1040,15 @@ class EADInspector(MetadataInspector):
         messages: list = []
         if self.has_duplicate_blanks(self.text(element)):
             messages.append(self.error.dupl_blanks())
+        if config.get("similar", False) and self.text(element) in near_duplicates:
+            messages.append(self.error.near_dupl())
         if not len(self.text(element).split()) >= config["min_word_num"]:
             messages.append(self.error.short())
         return messages if messages else None
 
-    def inspect_unittitle(self, c, level: str) -> list | None:
+    def inspect_unittitle(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect unit title.
 
@@ -344,13 +1056,19 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["unittitle"][level]["inspect"]:
-            return None
+        if config is None:
+            config = self.level_config("unittitle", level)
+            if not config["inspect"]:
+                return None
         return self.inspect_text(
-            c.find("{*}did/{*}unittitle"), self.configuration["unittitle"][level]
+            self.find(c, "{*}did/{*}unittitle"),
+            config,
+            self.near_duplicate_unittitles,
         )
 
     def subordinate_unitdates(self, c) -> dict:
@@ -363,14 +1081,155 @@ class EADInspector(MetadataInspector):
         :rtype: dict
         """
         dates: dict = {}
-        sub_cs: list = c.findall(".//{*}c")
+        sub_cs: list = self.findall(c, ".//{*}c")
         for sub_c in sub_cs:
-            unitid: str = self.text(sub_c.find("{*}did/{*}unitid"))
+            unitid: str = self.text(self.find(sub_c, "{*}did/{*}unitid"))
             if unitid:
-                unitdates: list = sub_c.findall("{*}did/{*}unitdate")
+                unitdates: list = self.findall(sub_c, "{*}did/{*}unitdate")
                 dates[unitid] = self.normalized_unitdates(unitdates)
         return dates
 
+    def unitdate_envelopes(self, cs: list) -> dict:
+        """
+        Get the normalized unit dates of components and the date envelopes of their subtrees.
+
+        The components are walked bottom-up once, so the unit dates of every component are
+        normalized only once, however deep it is nested. The envelope of a component spans
+        the earliest and the latest date of its own unit dates (if it has a unit ID) and of
+        the envelopes of its subordinate components. A subtree is ambiguous if it contains a
+        unit ID that occurs more than once in the components.
+
+        :param cs: Components in document order together with all their subordinate components
+        :type cs: list
+        :return: Dict with the unit ID, the normalized unit dates, the nodes of the subordinate components, the envelope and the ambiguity per component
+        :rtype: dict
+        """
+        nodes: dict = {}
+        counts: dict = {}
+        for c in cs:
+            unitid: str = self.text(self.find(c, "{*}did/{*}unitid"))
+            dates: list = []
+            if unitid:
+                counts[unitid] = counts.get(unitid, 0) + 1
+                dates = self.normalized_unitdates(self.findall(c, "{*}did/{*}unitdate"))
+            nodes[c] = {"unitid": unitid, "dates": dates, "children": []}
+            parent = next(c.iterancestors("{*}c"), None)
+            if parent in nodes:
+                nodes[parent]["children"].append(nodes[c])
+        for c in reversed(cs):
+            node: dict = nodes[c]
+            earliest: list = [date["earliest_date"] for date in node["dates"]]
+            latest: list = [date["latest_date"] for date in node["dates"]]
+            ambiguous: bool = counts.get(node["unitid"], 0) > 1
+            for child in node["children"]:
+                earliest.append(child["envelope"]["earliest_date"])
+                latest.append(child["envelope"]["latest_date"])
+                ambiguous = ambiguous or child["ambiguous"]
+            node["envelope"] = {
+                "earliest_date": min(
+                    (date for date in earliest if date is not None), default=None
+                ),
+                "latest_date": max(
+                    (date for date in latest if date is not None), default=None
+                ),
+            }
+            node["ambiguous"] = ambiguous
+        return nodes
+
+    def enveloped_unitdates(self, c, envelopes: dict) -> dict:
+        """
+        Get the subordinate unit dates of a component that are needed for its consistency check.
+
+        Subtrees whose envelope is consistent with the unit dates of the component are
+        skipped as a whole, since all their unit dates are consistent, unless they are
+        ambiguous (see unitdate_envelopes). So the result leads to the same messages as
+        subordinate_unitdates, but only the inconsistent unit dates are visited. No unit dates
+        are needed if the unit dates of the level are not inspected or the component has none.
+
+        :param c: Component of an EAD record
+        :type c: etree._Element
+        :param envelopes: Nodes of the components (see unitdate_envelopes)
+        :type envelopes: dict
+        :return: Dict of unit dates
+        :rtype: dict
+        """
+        sub_dates: dict = {}
+        if not self.configuration["unitdate"][self.level(c)]["inspect"]:
+            return sub_dates
+        dates: list = self.normalized_unitdates(self.findall(c, "{*}did/{*}unitdate"))
+        if not dates:
+            return sub_dates
+        stack: list = envelopes[c]["children"][::-1]
+        while stack:
+            node: dict = stack.pop()
+            if not node["ambiguous"] and self.is_consistent_date(
+                node["envelope"], dates
+            ):
+                continue
+            if node["unitid"]:
+                sub_dates[node["unitid"]] = node["dates"]
+            stack.extend(reversed(node["children"]))
+        return sub_dates
+
+    def date_checks(self, today: date | None = None) -> dict:
+        """
+        Check the unit dates of all components at once with NumPy (see DateChecks).
+
+        Unit dates are flagged as missing if they have no valid normalized date, as future
+        and as inverted if their earliest date is after their latest date. Components are
+        flagged as inconsistent if a unit date of a subordinate component with a unit ID is
+        not within any of their unit dates (see inspect_unitdates_consistency). The checks do
+        not depend on the configuration and leave the inspections unchanged.
+
+        :param today: Current day, date.today() if None
+        :type today: datetime.date | None
+        :return: Sets of the positions of the flagged components in cs per check ('missing', 'future', 'inverted' and 'inconsistent')
+        :rtype: dict
+        :raises ImportError: If NumPy is not installed
+        """
+        bounds: list = []
+        starts: list = []
+        records: list = []
+        rows: list = []
+        paths: list = []
+        positions: dict = {c: position for position, c in enumerate(self.cs)}
+        for position, c in enumerate(self.cs):
+            start: int = len(bounds)
+            for unitdate in self.findall(c, "{*}did/{*}unitdate"):
+                normal: str = self.attr(unitdate, "normal")
+                bounds.append(self.date_bounds(normal))
+                starts.append(self.date_bounds(normal, True)[1])
+                records.append(position)
+            rows.append(range(start, len(bounds)))
+            parent: int | None = positions.get(next(c.iterancestors("{*}c"), None))
+            paths.append(() if parent is None else (*paths[parent], parent))
+        children: list = []
+        parents: list = []
+        groups: list = []
+        group_records: list = []
+        for position, c in enumerate(self.cs):
+            if not self.text(self.find(c, "{*}did/{*}unitid")):
+                continue
+            for ancestor in paths[position]:
+                if not rows[ancestor]:
+                    continue
+                for child in rows[position]:
+                    for parent in rows[ancestor]:
+                        children.append(child)
+                        parents.append(parent)
+                        groups.append(len(group_records))
+                    group_records.append(ancestor)
+        checks = DateChecks(bounds, records, starts)
+        consistent = checks.consistent(children, parents, groups, len(group_records))
+        return {
+            "missing": checks.records(checks.missing()),
+            "future": checks.records(checks.future(today)),
+            "inverted": checks.records(checks.inverted()),
+            "inconsistent": {
+                group_records[group] for group in (~consistent).nonzero()[0].tolist()
+            },
+        }
+
     def normalized_unitdates(self, unitdates: list) -> list:
         """
         Normalize unit dates.
@@ -468,7 +1327,9 @@ class EADInspector(MetadataInspector):
                 )
         return messages
 
-    def inspect_unitdates_consistency(self, unitdates: list, c) -> list:
+    def inspect_unitdates_consistency(
+        self, unitdates: list, c, sub_dates: dict | None = None
+    ) -> list:
         """
         Inspect consistency of unit dates.
 
@@ -476,12 +1337,15 @@ class EADInspector(MetadataInspector):
         :type unitdates: list
         :param c: Component of an EAD record
         :type c: etree._Element
+        :param sub_dates: Normalized unit dates of the subordinate components, read from c if None
+        :type sub_dates: dict | None
         :return: List of error messages
         :rtype: list
         """
         messages: list = []
         dates: list = self.normalized_unitdates(unitdates)
-        sub_dates: dict = self.subordinate_unitdates(c)
+        if sub_dates is None:
+            sub_dates = self.subordinate_unitdates(c)
         for unitid, sub_dating in sub_dates.items():
             messages.extend(self.inspect_sub_dating(dates, unitid, sub_dating))
         return messages
@@ -501,6 +1365,11 @@ class EADInspector(MetadataInspector):
         """
         Check if a date is in the future.
 
+        A date is in the future if one of its ends starts after today. Dates with the
+        precision of a month or a year are passed with the first day of their latest date
+        (see date_range with starts), so that dates in the current month or year are not in
+        the future.
+
         :param norm_date: Normalized form of the inspected date
         :type norm_date: dict
         :return: True if date is in the future, False if not
@@ -527,9 +1396,9 @@ class EADInspector(MetadataInspector):
         """
         messages: list = []
         norm_date: dict = self.normal_date_range(date)
-        if norm_date["earliest_date"] is None or norm_date["latest_date"] is None:
+        if norm_date["earliest_date"] is None and norm_date["latest_date"] is None:
             messages.append(self.error.miss_norm_date(self.text(date)))
-        if self.is_future(norm_date):
+        if self.is_future(self.date_range(self.attr(date, "normal"), starts=True)):
             messages.append(self.error.future(f"{self.attr(date, 'normal')}"))
         return messages
 
@@ -547,7 +1416,13 @@ class EADInspector(MetadataInspector):
             messages.extend(self.inspect_date(date))
         return messages
 
-    def inspect_unitdates(self, c, level: str) -> list | None:
+    def inspect_unitdates(
+        self,
+        c,
+        level: str,
+        sub_dates: dict | None = None,
+        config: dict | None = None,
+    ) -> list | None:
         """
         Inspect unit dates.
 
@@ -555,20 +1430,26 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param sub_dates: Normalized unit dates of the subordinate components, read from c if None
+        :type sub_dates: dict | None
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["unitdate"][level]["inspect"]:
+        if config is None and not self.configuration["unitdate"][level]["inspect"]:
             return None
-        unitdates: list = c.findall("{*}did/{*}unitdate")
+        unitdates: list = self.findall(c, "{*}did/{*}unitdate")
         if not unitdates:
             return [self.error.miss_info()]
         messages: list = []
         messages.extend(self.inspect_dates(unitdates))
-        messages.extend(self.inspect_unitdates_consistency(unitdates, c))
+        messages.extend(self.inspect_unitdates_consistency(unitdates, c, sub_dates))
         return messages if messages else None
 
-    def inspect_abstract(self, c, level: str) -> list | None:
+    def inspect_abstract(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect abstract.
 
@@ -576,16 +1457,24 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["abstract"][level]["inspect"]:
-            return None
+        if config is None:
+            config = self.level_config("abstract", level)
+            if not config["inspect"]:
+                return None
         return self.inspect_text(
-            c.find("{*}did/{*}abstract"), self.configuration["abstract"][level]
+            self.find(c, "{*}did/{*}abstract"),
+            config,
+            self.near_duplicate_abstracts,
         )
 
-    def inspect_genreform(self, c, level: str) -> list | None:
+    def inspect_genreform(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect genreform.
 
@@ -593,22 +1482,28 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["genreform"][level]["inspect"]:
-            return None
-        genreform = c.find("{*}did/{*}physdesc/{*}genreform")
+        if config is None:
+            config = self.level_config("genreform", level)
+            if not config["inspect"]:
+                return None
+        genreform = self.find(c, "{*}did/{*}physdesc/{*}genreform")
         normal: str = self.attr(genreform, "normal")
         if not normal and not self.text(genreform):
             return [self.error.miss_info()]
-        if not normal or normal not in self.configuration["genreform"]["normal"]:
+        if not normal or normal not in config["normal"]:
             return [
                 self.error.miss_norm_term(normal if normal else self.text(genreform))
             ]
         return None
 
-    def inspect_dimensions(self, c, level: str) -> list | None:
+    def inspect_dimensions(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect dimensions.
 
@@ -616,16 +1511,18 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["dimensions"][level]["inspect"]:
+        if config is None and not self.configuration["dimensions"][level]["inspect"]:
             return None
-        if not self.text(c.find("{*}did/{*}physdesc/{*}dimensions")):
+        if not self.text(self.find(c, "{*}did/{*}physdesc/{*}dimensions")):
             return [self.error.miss_info()]
         return None
 
-    def inspect_extent(self, c, level: str) -> list | None:
+    def inspect_extent(self, c, level: str, config: dict | None = None) -> list | None:
         """
         Inspect extent.
 
@@ -633,16 +1530,20 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["extent"][level]["inspect"]:
+        if config is None and not self.configuration["extent"][level]["inspect"]:
             return None
-        if not self.text(c.find("{*}did/{*}physdesc/{*}extent")):
+        if not self.text(self.find(c, "{*}did/{*}physdesc/{*}extent")):
             return [self.error.miss_info()]
         return None
 
-    def inspect_scopecontent(self, c, level: str) -> list | None:
+    def inspect_scopecontent(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect scope content.
 
@@ -650,21 +1551,27 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["scopecontent"][level]["inspect"]:
-            return None
-        scopecontent_subelems = c.findall("{*}scopecontent/{*}*")
+        if config is None:
+            config = self.level_config("scopecontent", level)
+            if not config["inspect"]:
+                return None
+        scopecontent_subelems = self.findall(c, "{*}scopecontent/{*}*")
         text: str = " ".join(
             [elem.text.strip() for elem in scopecontent_subelems if self.has_text(elem)]
         )
         return self.inspect_text(
             self.create_element("scopecontent", text),
-            self.configuration["scopecontent"][level],
+            config,
         )
 
-    def inspect_origination(self, origination, level: str) -> list:
+    def inspect_origination(
+        self, origination, level: str, config: dict | None = None
+    ) -> list:
         """
         Inspect origination.
 
@@ -672,24 +1579,52 @@ class EADInspector(MetadataInspector):
         :type origination: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
+        :param config: Configuration of the level with the patterns of the setting, see level_config if None
+        :type config: dict | None
         :return: List of error messages
         :rtype: list
         """
         if not self.has_text(origination) and not self.has_subelems(origination):
             return [self.error.empty_elem(origination.tag)]
         if self.has_subelems(origination):
-            origination = origination.find("{*}name")
+            origination = self.find(origination, "{*}name")
             if not self.has_text(origination):
                 return [self.error.empty_elem(origination.tag)]
-        config = self.configuration["origination"][level].copy()
-        config["patterns"] = self.configuration["origination"]["patterns"]
+        if config is None:
+            config = self.level_config("origination", level)
         return self.inspect_entity(
             self.text(origination),
             self.attr(origination, "authfilenumber"),
             config,
         )
 
-    def inspect_originations(self, c, level: str) -> list | None:
+    def level_config(self, setting: str, level: str) -> dict:
+        """
+        Get the configuration of a level together with the options of the setting that apply to all levels.
+
+        The options of all levels are e.g. the patterns of the entity settings (origination,
+        index) and the normal terms of genreform. Settings without levels (unitid) are
+        returned as copies.
+
+        :param setting: Name of a setting
+        :type setting: str
+        :param level: Level of the inspected EAD component
+        :type level: str
+        :return: Configuration of the level
+        :rtype: dict
+        """
+        configuration: dict = self.configuration[setting]
+        config: dict = dict(configuration.get(level, {}))
+        config.update(
+            (key, value)
+            for key, value in configuration.items()
+            if key not in self.levels
+        )
+        return config
+
+    def inspect_originations(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect originations.
 
@@ -697,20 +1632,26 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["origination"][level]["inspect"]:
-            return None
-        originations = c.findall("{*}did/{*}origination")
+        if config is None:
+            config = self.level_config("origination", level)
+            if not config["inspect"]:
+                return None
+        originations = self.findall(c, "{*}did/{*}origination")
         if not originations:
             return [self.error.miss_info()]
         messages: list = []
         for origination in originations:
-            messages.extend(self.inspect_origination(origination, level))
+            messages.extend(self.inspect_origination(origination, level, config))
         return messages if messages else None
 
-    def inspect_materialspec(self, c, level: str) -> list | None:
+    def inspect_materialspec(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect materialspec.
 
@@ -718,16 +1659,20 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["materialspec"][level]["inspect"]:
+        if config is None and not self.configuration["materialspec"][level]["inspect"]:
             return None
-        if not self.text(c.find("{*}did/{*}materialspec")):
+        if not self.text(self.find(c, "{*}did/{*}materialspec")):
             return [self.error.miss_info()]
         return None
 
-    def inspect_language(self, c, level: str) -> list | None:
+    def inspect_language(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect language.
 
@@ -735,12 +1680,14 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["language"][level]["inspect"]:
+        if config is None and not self.configuration["language"][level]["inspect"]:
             return None
-        language = c.find("{*}did/{*}langmaterial/{*}language")
+        language = self.find(c, "{*}did/{*}langmaterial/{*}language")
         if not self.text(language):
             return [self.error.miss_info()]
         if not self.attr(language, "langcode"):
@@ -759,11 +1706,13 @@ class EADInspector(MetadataInspector):
         if not self.has_subelems(daogrp):
             return [self.error.empty_elem("daogrp")]
         messages: list = []
-        if not self.attr(daogrp.find("{*}daoloc"), f"{{{self.xlink_namespace}}}href"):
+        if not self.attr(
+            self.find(daogrp, "{*}daoloc"), f"{{{self.xlink_namespace}}}href"
+        ):
             messages.append(self.error.miss_link())
         return messages
 
-    def inspect_daos(self, c, level: str) -> list | None:
+    def inspect_daos(self, c, level: str, config: dict | None = None) -> list | None:
         """
         Inspect digital archival objects.
 
@@ -771,12 +1720,17 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["digital_archival_object"][level]["inspect"]:
+        if (
+            config is None
+            and not self.configuration["digital_archival_object"][level]["inspect"]
+        ):
             return None
-        daogrps = c.findall("{*}daogrp")
+        daogrps = self.findall(c, "{*}daogrp")
         if not daogrps:
             return [self.error.miss_info()]
         messages: list = []
@@ -784,7 +1738,9 @@ class EADInspector(MetadataInspector):
             messages.extend(self.inspect_daogrp(daogrp))
         return messages if messages else None
 
-    def inspect_indexentry(self, indexentry, level: str) -> list:
+    def inspect_indexentry(
+        self, indexentry, level: str, config: dict | None = None
+    ) -> list:
         """
         Inspect an index entry.
 
@@ -792,23 +1748,25 @@ class EADInspector(MetadataInspector):
         :type indexentry: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
+        :param config: Configuration of the level with the patterns of the setting, see level_config if None
+        :type config: dict | None
         :return: List of error messages
         :rtype: list
         """
         if not self.has_subelems(indexentry):
             return [self.error.empty_elem(indexentry.tag)]
-        name_subject = indexentry.find("{*}*")
+        name_subject = self.find(indexentry, "{*}*")
         if not self.has_text(name_subject):
             return [self.error.empty_elem(name_subject.tag)]
-        config = self.configuration["index"][level].copy()
-        config["patterns"] = self.configuration["index"]["patterns"]
+        if config is None:
+            config = self.level_config("index", level)
         return self.inspect_entity(
             self.text(name_subject),
             self.attr(name_subject, "authfilenumber"),
             config,
         )
 
-    def inspect_index(self, c, level: str) -> list | None:
+    def inspect_index(self, c, level: str, config: dict | None = None) -> list | None:
         """
         Inspect index.
 
@@ -816,22 +1774,28 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["index"][level]["inspect"]:
-            return None
-        indexentries: list = c.findall("{*}index/{*}indexentry")
+        if config is None:
+            config = self.level_config("index", level)
+            if not config["inspect"]:
+                return None
+        indexentries: list = self.findall(c, "{*}index/{*}indexentry")
         if not indexentries:
             return [self.error.miss_info()]
         messages: list = []
         for indexentry in indexentries:
-            messages.extend(self.inspect_indexentry(indexentry, level))
-        if len(indexentries) < self.configuration["index"][level]["min_num"]:
+            messages.extend(self.inspect_indexentry(indexentry, level, config))
+        if len(indexentries) < config["min_num"]:
             messages.append(self.error.few())
         return messages if messages else None
 
-    def inspect_userestrict(self, c, level: str) -> list | None:
+    def inspect_userestrict(
+        self, c, level: str, config: dict | None = None
+    ) -> list | None:
         """
         Inspect use restrict.
 
@@ -839,12 +1803,14 @@ class EADInspector(MetadataInspector):
         :type c: etree._Element
         :param level: Level of the inspected EAD component
         :type level: str
-        :return: List of error messages, None if there are no errors
+        :param config: Compiled configuration of the level (see compile_configuration), see level_config if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the level is not inspected
         :rtype: list | None
         """
-        if not self.configuration["userestrict"][level]["inspect"]:
+        if config is None and not self.configuration["userestrict"][level]["inspect"]:
             return None
-        extref = c.find("{*}userestrict[@type='ead']//{*}extref")
+        extref = self.find(c, "{*}userestrict[@type='ead']//{*}extref")
         if (
             not self.has_text(extref)
             and not self.has_text(self.rights_ead)
@@ -1,23 +1,142 @@
+class Message(str):
+    """Error message that keeps the key of its template, so messages can be compared by their kind."""
+
+    __slots__ = ("key",)
+
+    def __new__(cls, text: str, key: str) -> "Message":
+        """
+        Construct Message from its text and the key of its template.
+
+        :param text: Text of the message
+        :type text: str
+        :param key: Key of the template (see Error.templates)
+        :type key: str
+        """
+        message = super().__new__(cls, text)
+        message.key = key
+        return message
+
+    def __reduce__(self) -> tuple:
+        return Message, (str(self), self.key)
+
+
 class Error:
     """Class with various error messages for the metadata inspections"""
 
+    templates: dict = {
+        "en": {
+            "miss_info": "missing information",
+            "empty_elem": "empty element ({tag})",
+            "miss_label": "missing label ({id})",
+            "miss_ref": "missing reference/ID ({label})",
+            "not_uniq": "not unique",
+            "dupl_text": "duplicate text",
+            "near_dupl": "near duplicate",
+            "dist": "not distinct from {compare}",
+            "short": "too short",
+            "long": "too long",
+            "miss_mat": "missing explicit material",
+            "miss_tech": "missing explicit technique",
+            "miss_meas_type": "missing measurement type",
+            "miss_meas_unit": "missing measurement unit ({meas_type})",
+            "miss_meas_value": "missing measurement value ({meas_type})",
+            "miss_event_type": "missing event type",
+            "miss_event_info": "missing actor, place or date ({event_type})",
+            "miss_actor": "missing actor ({event_type})",
+            "miss_place": "missing place ({event_type})",
+            "future": "date in future ({date})",
+            "miss_date": "missing date ({event_type})",
+            "miss_norm_date": "missing normalized (ISO-8601) date ({text_date})",
+            "miss_earl_date": "missing earliest date ({event_type})",
+            "miss_lat_date": "missing latest date ({event_type})",
+            "miss_norm_term": "missing normalized term ({term})",
+            "few": "too few entries",
+            "miss_link": "missing link",
+            "miss_lang_code": "missing language code",
+            "miss_rights": "missing rights statement ({add})",
+            "miss_res_type": "missing resource type ({add})",
+            "pattern": "pattern does not correspond to the specification ({add})",
+            "dupl_blanks": "duplicate blanks",
+            "inconsistent_date": "inconsistent date ({id}: {inconsistency})",
+        },
+        "de": {
+            "miss_info": "Angabe fehlt",
+            "empty_elem": "leeres Element ({tag})",
+            "miss_label": "Bezeichnung fehlt ({id})",
+            "miss_ref": "Verweis/ID fehlt ({label})",
+            "not_uniq": "nicht einzigartig",
+            "dupl_text": "duplizierter Text",
+            "near_dupl": "nahezu dupliziert",
+            "dist": "kein Unterschied zu {compare}",
+            "short": "zu kurz",
+            "long": "zu lang",
+            "miss_mat": "explizites Material fehlt",
+            "miss_tech": "explizite Technik fehlt",
+            "miss_meas_type": "Messgröße fehlt",
+            "miss_meas_unit": "Maßeinheit fehlt ({meas_type})",
+            "miss_meas_value": "Messwert fehlt ({meas_type})",
+            "miss_event_type": "Eventtyp fehlt",
+            "miss_event_info": "Akteur:in, Ort oder Datierung fehlen ({event_type})",
+            "miss_actor": "Akteur:in fehlt ({event_type})",
+            "miss_place": "Ort fehlt ({event_type})",
+            "future": "Datum liegt in der Zukunft ({date})",
+            "miss_date": "Datierung fehlt ({event_type})",
+            "miss_norm_date": "normalisierte (ISO-8601) Datierung fehlt ({text_date})",
+            "miss_earl_date": "Anfangsdatum fehlt ({event_type})",
+            "miss_lat_date": "Enddatum fehlt ({event_type})",
+            "miss_norm_term": "normalisierter Begriff fehlt ({term})",
+            "few": "zu wenige Einträge",
+            "miss_link": "Link fehlt",
+            "miss_lang_code": "Sprachcode fehlt",
+            "miss_rights": "Rechteangabe fehlt ({add})",
+            "miss_res_type": "Ressourcentyp fehlt ({add})",
+            "pattern": "Muster entspricht nicht der Vorgabe ({add})",
+            "dupl_blanks": "doppelte Leerzeichen",
+            "inconsistent_date": "inkonsistente Datierung ({id}: {inconsistency})",
+        },
+    }
+
     def __init__(self, language: str) -> None:
         """
         Construct Error with specific language.
 
+        The templates of the language are looked up once, messages with arguments are
+        formatted on demand and messages without arguments are only built once.
+
         :param language: Error language for the inspections.
         :type language: str
         """
-        self._language: str = language
+        self.language = language
 
     @property
     def language(self) -> str:
-        """Get and set the language for the error messages."""
+        """Get and set the language for the error messages. Unknown languages fall back to English."""
         return self._language
 
     @language.setter
     def language(self, language) -> None:
-        self._language = language
+        self._language: str = language
+        self._templates: dict = self.templates.get(language, self.templates["en"])
+        self._messages: dict = {}
+
+    def message(self, key: str, **arguments) -> Message:
+        """
+        Get an error message from the templates of the language.
+
+        :param key: Key of the template
+        :type key: str
+        :param arguments: Values of the placeholders of the template
+        :type arguments: str
+        :return: Error message
+        :rtype: Message
+        """
+        if arguments:
+            return Message(self._templates[key].format(**arguments), key)
+        message: Message | None = self._messages.get(key)
+        if message is None:
+            message = Message(self._templates[key], key)
+            self._messages[key] = message
+        return message
 
     def miss_info(self) -> str:
         """
@@ -26,13 +145,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "missing information"
-            case "de":
-                return "Angabe fehlt"
-            case _:
-                return "missing information"
+        return self.message("miss_info")
 
     def empty_elem(self, tag: str) -> str:
         """
@@ -43,13 +156,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"empty element ({tag})"
-            case "de":
-                return f"leeres Element ({tag})"
-            case _:
-                return f"empty element ({tag})"
+        return self.message("empty_elem", tag=tag)
 
     def miss_label(self, id: str) -> str:
         """
@@ -60,13 +167,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing label ({id})"
-            case "de":
-                return f"Bezeichnung fehlt ({id})"
-            case _:
-                return f"missing label ({id})"
+        return self.message("miss_label", id=id)
 
     def miss_ref(self, label: str) -> str:
         """
@@ -77,13 +178,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing reference/ID ({label})"
-            case "de":
-                return f"Verweis/ID fehlt ({label})"
-            case _:
-                return f"missing reference/ID ({label})"
+        return self.message("miss_ref", label=label)
 
     def not_uniq(self) -> str:
         """
@@ -92,13 +187,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"not unique"
-            case "de":
-                return f"nicht einzigartig"
-            case _:
-                return f"not unique"
+        return self.message("not_uniq")
 
     def dupl_text(self) -> str:
         """
@@ -107,13 +196,16 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"duplicate text"
-            case "de":
-                return f"duplizierter Text"
-            case _:
-                return f"duplicate text"
+        return self.message("dupl_text")
+
+    def near_dupl(self) -> str:
+        """
+        Get error message for text that is similar to another text.
+
+        :return: Error message
+        :rtype: str
+        """
+        return self.message("near_dupl")
 
     def dist(self, compare: str) -> str:
         """
@@ -124,13 +216,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"not distinct from {compare}"
-            case "de":
-                return f"kein Unterschied zu {compare}"
-            case _:
-                return f"not distinct from {compare}"
+        return self.message("dist", compare=compare)
 
     def short(self) -> str:
         """
@@ -139,13 +225,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "too short"
-            case "de":
-                return "zu kurz"
-            case _:
-                return "too short"
+        return self.message("short")
 
     def long(self) -> str:
         """
@@ -154,13 +234,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "too long"
-            case "de":
-                return "zu lang"
-            case _:
-                return "too long"
+        return self.message("long")
 
     def miss_mat(self) -> str:
         """
@@ -169,13 +243,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "missing explicit material"
-            case "de":
-                return "explizites Material fehlt"
-            case _:
-                return "missing explicit material"
+        return self.message("miss_mat")
 
     def miss_tech(self) -> str:
         """
@@ -184,13 +252,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "missing explicit technique"
-            case "de":
-                return "explizite Technik fehlt"
-            case _:
-                return "missing explicit technique"
+        return self.message("miss_tech")
 
     def miss_meas_type(self) -> str:
         """
@@ -199,13 +261,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "missing measurement type"
-            case "de":
-                return "Messgröße fehlt"
-            case _:
-                return "missing measurement type"
+        return self.message("miss_meas_type")
 
     def miss_meas_unit(self, meas_type: str) -> str:
         """
@@ -216,13 +272,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing measurement unit ({meas_type})"
-            case "de":
-                return f"Maßeinheit fehlt ({meas_type})"
-            case _:
-                return f"missing measurement unit ({meas_type})"
+        return self.message("miss_meas_unit", meas_type=meas_type)
 
     def miss_meas_value(self, meas_type: str) -> str:
         """
@@ -233,13 +283,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing measurement value ({meas_type})"
-            case "de":
-                return f"Messwert fehlt ({meas_type})"
-            case _:
-                return f"missing measurement value ({meas_type})"
+        return self.message("miss_meas_value", meas_type=meas_type)
 
     def miss_event_type(self) -> str:
         """
@@ -248,13 +292,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "missing event type"
-            case "de":
-                return "Eventtyp fehlt"
-            case _:
-                return "missing event type"
+        return self.message("miss_event_type")
 
     def miss_event_info(self, event_type: str) -> str:
         """
@@ -265,13 +303,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing actor, place or date ({event_type})"
-            case "de":
-                return f"Akteur:in, Ort oder Datierung fehlen ({event_type})"
-            case _:
-                return f"missing actor, place or date ({event_type})"
+        return self.message("miss_event_info", event_type=event_type)
 
     def miss_actor(self, event_type: str) -> str:
         """
@@ -282,13 +314,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing actor ({event_type})"
-            case "de":
-                return f"Akteur:in fehlt ({event_type})"
-            case _:
-                return f"missing actor ({event_type})"
+        return self.message("miss_actor", event_type=event_type)
 
     def miss_place(self, event_type: str) -> str:
         """
@@ -299,13 +325,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing place ({event_type})"
-            case "de":
-                return f"Ort fehlt ({event_type})"
-            case _:
-                return f"missing place ({event_type})"
+        return self.message("miss_place", event_type=event_type)
 
     def future(self, date: str) -> str:
         """
@@ -316,13 +336,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"date in future ({date})"
-            case "de":
-                return f"Datum liegt in der Zukunft ({date})"
-            case _:
-                return f"date in future ({date})"
+        return self.message("future", date=date)
 
     def miss_date(self, event_type: str) -> str:
         """
@@ -333,13 +347,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing date ({event_type})"
-            case "de":
-                return f"Datierung fehlt ({event_type})"
-            case _:
-                return f"missing date ({event_type})"
+        return self.message("miss_date", event_type=event_type)
 
     def miss_norm_date(self, text_date: str) -> str:
         """
@@ -350,13 +358,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing normalized (ISO-8601) date ({text_date})"
-            case "de":
-                return f"normalisierte (ISO-8601) Datierung fehlt ({text_date})"
-            case _:
-                return f"missing normalized (ISO-8601) date ({text_date})"
+        return self.message("miss_norm_date", text_date=text_date)
 
     def miss_earl_date(self, event_type: str) -> str:
         """
@@ -367,13 +369,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing earliest date ({event_type})"
-            case "de":
-                return f"Anfangsdatum fehlt ({event_type})"
-            case _:
-                return f"missing earliest date ({event_type})"
+        return self.message("miss_earl_date", event_type=event_type)
 
     def miss_lat_date(self, event_type: str) -> str:
         """
@@ -384,13 +380,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing latest date ({event_type})"
-            case "de":
-                return f"Enddatum fehlt ({event_type})"
-            case _:
-                return f"missing latest date ({event_type})"
+        return self.message("miss_lat_date", event_type=event_type)
 
     def miss_norm_term(self, term: str) -> str:
         """
@@ -401,13 +391,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing normalized term ({term})"
-            case "de":
-                return f"normalisierter Begriff fehlt ({term})"
-            case _:
-                return f"missing normalized term ({term})"
+        return self.message("miss_norm_term", term=term)
 
     def few(self) -> str:
         """
@@ -416,13 +400,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "too few entries"
-            case "de":
-                return "zu wenige Einträge"
-            case _:
-                return "too few entries"
+        return self.message("few")
 
     def miss_link(self) -> str:
         """
@@ -431,13 +409,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "missing link"
-            case "de":
-                return "Link fehlt"
-            case _:
-                return "missing link"
+        return self.message("miss_link")
 
     def miss_lang_code(self) -> str:
         """
@@ -446,13 +418,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "missing language code"
-            case "de":
-                return "Sprachcode fehlt"
-            case _:
-                return "missing language code"
+        return self.message("miss_lang_code")
 
     def miss_rights(self, add: str) -> str:
         """
@@ -463,13 +429,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing rights statement ({add})"
-            case "de":
-                return f"Rechteangabe fehlt ({add})"
-            case _:
-                return f"missing rights statement ({add})"
+        return self.message("miss_rights", add=add)
 
     def miss_res_type(self, add: str) -> str:
         """
@@ -480,13 +440,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"missing resource type ({add})"
-            case "de":
-                return f"Ressourcentyp fehlt ({add})"
-            case _:
-                return f"missing resource type ({add})"
+        return self.message("miss_res_type", add=add)
 
     def pattern(self, add: str) -> str:
         """
@@ -497,13 +451,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"pattern does not correspond to the specification ({add})"
-            case "de":
-                return f"Muster entspricht nicht der Vorgabe ({add})"
-            case _:
-                return f"pattern does not correspond to the specification ({add})"
+        return self.message("pattern", add=add)
 
     def dupl_blanks(self) -> str:
         """
@@ -512,13 +460,7 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return "duplicate blanks"
-            case "de":
-                return "doppelte Leerzeichen"
-            case _:
-                return "duplicate blanks"
+        return self.message("dupl_blanks")
 
     def inconsistent_date(self, id: str, inconsistency: str) -> str:
         """
@@ -531,10 +473,4 @@ class Error:
         :return: Error message
         :rtype: str
         """
-        match self.language:
-            case "en":
-                return f"inconsistent date ({id}: {inconsistency})"
-            case "de":
-                return f"inkonsistente Datierung ({id}: {inconsistency})"
-            case _:
-                return f"inconsistent date ({id}: {inconsistency})"
+        return self.message("inconsistent_date", id=id, inconsistency=inconsistency)
@@ -0,0 +1,159 @@
+import json
+import sqlite3
+
+
+class InspectionCache:
+    """Persistent cache of inspections in a SQLite file, shared by inspectors and runs."""
+
+    def __init__(self, file_path: str, max_entries: int = 1000000) -> None:
+        """
+        Open or create the cache in a SQLite file.
+
+        The inspections are keyed by record digest, configuration digest, error language and
+        package version (see MetadataInspector.cache_key). When the cache grows beyond
+        max_entries, the least recently used inspections are evicted down to 90% of it.
+
+        :param file_path: File path to the SQLite file, ':memory:' for a cache in memory
+        :type file_path: str
+        :param max_entries: Maximum number of cached inspections
+        :type max_entries: int, default 1000000
+        :raises ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive: {max_entries}")
+        self._file_path: str = file_path
+        self._max_entries: int = max_entries
+        self._connection = sqlite3.connect(file_path)
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS inspections ("
+            "record_digest TEXT NOT NULL, configuration TEXT NOT NULL, "
+            "error_lang TEXT NOT NULL, version TEXT NOT NULL, "
+            "inspection TEXT NOT NULL, used INTEGER NOT NULL, "
+            "PRIMARY KEY (record_digest, configuration, error_lang, version)"
+            ") WITHOUT ROWID"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS inspections_used ON inspections (used)"
+        )
+        self._entries: int
+        self._clock: int
+        self._entries, self._clock = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(MAX(used), 0) FROM inspections"
+        ).fetchone()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    @property
+    def file_path(self) -> str:
+        """Get the file path to the SQLite file."""
+        return self._file_path
+
+    @property
+    def max_entries(self) -> int:
+        """Get the maximum number of cached inspections."""
+        return self._max_entries
+
+    @property
+    def stats(self) -> dict:
+        """Get the number of hits, misses and evictions since opening or reset_stats, and the number of cached inspections."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "entries": self._entries,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the numbers of hits, misses and evictions."""
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key: tuple) -> dict | None:
+        """
+        Get a cached inspection and mark it as recently used.
+
+        :param key: Record digest, configuration digest, error language and package version
+        :type key: tuple
+        :return: Inspection, None if it is not cached
+        :rtype: dict | None
+        """
+        row = self._connection.execute(
+            "SELECT inspection FROM inspections WHERE record_digest = ? "
+            "AND configuration = ? AND error_lang = ? AND version = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._clock += 1
+        self._connection.execute(
+            "UPDATE inspections SET used = ? WHERE record_digest = ? "
+            "AND configuration = ? AND error_lang = ? AND version = ?",
+            (self._clock, *key),
+        )
+        return json.loads(row[0])
+
+    def put(self, key: tuple, inspection: dict) -> None:
+        """
+        Cache an inspection and evict the least recently used inspections if the cache is full.
+
+        :param key: Record digest, configuration digest, error language and package version
+        :type key: tuple
+        :param inspection: Inspection of the record
+        :type inspection: dict
+        """
+        self._clock += 1
+        values: tuple = (json.dumps(inspection, ensure_ascii=False), self._clock, *key)
+        cursor = self._connection.execute(
+            "UPDATE inspections SET inspection = ?, used = ? WHERE record_digest = ? "
+            "AND configuration = ? AND error_lang = ? AND version = ?",
+            values,
+        )
+        if cursor.rowcount:
+            return
+        self._connection.execute(
+            "INSERT INTO inspections (inspection, used, record_digest, configuration, "
+            "error_lang, version) VALUES (?, ?, ?, ?, ?, ?)",
+            values,
+        )
+        self._entries += 1
+        if self._entries > self.max_entries:
+            self.evict(self._entries - self.max_entries * 9 // 10)
+
+    def evict(self, number: int) -> None:
+        """
+        Evict the least recently used inspections.
+
+        :param number: Number of inspections to evict
+        :type number: int
+        """
+        cursor = self._connection.execute(
+            "DELETE FROM inspections WHERE used IN "
+            "(SELECT used FROM inspections ORDER BY used LIMIT ?)",
+            (number,),
+        )
+        self._entries -= cursor.rowcount
+        self._evictions += cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all cached inspections."""
+        self._connection.execute("DELETE FROM inspections")
+        self._connection.commit()
+        self._entries = 0
+
+    def commit(self) -> None:
+        """Write the cached inspections to the SQLite file."""
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Write the cached inspections to the SQLite file and close it."""
+        self._connection.commit()
+        self._connection.close()
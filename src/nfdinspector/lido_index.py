@@ -0,0 +1,246 @@
+import os
+import re
+import json
+import mmap
+from xml.sax.saxutils import unescape
+from .metadata_inspector import MetadataInspector
+
+
+class LIDOIndex:
+    """Index of the byte offsets of the LIDO records in a LIDO-XML file for random access by lidoRecID."""
+
+    version: int = 1
+    record_start = re.compile(rb"<(?:[\w.-]+:)?lido(?=[\s/>])")
+    record_end = re.compile(rb"</(?:[\w.-]+:)?lido\s*>")
+    rec_id = re.compile(rb"<(?:[\w.-]+:)?lidoRecID(?:\s[^>]*)?>([^<]*)<")
+
+    def __init__(self, file_path: str, index_path: str | None = None) -> None:
+        """
+        Construct LIDOIndex for a LIDO-XML file.
+
+        :param file_path: File path to an uncompressed LIDO-XML file
+        :type file_path: str
+        :param index_path: File path to the sidecar file of the index, file_path with '.index.json' appended if None
+        :type index_path: str | None
+        """
+        self._file_path: str = file_path
+        self._index_path: str = (
+            f"{file_path}.index.json" if index_path is None else index_path
+        )
+        self._head: tuple = (0, 0)
+        self._tail: tuple = (0, 0)
+        self._records: list = []
+        self._rec_ids: dict = {}
+
+    @property
+    def file_path(self) -> str:
+        """Get the file path to the indexed LIDO-XML file."""
+        return self._file_path
+
+    @property
+    def index_path(self) -> str:
+        """Get the file path to the sidecar file of the index."""
+        return self._index_path
+
+    @property
+    def records(self) -> list:
+        """Get the indexed records as tuples of lidoRecID, byte offset and length in document order."""
+        return self._records
+
+    @property
+    def rec_ids(self) -> dict:
+        """Get the byte offsets and lengths of the records per lidoRecID. Duplicate IDs have several entries."""
+        return self._rec_ids
+
+    @classmethod
+    def open(cls, file_path: str, index_path: str | None = None):
+        """
+        Load the index of a LIDO-XML file from its sidecar file.
+
+        The index is built and saved if the sidecar file is missing or outdated.
+
+        :param file_path: File path to an uncompressed LIDO-XML file
+        :type file_path: str
+        :param index_path: File path to the sidecar file of the index, file_path with '.index.json' appended if None
+        :type index_path: str | None
+        :return: Index of the LIDO-XML file
+        :rtype: LIDOIndex
+        """
+        index = cls(file_path, index_path)
+        try:
+            index.load()
+        except (OSError, ValueError, KeyError):
+            index.build()
+            index.save()
+        return index
+
+    def build(self) -> None:
+        """
+        Scan the LIDO-XML file once and index the byte offset and length of every LIDO record.
+
+        The file is scanned for the start and end tags of the records without parsing it, so
+        records in comments or CDATA sections are indexed as well. Records without lidoRecID
+        are not indexed.
+        """
+        if self.file_path.lower().endswith(
+            (".gz", ".bz2", ".xz", ".zip", ".tar", ".tgz")
+        ):
+            raise ValueError(f"compressed files cannot be indexed: {self.file_path}")
+        self._records = []
+        size: int = os.path.getsize(self.file_path)
+        if size == 0:
+            self._head = self._tail = (0, 0)
+            self._rec_ids = {}
+            return
+        with (
+            open(self.file_path, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            first: int | None = None
+            last: int = 0
+            position: int = 0
+            while start := self.record_start.search(data, position):
+                end = self.record_end.search(data, start.end())
+                if end is None:
+                    raise ValueError(
+                        f"unterminated LIDO record at byte {start.start()} in {self.file_path}"
+                    )
+                if first is None:
+                    first = start.start()
+                last = position = end.end()
+                rec_id = self.rec_id.search(data, start.end(), end.start())
+                if rec_id is not None:
+                    self._records.append(
+                        (
+                            unescape(rec_id.group(1).decode("utf-8")).strip(),
+                            start.start(),
+                            end.end() - start.start(),
+                        )
+                    )
+        first = size if first is None else first
+        self._head = (0, first)
+        self._tail = (last or first, size - (last or first))
+        self._rec_ids = self.group_rec_ids(self._records)
+
+    @staticmethod
+    def group_rec_ids(records: list) -> dict:
+        """
+        Group the byte offsets and lengths of the records by lidoRecID.
+
+        :param records: Tuples of lidoRecID, byte offset and length
+        :type records: list
+        :return: Lists of tuples of byte offset and length per lidoRecID
+        :rtype: dict
+        """
+        rec_ids: dict = {}
+        for rec_id, offset, length in records:
+            rec_ids.setdefault(rec_id, []).append((offset, length))
+        return rec_ids
+
+    def stat(self) -> dict:
+        """
+        Get the size and modification time of the LIDO-XML file to detect outdated indexes.
+
+        :return: Size and modification time in nanoseconds
+        :rtype: dict
+        """
+        stat = os.stat(self.file_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def save(self, index_path: str | None = None) -> None:
+        """
+        Save the index to a sidecar file.
+
+        :param index_path: File path to the sidecar file, index_path of the index if None
+        :type index_path: str | None
+        """
+        with open(index_path or self.index_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": self.version,
+                    **self.stat(),
+                    "head": self._head,
+                    "tail": self._tail,
+                    "records": self._records,
+                },
+                file,
+                ensure_ascii=False,
+            )
+
+    def load(self, index_path: str | None = None) -> None:
+        """
+        Load the index from a sidecar file.
+
+        :param index_path: File path to the sidecar file, index_path of the index if None
+        :type index_path: str | None
+        :raises ValueError: If the index does not match the current LIDO-XML file
+        """
+        with open(index_path or self.index_path, encoding="utf-8") as file:
+            index: dict = json.load(file)
+        if (
+            index["version"] != self.version
+            or {
+                "size": index["size"],
+                "mtime_ns": index["mtime_ns"],
+            }
+            != self.stat()
+        ):
+            raise ValueError(f"outdated index for {self.file_path}")
+        self._head = tuple(index["head"])
+        self._tail = tuple(index["tail"])
+        self._records = [tuple(record) for record in index["records"]]
+        self._rec_ids = self.group_rec_ids(self._records)
+
+    def read_records(self, rec_ids) -> list:
+        """
+        Read the records with specific lidoRecIDs as standalone LIDO-XML documents.
+
+        Only the requested byte ranges are read. Every record is wrapped in the XML
+        declaration and root element of the file, so namespace declarations are kept.
+
+        :param rec_ids: lidoRecIDs of the records
+        :type rec_ids: Iterable[str]
+        :return: Serialized LIDO-XML documents in document order, one for each record
+        :rtype: list
+        :raises KeyError: If a lidoRecID is not indexed
+        """
+        ranges: list = sorted(
+            {byte_range for rec_id in rec_ids for byte_range in self.rec_ids[rec_id]}
+        )
+        documents: list = []
+        with open(self.file_path, "rb") as file:
+            head: bytes = self.read_range(file, self._head)
+            tail: bytes = self.read_range(file, self._tail)
+            for byte_range in ranges:
+                documents.append(head + self.read_range(file, byte_range) + tail)
+        return documents
+
+    @staticmethod
+    def read_range(file, byte_range: tuple) -> bytes:
+        """
+        Read a byte range from a file.
+
+        :param file: Binary file object
+        :type file: BinaryIO
+        :param byte_range: Byte offset and length
+        :type byte_range: tuple
+        :return: Bytes of the range
+        :rtype: bytes
+        """
+        file.seek(byte_range[0])
+        return file.read(byte_range[1])
+
+    def read_lido_objects(self, rec_ids) -> list:
+        """
+        Parse the records with specific lidoRecIDs.
+
+        :param rec_ids: lidoRecIDs of the records
+        :type rec_ids: Iterable[str]
+        :return: LIDO records in document order
+        :rtype: list
+        :raises KeyError: If a lidoRecID is not indexed
+        """
+        return [
+            next(MetadataInspector.read_xml(document).iter("{*}lido"))
+            for document in self.read_records(rec_ids)
+        ]
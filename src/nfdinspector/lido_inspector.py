@@ -1,11 +1,42 @@
 from .metadata_inspector import MetadataInspector
+from .corpus_duplicates import CorpusDuplicates
+from .date_checks import DateChecks
+from .duplicate_index import DuplicateIndex
+from .lido_index import LIDOIndex
+from .near_duplicate_index import NearDuplicateIndex
+from .lido_record import LIDORecord
+from .record_list import RecordList
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from lxml import etree
 import json
-import re
 
 
 class LIDOInspector(MetadataInspector):
     """Class for inspectors that examine records in LIDO-XML."""
 
+    _worker_inspector = None
+    inspection_checks: tuple = (
+        ("lidoRecID", None, "inspect_lido_rec_id"),
+        ("workID", "work_id", "inspect_work_id"),
+        ("title", "title", "inspect_title"),
+        ("category", "category", "inspect_category"),
+        ("objectWorkType", "object_work_type", "inspect_object_work_types"),
+        ("classification", "classification", "inspect_classifications"),
+        ("objectDescription", "object_description", "inspect_object_description"),
+        ("materialsTech", "materials_tech", "inspect_materials_tech"),
+        ("objectMeasurements", "object_measurements", "inspect_object_measurements"),
+        ("event", "event", "inspect_events"),
+        ("subjectConcept", "subject_concept", "inspect_subject_concepts"),
+        ("resourceSet", "resource", "inspect_resource_sets"),
+        ("recordType", "record_type", "inspect_record_type"),
+        ("repositoryName", "repository_name", "inspect_repository_name"),
+        ("recordSource", "record_source", "inspect_record_sources"),
+        ("recordRights", "record_rights", "inspect_record_rights"),
+        ("recordInfoSet", "record_info", "inspect_record_info_set"),
+    )
+    corpus_checks: frozenset = frozenset(("title", "objectDescription"))
+
     def __init__(self, error_lang: str = "en") -> None:
         """
         Construct LIDOInspector with specific error language.
@@ -15,12 +46,17 @@ class LIDOInspector(MetadataInspector):
         """
         super().__init__(error_lang)
         self._lido_namespace: str = "http://www.lido-schema.org"
-        self._lido_objects: list = []
+        self._lido_objects: RecordList = RecordList()
+        self._document_namespaces: dict = {}
         self._configuration: dict = {
             "work_id": {"pattern": ""},
             "title": {
                 "inspect": True,
                 "unique": True,
+                "similar": False,
+                "similarity": 0.8,
+                "bands": 20,
+                "rows": 6,
                 "distinct_from_type": True,
                 "min_word_num": 2,
                 "max_word_num": 20,
@@ -43,6 +79,10 @@ class LIDOInspector(MetadataInspector):
             "object_description": {
                 "inspect": True,
                 "unique": True,
+                "similar": False,
+                "similarity": 0.8,
+                "bands": 20,
+                "rows": 6,
                 "min_word_num": 20,
                 "max_word_num": 500,
             },
@@ -78,7 +118,28 @@ class LIDOInspector(MetadataInspector):
             "record_info": {"inspect": True},
         }
         self._duplicate_titles: set = set()
+        self._title_tags: frozenset = frozenset(
+            (f"{{{self._lido_namespace}}}titleSet", "titleSet")
+        )
+        self._description_tags: frozenset = frozenset(
+            (f"{{{self._lido_namespace}}}objectDescriptionSet", "objectDescriptionSet")
+        )
         self._duplicate_descriptions: set = set()
+        self._near_duplicate_titles: set = set()
+        self._near_duplicate_descriptions: set = set()
+        self._title_xpath: str = (
+            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}titleWrap/{*}titleSet/{*}appellationValue"
+        )
+        self._description_xpath: str = (
+            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}objectDescriptionWrap/{*}objectDescriptionSet/{*}descriptiveNoteValue"
+        )
+        self._title_index: DuplicateIndex | None = None
+        self._description_index: DuplicateIndex | None = None
+        self._indexed_version: int = 0
+        self._checks: tuple = ()
+        self._corpus_checks: tuple = ()
+        self._inspection: dict = {}
+        self.compile_configuration()
 
     @property
     def lido_namespace(self) -> str:
@@ -87,12 +148,63 @@ class LIDOInspector(MetadataInspector):
 
     @property
     def lido_objects(self) -> list:
-        """Get or set the list of LIDO records. These records are examined during the inspection."""
+        """Get or set the list of LIDO records. These records are examined during the inspection. Use add_lido_objects and remove_lido_objects to change the records incrementally. An assigned list is copied to a RecordList, which counts its changes."""
         return self._lido_objects
 
     @lido_objects.setter
     def lido_objects(self, lido_objects: list) -> None:
-        self._lido_objects = lido_objects
+        self._lido_objects = RecordList(lido_objects)
+        self._indexed_version = self._lido_objects.version
+        self._document_namespaces = {}
+        self._title_index = None
+        self._description_index = None
+
+    @property
+    def title_index(self) -> DuplicateIndex:
+        """Get the counts of the titles of lido_objects. The index is built on first use and kept up to date by add_lido_objects and remove_lido_objects (see discard_outdated_indexes)."""
+        self.discard_outdated_indexes()
+        if self._title_index is None:
+            self._title_index = DuplicateIndex(
+                self.text(lido_object.find(self.title_xpath))
+                for lido_object in self.lido_objects
+            )
+        return self._title_index
+
+    @property
+    def description_index(self) -> DuplicateIndex:
+        """Get the counts of the descriptions of lido_objects. The index is built on first use and kept up to date by add_lido_objects and remove_lido_objects (see discard_outdated_indexes)."""
+        self.discard_outdated_indexes()
+        if self._description_index is None:
+            self._description_index = DuplicateIndex(
+                self.text(lido_object.find(self.description_xpath))
+                for lido_object in self.lido_objects
+            )
+        return self._description_index
+
+    def discard_outdated_indexes(self) -> None:
+        """
+        Discard the title and description indexes if lido_objects has been changed in place.
+
+        The indexes count the records of lido_objects as they were when the indexes were
+        built or last updated by add_lido_objects and remove_lido_objects. If records have
+        been appended, removed or replaced directly in the list since then, the indexes are
+        built again on next use, so the duplicates are never stale. The changes are found by
+        the version of the list (see RecordList), so the records are not compared.
+        """
+        if self._lido_objects.version != self._indexed_version:
+            self._title_index = None
+            self._description_index = None
+            self._indexed_version = self._lido_objects.version
+
+    @property
+    def title_xpath(self) -> str:
+        """Get the XPATH expression of the title values used for finding duplicates."""
+        return self._title_xpath
+
+    @property
+    def description_xpath(self) -> str:
+        """Get the XPATH expression of the description values used for finding duplicates."""
+        return self._description_xpath
 
     @property
     def configuration(self) -> dict:
@@ -102,6 +214,12 @@ class LIDOInspector(MetadataInspector):
     @configuration.setter
     def configuration(self, configuration: dict) -> None:
         self._configuration = configuration
+        self.compile_configuration()
+
+    @property
+    def checks(self) -> tuple:
+        """Get the enabled checks of the rule plan as tuples of inspection key and method (see compile_configuration)."""
+        return self._checks
 
     @property
     def duplicate_titles(self) -> set:
@@ -121,12 +239,30 @@ class LIDOInspector(MetadataInspector):
     def duplicate_descriptions(self, duplicate_descriptions: set) -> None:
         self._duplicate_descriptions = duplicate_descriptions
 
-    def read_lido(self, xml_str: str) -> None:
+    @property
+    def near_duplicate_titles(self) -> set:
+        """Get or set the set of near duplicate titles."""
+        return self._near_duplicate_titles
+
+    @near_duplicate_titles.setter
+    def near_duplicate_titles(self, near_duplicate_titles: set) -> None:
+        self._near_duplicate_titles = near_duplicate_titles
+
+    @property
+    def near_duplicate_descriptions(self) -> set:
+        """Get or set the set of near duplicate descriptions."""
+        return self._near_duplicate_descriptions
+
+    @near_duplicate_descriptions.setter
+    def near_duplicate_descriptions(self, near_duplicate_descriptions: set) -> None:
+        self._near_duplicate_descriptions = near_duplicate_descriptions
+
+    def read_lido(self, xml_str) -> None:
         """
-        Parse LIDO-XML from a string and assign LIDO records to the inspector.
+        Parse LIDO-XML from a string, bytes or a binary file and assign LIDO records to the inspector.
 
-        :param xml_str: String with LIDO-XML syntax
-        :type xml_str: str
+        :param xml_str: String, bytes or memoryview with LIDO-XML syntax or binary file object
+        :type xml_str: str | bytes | memoryview | BinaryIO
         """
         xml_root = MetadataInspector.read_xml(xml_str)
         self.lido_objects = [obj for obj in xml_root.iter("{*}lido")]
@@ -135,21 +271,77 @@ class LIDOInspector(MetadataInspector):
         """
         Parse LIDO-XML from a file and assign LIDO records to the inspector.
 
-        :param file_path: File path to a LIDO-XML file
+        Compressed files (.gz, .bz2, .xz) and archives (.zip, .tar, .tar.gz etc.) are read
+        directly. The records of all XML documents in an archive are assigned.
+
+        :param file_path: File path to a LIDO-XML file, compressed LIDO-XML file or archive
         :type file_path: str
         """
-        xml_root = MetadataInspector.read_xml_file(file_path)
-        self.lido_objects = [obj for obj in xml_root.iter("{*}lido")]
+        self.lido_objects = [
+            obj
+            for xml_root in MetadataInspector.iter_xml_documents(file_path)
+            for obj in xml_root.iter("{*}lido")
+        ]
+
+    def read_lido_records(
+        self, file_path: str, rec_ids, index_path: str | None = None
+    ) -> None:
+        """
+        Read LIDO records with specific lidoRecIDs from a large LIDO-XML file and assign them to the inspector.
+
+        The byte offsets of the records are taken from the sidecar index of the file (see
+        LIDOIndex), which is built on first use, so only the requested records are read and
+        parsed. Uniqueness is only checked among the assigned records when inspecting.
+
+        :param file_path: File path to an uncompressed LIDO-XML file
+        :type file_path: str
+        :param rec_ids: lidoRecIDs of the records
+        :type rec_ids: Iterable[str]
+        :param index_path: File path to the sidecar file of the index, file_path with '.index.json' appended if None
+        :type index_path: str | None
+        :raises KeyError: If a lidoRecID is not in the file
+        """
+        self.lido_objects = LIDOIndex.open(file_path, index_path).read_lido_objects(
+            rec_ids
+        )
 
-    def read_lido_files(self, files_path: str) -> None:
+    def read_lido_files(
+        self,
+        files_path: str,
+        workers: int | None = None,
+        include: tuple | None = None,
+        exclude: tuple = (),
+        recursive: bool = False,
+    ) -> None:
         """
         Parse LIDO-XML from multiple files in a folder and assign LIDO records to the inspector.
 
+        Files that cannot be read are skipped and listed in read_errors.
+
         :param files_path: Path to a folder with LIDO-XML files
         :type file_path: str
-        """
-        xml_roots: list = MetadataInspector.read_xml_files(files_path)
-        self.lido_objects = [obj for root in xml_roots for obj in root.iter("{*}lido")]
+        :param workers: Number of worker processes for parsing, the files are parsed sequentially if None
+        :type workers: int | None
+        :param include: Glob patterns of the files to read, XML files and supported compressed files and archives if None
+        :type include: tuple | None
+        :param exclude: Glob patterns of files and folders to skip
+        :type exclude: tuple, default ()
+        :param recursive: Descend into subfolders
+        :type recursive: bool, default False
+        """
+        self.read_errors = []
+        namespaces: dict = {}
+        self.lido_objects = MetadataInspector.read_xml_files(
+            files_path,
+            workers,
+            "{*}lido",
+            self.read_errors,
+            include,
+            exclude,
+            recursive,
+            namespaces,
+        )
+        self._document_namespaces = namespaces
 
     def configure(self, config: dict) -> None:
         """
@@ -157,10 +349,50 @@ class LIDOInspector(MetadataInspector):
 
         :param config: Dict of configurations with the syntax of the default configurations
         :type config: dict
+        :raises ValueError: If a regular expression of the configuration is invalid
         """
         for key in self.configuration.keys():
             if key in config:
                 self.configure_setting(key, config[key])
+        self.compile_configuration()
+
+    def compile_configuration(self) -> None:
+        """
+        Compile the configuration into the rule plan of the inspection.
+
+        The regular expressions are compiled and validated up front, and the checks of
+        settings that are not inspected are left out of the plan, so only the enabled checks
+        are called per record. Every check is bound to the compiled configuration of its
+        setting (see compile_setting), which is passed to the check, so the checks look up
+        neither the configuration nor whether the setting is inspected. The plan is compiled again at the start of every
+        inspection, so changes made directly to the configuration are taken into account.
+
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self._patterns = self.compile_patterns(self.configuration)
+        self._configuration_digest = self.configuration_digest()
+        self._checks = tuple(
+            (key, getattr(self, method), self.check_arguments(setting))
+            for key, setting, method in self.inspection_checks
+            if setting is None or self.configuration[setting].get("inspect", True)
+        )
+        self._corpus_checks = tuple(
+            check for check in self._checks if check[0] in self.corpus_checks
+        )
+        self._inspection = dict.fromkeys(key for key, _, _ in self.inspection_checks)
+
+    def check_arguments(self, setting: str | None) -> tuple:
+        """
+        Get the arguments of a check of the rule plan besides the record.
+
+        :param setting: Setting of the check, None if the check has no setting
+        :type setting: str | None
+        :return: Compiled configuration of the setting, empty if the check has no setting
+        :rtype: tuple
+        """
+        if setting is None:
+            return ()
+        return (self.compile_setting(self.configuration[setting]),)
 
     def configure_setting(self, setting: str, change: dict) -> None:
         """
@@ -177,13 +409,16 @@ class LIDOInspector(MetadataInspector):
             if key in [
                 "inspect",
                 "unique",
+                "similar",
                 "distinct_from_type",
                 "ref",
                 "differentiated",
             ]:
                 self.configuration[setting][key] = bool(value)
-            elif key in ["min_word_num", "max_word_num", "min_num"]:
+            elif key in ["min_word_num", "max_word_num", "min_num", "bands", "rows"]:
                 self.configuration[setting][key] = int(value)
+            elif key in ["similarity"]:
+                self.configuration[setting][key] = float(value)
             elif key in ["pattern"]:
                 self.configuration[setting][key] = str(value)
             elif key in ["patterns"]:
@@ -195,42 +430,475 @@ class LIDOInspector(MetadataInspector):
 
         :param file_path: File path to a JSON file with configurations in the required syntax
         :type file_path: str
+        :raises ValueError: If a regular expression of the configuration is invalid
         """
         with open(file_path, "r") as f:
             config = json.load(f)
         self.configure(config)
 
-    def inspect(self) -> None:
-        """Carry out an inspection based on the read-in LIDO records."""
+    def inspect(self, workers: int | None = None) -> None:
+        """
+        Carry out an inspection based on the read-in LIDO records.
+
+        The inspections are collected from iter_inspections.
+
+        :param workers: Number of worker processes, the records are inspected sequentially if None
+        :type workers: int | None
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self.inspections = list(self.iter_inspections(workers))
+
+    def iter_inspections(self, workers: int | None = None):
+        """
+        Inspect the read-in LIDO records and yield every inspection as soon as it is done.
+
+        The inspections can be passed on to to_json or to_csv directly, so they are neither
+        collected in inspections nor kept in memory. With workers, the records are serialized
+        and inspected in a process pool, and only a few chunks of records are in flight at a
+        time. Duplicate titles and descriptions are still found over all records beforehand
+        and passed on to the workers, so the inspections are the same and in the same order
+        as without workers. The cache of the inspector is only used without workers.
+
+        :param workers: Number of worker processes, the records are inspected sequentially if None
+        :type workers: int | None
+        :return: Generator of the inspections in the order of the records
+        :rtype: Iterator[dict]
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self.compile_configuration()
+        self.find_corpus_duplicates()
+        if workers is None:
+            for lido_object in self.lido_objects:
+                yield self.inspect_lido_object(lido_object)
+            if self.cache is not None:
+                self.cache.commit()
+            return
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=LIDOInspector.init_inspection_worker,
+            initargs=(
+                type(self),
+                self.error,
+                self.configuration,
+                self.duplicate_titles,
+                self.duplicate_descriptions,
+                self.near_duplicate_titles,
+                self.near_duplicate_descriptions,
+                MetadataInspector.parser_options,
+            ),
+        ) as executor:
+            yield from MetadataInspector.map_ordered(
+                executor,
+                LIDOInspector.inspect_serialized_lido_object,
+                (
+                    (
+                        etree.tostring(lido_object, with_tail=False),
+                        self.document_namespace(lido_object),
+                    )
+                    for lido_object in self.lido_objects
+                ),
+                max(1, len(self.lido_objects) // (workers * 4)),
+                workers * 2,
+            )
+
+    def inspect_incremental(self, state_path: str) -> None:
+        """
+        Carry out an inspection of the read-in LIDO records that reuses the inspections of unchanged records.
+
+        The state file stores the digest of the canonical form of every record (see
+        record_digest) and its inspection per lidoRecID. Only new and changed records are
+        inspected, the stored inspections are reused for the others. The checks that depend
+        on the whole corpus (the uniqueness of titles and descriptions) are carried out
+        again for all records, so the inspections are the same as with inspect. The stored
+        inspections are discarded if the package version, the error language or the
+        configuration have changed. Records without lidoRecID are always inspected. The
+        state file is replaced with the current records afterwards.
+
+        :param state_path: File path to the JSON state file, created if missing
+        :type state_path: str
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self.compile_configuration()
         self.inspections = []
-        if self.configuration["title"]["unique"]:
-            self.duplicate_titles = self.find_duplicate_titles()
-        if self.configuration["object_description"]["unique"]:
-            self.duplicate_descriptions = self.find_duplicate_descriptions()
+        self.find_corpus_duplicates()
+        stored: dict = self.load_inspection_state(state_path)
+        records: dict = {}
         for lido_object in self.lido_objects:
-            inspection: dict = {}
-            inspection["lidoRecID"] = self.inspect_lido_rec_id(lido_object)
-            inspection["workID"] = self.inspect_work_id(lido_object)
-            inspection["title"] = self.inspect_title(lido_object)
-            inspection["category"] = self.inspect_category(lido_object)
-            inspection["objectWorkType"] = self.inspect_object_work_types(lido_object)
-            inspection["classification"] = self.inspect_classifications(lido_object)
-            inspection["objectDescription"] = self.inspect_object_description(
-                lido_object
+            record: LIDORecord = self.lido_record(lido_object)
+            rec_id: str = self.text(record.first(record.lido_rec_ids))
+            digest: str = self.record_digest(record.lido_object)
+            previous: list | None = stored.get(rec_id) if rec_id else None
+            if previous is not None and previous[0] == digest:
+                inspection: dict = self.reused_inspection(record, previous[1])
+            else:
+                inspection = self.inspect_lido_object(record, self._checks)
+            if rec_id:
+                records[rec_id] = [digest, inspection]
+            self.inspections.append(inspection)
+        self.save_inspection_state(state_path, records)
+
+    @staticmethod
+    def init_inspection_worker(
+        inspector_class,
+        error,
+        configuration: dict,
+        duplicate_titles: set,
+        duplicate_descriptions: set,
+        near_duplicate_titles: set,
+        near_duplicate_descriptions: set,
+        parser_options: dict,
+    ) -> None:
+        """
+        Set up the inspector of a worker process (see inspect).
+
+        :param inspector_class: Class of the inspector in the main process
+        :type inspector_class: type
+        :param error: Error object of the inspector in the main process
+        :type error: Error
+        :param configuration: Configuration of the inspector in the main process
+        :type configuration: dict
+        :param duplicate_titles: Duplicate titles of all records
+        :type duplicate_titles: set
+        :param duplicate_descriptions: Duplicate descriptions of all records
+        :type duplicate_descriptions: set
+        :param near_duplicate_titles: Near duplicate titles of all records
+        :type near_duplicate_titles: set
+        :param near_duplicate_descriptions: Near duplicate descriptions of all records
+        :type near_duplicate_descriptions: set
+        :param parser_options: Parser options of the main process
+        :type parser_options: dict
+        """
+        inspector = inspector_class()
+        inspector.error = error
+        inspector.configuration = configuration
+        inspector.duplicate_titles = duplicate_titles
+        inspector.duplicate_descriptions = duplicate_descriptions
+        inspector.near_duplicate_titles = near_duplicate_titles
+        inspector.near_duplicate_descriptions = near_duplicate_descriptions
+        MetadataInspector.parser_options = parser_options
+        LIDOInspector._worker_inspector = inspector
+
+    @staticmethod
+    def inspect_serialized_lido_object(lido_object: tuple) -> dict:
+        """
+        Inspect a serialized LIDO record in a worker process (see inspect).
+
+        :param lido_object: Serialized LIDO record and the namespace of its document (see document_namespace)
+        :type lido_object: tuple
+        :return: Inspection of the LIDO record
+        :rtype: dict
+        """
+        serialized, namespace = lido_object
+        return LIDOInspector._worker_inspector.inspect_lido_object(
+            LIDORecord(MetadataInspector.read_xml(serialized), namespace)
+        )
+
+    def inspect_lido_file(self, file_path: str) -> None:
+        """
+        Carry out an inspection of a LIDO-XML file in streaming mode.
+
+        The file is parsed incrementally and every LIDO record is inspected and released
+        right after it has been read, so large files can be inspected with flat memory usage.
+        If titles or descriptions have to be unique, the file is read twice: the first pass
+        only collects the texts needed for finding duplicates.
+
+        :param file_path: File path to a LIDO-XML file
+        :type file_path: str
+        """
+        self.inspect_lido_stream([file_path])
+
+    def inspect_lido_files(
+        self,
+        files_path: str,
+        include: tuple | None = None,
+        exclude: tuple = (),
+        recursive: bool = False,
+    ) -> None:
+        """
+        Carry out an inspection of LIDO-XML files in a folder in streaming mode.
+
+        The files are parsed one after another like with inspect_lido_file, so the memory
+        usage does not depend on the number of files.
+
+        :param files_path: Path to a folder with LIDO-XML files
+        :type files_path: str
+        :param include: Glob patterns of the files to inspect, XML files and supported compressed files and archives if None
+        :type include: tuple | None
+        :param exclude: Glob patterns of files and folders to skip
+        :type exclude: tuple, default ()
+        :param recursive: Descend into subfolders
+        :type recursive: bool, default False
+        """
+        self.inspect_lido_stream(
+            list(
+                MetadataInspector.iter_xml_paths(
+                    files_path, include, exclude, recursive
+                )
             )
-            inspection["materialsTech"] = self.inspect_materials_tech(lido_object)
-            inspection["objectMeasurements"] = self.inspect_object_measurements(
-                lido_object
+        )
+
+    def inspect_lido_stream(self, file_paths: list) -> None:
+        """
+        Carry out an inspection of LIDO-XML files in streaming mode.
+
+        The inspections are collected from iter_lido_stream. Files that cannot be read
+        completely are listed in read_errors.
+
+        :param file_paths: File paths to LIDO-XML files
+        :type file_paths: list
+        """
+        self.lido_objects = []
+        self.inspections = list(self.iter_lido_stream(file_paths))
+
+    def iter_lido_stream(self, file_paths: list):
+        """
+        Inspect LIDO-XML files in streaming mode and yield every inspection as soon as it is done.
+
+        Together with to_json or to_csv, neither the records nor the inspections are kept in
+        memory. Files that cannot be read completely are listed in read_errors. If duplicates
+        are inspected, they are listed by the first pass over the files (see
+        find_stream_duplicates), before the first inspection is yielded.
+
+        :param file_paths: File paths to LIDO-XML files
+        :type file_paths: list
+        :return: Generator of the inspections in document order
+        :rtype: Iterator[dict]
+        :raises ValueError: If a regular expression of the configuration is invalid
+        """
+        self.compile_configuration()
+        self.read_errors = []
+        duplicates: bool = any(
+            self.configuration[setting][key]
+            for setting in ("title", "object_description")
+            for key in ("unique", "similar")
+        )
+        if duplicates:
+            self.find_stream_duplicates(file_paths)
+        declared: list = []
+        errors: list = [] if duplicates else self.read_errors
+        for lido_object in self.iter_lido_objects(file_paths, errors, declared):
+            yield self.inspect_lido_object(
+                LIDORecord(lido_object, self.declared_namespace(lido_object, declared))
             )
-            inspection["event"] = self.inspect_events(lido_object)
-            inspection["subjectConcept"] = self.inspect_subject_concepts(lido_object)
-            inspection["resourceSet"] = self.inspect_resource_sets(lido_object)
-            inspection["recordType"] = self.inspect_record_type(lido_object)
-            inspection["repositoryName"] = self.inspect_repository_name(lido_object)
-            inspection["recordSource"] = self.inspect_record_sources(lido_object)
-            inspection["recordRights"] = self.inspect_record_rights(lido_object)
-            inspection["recordInfoSet"] = self.inspect_record_info_set(lido_object)
-            self.inspections.append(inspection)
+        if duplicates:
+            self.read_errors.extend(
+                error for error in errors if error not in self.read_errors
+            )
+        if self.cache is not None:
+            self.cache.commit()
+
+    def iter_lido_objects(
+        self, file_paths: list, errors: list | None = None, declared: list | None = None
+    ):
+        """
+        Parse LIDO-XML files incrementally and yield their LIDO records.
+
+        :param file_paths: File paths to LIDO-XML files
+        :type file_paths: list
+        :param errors: List for tuples of file path and error message of unreadable files, errors are raised if None
+        :type errors: list | None
+        :param declared: List that is filled with the namespace URIs declared in the current document (see MetadataInspector.iter_xml_file)
+        :type declared: list | None
+        :return: Generator of LIDO records, which are released after the next record is requested
+        :rtype: Iterator[etree._Element]
+        """
+        for file_path in file_paths:
+            try:
+                yield from MetadataInspector.iter_xml_file(
+                    file_path, "{*}lido", declared
+                )
+            except MetadataInspector.read_exceptions as exception:
+                if errors is None:
+                    raise
+                errors.append((file_path, f"{exception}"))
+
+    def inspect_lido_object(self, lido_object, checks: tuple | None = None) -> dict:
+        """
+        Inspect a single LIDO record.
+
+        If the inspector has a cache, the inspection is taken from the cache if possible
+        (see inspect_cached_record).
+
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param checks: Checks to call as tuples of inspection key, method and further arguments, the enabled checks if None
+        :type checks: tuple | None
+        :return: Inspection of the record
+        :rtype: dict
+        """
+        lido_object = self.lido_record(lido_object)
+        if checks is None and self.cache is not None:
+            return self.inspect_cached_record(lido_object)
+        namespace: str | None = self.namespace
+        self.namespace = lido_object.namespace
+        try:
+            return self.inspect_record(lido_object, checks)
+        finally:
+            self.namespace = namespace
+
+    def inspect_cached_record(self, lido_object: LIDORecord) -> dict:
+        """
+        Inspect a single LIDO record and reuse the inspection of a record with the same content from the cache.
+
+        The cache key is the digest of the canonical form of the record together with the
+        configuration, the error language and the package version (see cache_key). The
+        checks that depend on the whole corpus are carried out again for cached inspections
+        (see reused_inspection).
+
+        :param lido_object: Extracted fields of a record of an object in LIDO-XML
+        :type lido_object: LIDORecord
+        :return: Inspection of the record
+        :rtype: dict
+        """
+        key: tuple = self.cache_key(self.record_digest(lido_object.lido_object))
+        inspection: dict | None = self.cache.get(key)
+        if inspection is not None:
+            return self.reused_inspection(lido_object, inspection)
+        inspection = self.inspect_lido_object(lido_object, self._checks)
+        self.cache.put(key, inspection)
+        return inspection
+
+    def reused_inspection(self, lido_object: LIDORecord, inspection: dict) -> dict:
+        """
+        Reuse a stored inspection of a record with the same content.
+
+        The checks that depend on the whole corpus (the uniqueness of titles and
+        descriptions) are carried out again.
+
+        :param lido_object: Extracted fields of a record of an object in LIDO-XML
+        :type lido_object: LIDORecord
+        :param inspection: Stored inspection of the record
+        :type inspection: dict
+        :return: Inspection of the record
+        :rtype: dict
+        """
+        inspection = dict(inspection)
+        corpus_inspection: dict = self.inspect_lido_object(
+            lido_object, self._corpus_checks
+        )
+        for key, _, _ in self._corpus_checks:
+            inspection[key] = corpus_inspection[key]
+        return inspection
+
+    def inspect_record(
+        self, lido_object: LIDORecord, checks: tuple | None = None
+    ) -> dict:
+        """
+        Inspect the extracted fields of a single LIDO record (see inspect_lido_object).
+
+        Only the enabled checks of the rule plan are called (see compile_configuration), the
+        inspections of the other settings are None.
+
+        :param lido_object: Extracted fields of a record of an object in LIDO-XML
+        :type lido_object: LIDORecord
+        :param checks: Checks to call as tuples of inspection key, method and further arguments, the enabled checks if None
+        :type checks: tuple | None
+        :return: Inspection of the record
+        :rtype: dict
+        """
+        inspection: dict = self._inspection.copy()
+        for key, check, arguments in self._checks if checks is None else checks:
+            inspection[key] = check(lido_object, *arguments)
+        return inspection
+
+    def lido_record(self, lido_object) -> LIDORecord:
+        """
+        Get the extracted fields of a LIDO record.
+
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :return: Extracted fields of the record
+        :rtype: LIDORecord
+        """
+        if isinstance(lido_object, LIDORecord):
+            return lido_object
+        return LIDORecord(lido_object, self.document_namespace(lido_object))
+
+    def document_namespace(self, lido_object) -> str | None:
+        """
+        Get the namespace shared by all elements of the document of a LIDO record.
+
+        The namespace is detected once per document (see detect_namespace) and kept until
+        lido_objects is assigned again. Records of streamed documents are not complete
+        documents, their namespace is taken from the declarations instead (see
+        iter_lido_stream).
+
+        :param lido_object: Record of an object in LIDO-XML
+        :type lido_object: etree._Element
+        :return: Namespace ('' for none), None if the elements belong to different namespaces
+        :rtype: str | None
+        """
+        root = lido_object.getroottree().getroot()
+        if root in self._document_namespaces:
+            return self._document_namespaces[root]
+        namespace: str | None = self.detect_namespace(root)
+        self._document_namespaces[root] = namespace
+        return namespace
+
+    def add_lido_objects(self, lido_objects: list) -> tuple:
+        """
+        Add LIDO records to lido_objects and count their titles and descriptions.
+
+        Only the added records are counted (see title_index and description_index), so the
+        duplicates stay correct for the next inspection without finding them over all records
+        again. The inspections of earlier records with the returned titles or descriptions
+        are outdated, since these are no longer unique.
+
+        :param lido_objects: LIDO records to add
+        :type lido_objects: list
+        :return: Titles and descriptions that have become duplicates
+        :rtype: tuple
+        """
+        title_index: DuplicateIndex = self.title_index
+        description_index: DuplicateIndex = self.description_index
+        self._lido_objects.extend(lido_objects)
+        self._indexed_version = self._lido_objects.version
+        return (
+            title_index.update(
+                self.text(lido_object.find(self.title_xpath))
+                for lido_object in lido_objects
+            ),
+            description_index.update(
+                self.text(lido_object.find(self.description_xpath))
+                for lido_object in lido_objects
+            ),
+        )
+
+    def remove_lido_objects(self, lido_objects: list) -> tuple:
+        """
+        Remove LIDO records from lido_objects and uncount their titles and descriptions.
+
+        The inspections of the remaining records with the returned titles or descriptions
+        are outdated, since these are unique again.
+
+        :param lido_objects: LIDO records to remove, which have to be in lido_objects
+        :type lido_objects: list
+        :return: Titles and descriptions that are no longer duplicates
+        :rtype: tuple
+        :raises ValueError: If a record is not in lido_objects
+        """
+        title_index: DuplicateIndex = self.title_index
+        description_index: DuplicateIndex = self.description_index
+        removed: dict = {id(lido_object): lido_object for lido_object in lido_objects}
+        remaining: RecordList = RecordList(
+            lido_object
+            for lido_object in self._lido_objects
+            if id(lido_object) not in removed
+        )
+        if len(self._lido_objects) - len(remaining) != len(removed):
+            raise ValueError("LIDO records are not in lido_objects")
+        self._lido_objects = remaining
+        self._indexed_version = remaining.version
+        return (
+            title_index.difference_update(
+                self.text(lido_object.find(self.title_xpath))
+                for lido_object in removed.values()
+            ),
+            description_index.difference_update(
+                self.text(lido_object.find(self.description_xpath))
+                for lido_object in removed.values()
+            ),
+        )
 
     def find_duplicates(self, xpath: str) -> set:
         """
@@ -241,14 +909,208 @@ class LIDOInspector(MetadataInspector):
         :return: All duplicate titles in lido_objects
         :rtype: set
         """
-        texts: list = [
+        return self.duplicates(
             self.text(lido_object.find(xpath)) for lido_object in self.lido_objects
+        )
+
+    def duplicates(self, texts) -> set:
+        """
+        Find duplicates in texts. Empty texts are ignored.
+
+        Only the digests of the texts are kept while counting them (see DuplicateIndex).
+
+        :param texts: Texts with possible duplicates
+        :type texts: Iterable[str]
+        :return: All duplicate texts
+        :rtype: set
+        """
+        return DuplicateIndex(texts).duplicates
+
+    def find_stream_duplicates(self, file_paths: list) -> None:
+        """
+        Find duplicate and near duplicate titles and descriptions in LIDO-XML files in streaming mode.
+
+        Files that cannot be read completely are listed in read_errors.
+
+        :param file_paths: File paths to LIDO-XML files
+        :type file_paths: list
+        """
+        self.read_errors = []
+        titles: DuplicateIndex = DuplicateIndex()
+        descriptions: DuplicateIndex = DuplicateIndex()
+        near_titles: NearDuplicateIndex = self.near_duplicate_index("title")
+        near_descriptions: NearDuplicateIndex = self.near_duplicate_index(
+            "object_description"
+        )
+        for lido_object in self.iter_lido_objects(file_paths, self.read_errors):
+            title: str = self.text(lido_object.find(self.title_xpath))
+            description: str = self.text(lido_object.find(self.description_xpath))
+            if self.configuration["title"]["unique"]:
+                titles.add(title)
+            if self.configuration["title"]["similar"]:
+                near_titles.add(title)
+            if self.configuration["object_description"]["unique"]:
+                descriptions.add(description)
+            if self.configuration["object_description"]["similar"]:
+                near_descriptions.add(description)
+        self.duplicate_titles = titles.duplicates
+        self.duplicate_descriptions = descriptions.duplicates
+        self.near_duplicate_titles = near_titles.near_duplicates
+        self.near_duplicate_descriptions = near_descriptions.near_duplicates
+
+    def find_corpus_duplicates(self) -> None:
+        """
+        Find the duplicate and near duplicate titles and descriptions of lido_objects for the checks that are enabled.
+
+        The duplicates are taken from title_index and description_index, the near duplicates
+        are found over all records again.
+        """
+        if self.configuration["title"]["unique"]:
+            self.duplicate_titles = self.title_index.duplicates
+        if self.configuration["object_description"]["unique"]:
+            self.duplicate_descriptions = self.description_index.duplicates
+        if self.configuration["title"]["similar"]:
+            self.near_duplicate_titles = self.find_near_duplicate_titles()
+        if self.configuration["object_description"]["similar"]:
+            self.near_duplicate_descriptions = self.find_near_duplicate_descriptions()
+
+    def near_duplicate_index(self, setting: str, text=None) -> NearDuplicateIndex:
+        """
+        Create an empty index for finding near duplicates with the parameters of a setting.
+
+        :param setting: Name of the setting, 'title' or 'object_description'
+        :type setting: str
+        :param text: Function that gets the text of a record, the records are the texts if None
+        :type text: Callable | None, default None
+        :return: Index with the similarity, bands and rows of the setting
+        :rtype: NearDuplicateIndex
+        :raises ValueError: If the parameters are invalid
+        """
+        config: dict = self.configuration[setting]
+        return NearDuplicateIndex(
+            config["similarity"], config["bands"], config["rows"], text=text
+        )
+
+    def find_near_duplicates(self, xpath: str, setting: str) -> set:
+        """
+        Find near duplicates based on an XPATH expression (see NearDuplicateIndex).
+
+        The index keeps the records instead of their texts, since lido_objects holds them.
+
+        :param xpath: XPATH expression
+        :type xpath: str
+        :param setting: Name of the setting with the parameters, 'title' or 'object_description'
+        :type setting: str
+        :return: All near duplicate texts in lido_objects
+        :rtype: set
+        :raises ValueError: If the parameters are invalid
+        """
+        index: NearDuplicateIndex = self.near_duplicate_index(
+            setting, lambda lido_object: self.text(lido_object.find(xpath))
+        )
+        for lido_object in self.lido_objects:
+            index.add(self.text(lido_object.find(xpath)), lido_object)
+        return index.near_duplicates
+
+    def find_near_duplicate_titles(self) -> set:
+        """
+        Find near duplicate titles.
+
+        :return: All near duplicate titles in lido_objects
+        :rtype: set
+        """
+        return self.find_near_duplicates(self.title_xpath, "title")
+
+    def find_near_duplicate_descriptions(self) -> set:
+        """
+        Find near duplicate descriptions.
+
+        :return: All near duplicate descriptions in lido_objects
+        :rtype: set
+        """
+        return self.find_near_duplicates(self.description_xpath, "object_description")
+
+    def duplicate_fields(self) -> list:
+        """
+        Get the fields that are checked for duplicates.
+
+        :return: Tuples of field number, inspection key and XPATH expression per field with 'unique' enabled
+        :rtype: list
+        """
+        return [
+            (number, key, xpath)
+            for number, (key, setting, xpath) in enumerate(
+                (
+                    ("title", "title", self.title_xpath),
+                    ("objectDescription", "object_description", self.description_xpath),
+                )
+            )
+            if self.configuration[setting]["inspect"]
+            and self.configuration[setting]["unique"]
         ]
-        seen: set = set()
-        return set(
-            text for text in texts if text != "" and text in seen or seen.add(text)
+
+    def spill_duplicates(
+        self, corpus: CorpusDuplicates, file_paths: list | None = None
+    ) -> int:
+        """
+        Add the titles and descriptions of the records as a shard of a corpus for finding duplicates across shards.
+
+        The digests of the texts are written to run files on disk (see CorpusDuplicates), so
+        shards can be inspected one after another and the duplicates across all shards can be
+        found afterwards with corpus.merge without keeping the corpus in memory. Files that
+        cannot be read completely are listed in read_errors.
+
+        :param corpus: Duplicates of the corpus
+        :type corpus: CorpusDuplicates
+        :param file_paths: File paths to LIDO-XML files read in streaming mode, lido_objects if None
+        :type file_paths: list | None
+        :return: Number of the shard
+        :rtype: int
+        """
+        lido_objects = self.lido_objects
+        if file_paths is not None:
+            self.read_errors = []
+            lido_objects = self.iter_lido_objects(file_paths, self.read_errors)
+        fields: list = self.duplicate_fields()
+        return corpus.add_shard(
+            (number, self.text(lido_object.find(xpath)), position)
+            for position, lido_object in enumerate(lido_objects)
+            for number, _, xpath in fields
         )
 
+    def apply_corpus_duplicates(
+        self, corpus: CorpusDuplicates, shard: int, inspections: list | None = None
+    ) -> None:
+        """
+        Report titles and descriptions that are duplicates in the corpus as not unique in the inspections of a shard.
+
+        The inspections must be in the order of the records that were added with
+        spill_duplicates, and the corpus must be merged.
+
+        :param corpus: Merged duplicates of the corpus
+        :type corpus: CorpusDuplicates
+        :param shard: Number of the shard (see spill_duplicates)
+        :type shard: int
+        :param inspections: Inspections of the shard, inspections if None
+        :type inspections: list | None
+        """
+        if inspections is None:
+            inspections = self.inspections
+        duplicates: dict = corpus.duplicates(shard)
+        for number, key, _ in self.duplicate_fields():
+            for position in duplicates.get(number, ()):
+                messages: list = inspections[position][key] or []
+                if (
+                    self.error.not_uniq() in messages
+                    or self.error.miss_info() in messages
+                ):
+                    continue
+                messages.insert(
+                    1 if messages[:1] == [self.error.dupl_blanks()] else 0,
+                    self.error.not_uniq(),
+                )
+                inspections[position][key] = messages
+
     def find_duplicate_titles(self) -> set:
         """
         Find duplicate titles.
@@ -256,9 +1118,7 @@ class LIDOInspector(MetadataInspector):
         :return: All duplicate titles in lido_objects
         :rtype: set
         """
-        return self.find_duplicates(
-            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}titleWrap/{*}titleSet/{*}appellationValue"
-        )
+        return self.find_duplicates(self.title_xpath)
 
     def find_duplicate_descriptions(self) -> set:
         """
@@ -267,39 +1127,39 @@ class LIDOInspector(MetadataInspector):
         :return: All duplicate descriptions in lido_objects
         :rtype: set
         """
-        return self.find_duplicates(
-            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}objectDescriptionWrap/{*}objectDescriptionSet/{*}descriptiveNoteValue"
-        )
+        return self.find_duplicates(self.description_xpath)
 
     def inspect_lido_rec_id(self, lido_object) -> str:
         """
         Inspect record ID.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
         :return: Record ID or error message if missing
         :rtype: str
         """
-        lido_rec_id = lido_object.find("{*}lidoRecID")
+        record: LIDORecord = self.lido_record(lido_object)
+        lido_rec_id = record.first(record.lido_rec_ids)
         return lido_rec_id.text if self.text(lido_rec_id) else self.error.miss_info()
 
-    def inspect_work_id(self, lido_object) -> str:
+    def inspect_work_id(self, lido_object, config: dict | None = None) -> str:
         """
         Inspect work ID.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
         :return: Work ID or error message if missing
         :rtype: str
         """
-        work_id = lido_object.find(
-            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}repositoryWrap/{*}repositorySet/{*}workID"
-        )
+        if config is None:
+            config = self.configuration["work_id"]
+        record: LIDORecord = self.lido_record(lido_object)
+        work_id = record.first(record.work_ids)
         if not self.text(work_id):
             return self.error.miss_info()
-        if self.configuration["work_id"]["pattern"] and not re.fullmatch(
-            rf"{self.configuration['work_id']['pattern']}", work_id.text
-        ):
+        if not self.matches(config["pattern"], work_id.text):
             return self.error.pattern(work_id.text)
         return work_id.text
 
@@ -307,37 +1167,39 @@ class LIDOInspector(MetadataInspector):
         """
         Check if title is distinct from object/work type.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
         :param value: Text value of the inspected record and element
         :type value: str
         :return: True if title is distinct from object/work type, False if not
         :rtype: bool
         """
-        object_work_type = lido_object.find(
-            "{*}descriptiveMetadata/{*}objectClassificationWrap/{*}objectWorkTypeWrap/{*}objectWorkType"
-        )
+        record: LIDORecord = self.lido_record(lido_object)
+        object_work_type = record.first(record.object_work_types)
         if self.has_subelems(object_work_type):
             return False if value == self.term(object_work_type) else True
         return True
 
-    def inspect_title(self, lido_object) -> list | None:
+    def inspect_title(self, lido_object, config: dict | None = None) -> list | None:
         """
         Inspect title.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["title"]["inspect"]:
-            return None
+        if config is None:
+            config = self.configuration["title"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
         return self.inspect_text(
-            lido_object.find(
-                "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}titleWrap/{*}titleSet"
-            ),
-            lido_object,
-            self.configuration["title"],
+            record.first(record.title_sets),
+            record,
+            config,
         )
 
     def value(self, parent) -> str:
@@ -351,11 +1213,11 @@ class LIDOInspector(MetadataInspector):
         """
         if not self.has_subelems(parent):
             return ""
-        value = parent.find(".//{*}appellationValue")
+        value = self.find(parent, ".//{*}appellationValue")
         return (
             value.text
             if self.text(value)
-            else self.text(parent.find("{*}descriptiveNoteValue"))
+            else self.text(self.child(parent, "descriptiveNoteValue"))
         )
 
     def term(self, parent) -> str:
@@ -369,9 +1231,11 @@ class LIDOInspector(MetadataInspector):
         """
         if not self.has_subelems(parent):
             return ""
-        term = parent.find("{*}term")
+        term = self.child(parent, "term")
         return (
-            term.text if self.text(term) else self.text(parent.find(".//{*}prefLabel"))
+            term.text
+            if self.text(term)
+            else self.text(self.find(parent, ".//{*}prefLabel"))
         )
 
     def is_uniq(self, text: str, element) -> bool:
@@ -385,30 +1249,39 @@ class LIDOInspector(MetadataInspector):
         :return: True if title/description is unique, False if not
         :rtype: bool
         """
-        if (
-            (
-                element.tag == f"{{{self.lido_namespace}}}titleSet"
-                or element.tag == "titleSet"
-            )
-            and text in self.duplicate_titles
-        ) or (
-            (
-                element.tag == f"{{{self.lido_namespace}}}objectDescriptionSet"
-                or element.tag == "objectDescriptionSet"
-            )
+        if (element.tag in self._title_tags and text in self.duplicate_titles) or (
+            element.tag in self._description_tags
             and text in self.duplicate_descriptions
         ):
             return False
         return True
 
+    def is_near_duplicate(self, text: str, element) -> bool:
+        """
+        Check if title or object description is similar to a different title or object description.
+
+        :param text: Text that is checked
+        :type text: str
+        :param element: XML element with supposed text
+        :type element: etree._Element
+        :return: True if title/description is a near duplicate, False if not
+        :rtype: bool
+        """
+        return (
+            element.tag in self._title_tags and text in self.near_duplicate_titles
+        ) or (
+            element.tag in self._description_tags
+            and text in self.near_duplicate_descriptions
+        )
+
     def inspect_text(self, element, lido_object, config: dict) -> list | None:
         """
         Inspect a text element.
 
         :param element: XML element with supposed text
         :type element: etree._Element
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
         :param config: Configuration of the specific inspection.
         :type config: dict
         :return: List of error messages, None if there are no errors
@@ -425,6 +1298,9 @@ class LIDOInspector(MetadataInspector):
         if config["unique"]:
             if not self.is_uniq(value, element):
                 messages.append(self.error.not_uniq())
+        if config.get("similar", False):
+            if self.is_near_duplicate(value, element):
+                messages.append(self.error.near_dupl())
         if config.get("distinct_from_type", False):
             if not self.is_distinct_from_type(lido_object, value):
                 messages.append(self.error.dist("objectWorkType"))
@@ -456,11 +1332,11 @@ class LIDOInspector(MetadataInspector):
         """
         if not self.has_subelems(parent):
             return ""
-        concept_id = parent.find("{*}conceptID")
+        concept_id = self.child(parent, "conceptID")
         return (
             concept_id.text
             if self.text(concept_id)
-            else self.about(parent.find("{*}Concept"))
+            else self.about(self.child(parent, "Concept"))
         )
 
     def inspect_concept(self, concept, config: dict) -> list:
@@ -499,74 +1375,86 @@ class LIDOInspector(MetadataInspector):
                 messages.append(self.error.few())
         return messages if messages else None
 
-    def inspect_category(self, lido_object) -> list | None:
+    def inspect_category(self, lido_object, config: dict | None = None) -> list | None:
         """
         Inspect category.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["category"]["inspect"]:
-            return None
-        return self.inspect_concepts(
-            lido_object.findall("{*}category"), self.configuration["category"]
-        )
+        if config is None:
+            config = self.configuration["category"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        return self.inspect_concepts(record.categories, config)
 
-    def inspect_object_work_types(self, lido_object) -> list | None:
+    def inspect_object_work_types(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect object/work types.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["object_work_type"]["inspect"]:
-            return None
-        return self.inspect_concepts(
-            lido_object.findall(
-                "{*}descriptiveMetadata/{*}objectClassificationWrap/{*}objectWorkTypeWrap/{*}objectWorkType"
-            ),
-            self.configuration["object_work_type"],
-        )
+        if config is None:
+            config = self.configuration["object_work_type"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        return self.inspect_concepts(record.object_work_types, config)
 
-    def inspect_classifications(self, lido_object) -> list | None:
+    def inspect_classifications(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect classifications.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["classification"]["inspect"]:
-            return None
-        return self.inspect_concepts(
-            lido_object.findall(
-                "{*}descriptiveMetadata/{*}objectClassificationWrap/{*}classificationWrap/{*}classification"
-            ),
-            self.configuration["classification"],
-        )
+        if config is None:
+            config = self.configuration["classification"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        return self.inspect_concepts(record.classifications, config)
 
-    def inspect_object_description(self, lido_object) -> list | None:
+    def inspect_object_description(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect object description.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["object_description"]["inspect"]:
-            return None
+        if config is None:
+            config = self.configuration["object_description"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
         return self.inspect_text(
-            lido_object.find(
-                "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}objectDescriptionWrap/{*}objectDescriptionSet"
-            ),
-            lido_object,
-            self.configuration["object_description"],
+            record.first(record.description_sets),
+            record,
+            config,
         )
 
     def lido_type(self, element) -> str:
@@ -634,28 +1522,30 @@ class LIDOInspector(MetadataInspector):
             ],
         )
 
-    def inspect_materials_tech(self, lido_object) -> list | None:
+    def inspect_materials_tech(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect materials and techniques.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["materials_tech"]["inspect"]:
-            return None
-        materials_tech = lido_object.findall(".//{*}materialsTech/{*}termMaterialsTech")
-        concepts_inspection = self.inspect_concepts(
-            materials_tech, self.configuration["materials_tech"]
-        )
+        if config is None:
+            config = self.configuration["materials_tech"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        materials_tech: list = record.materials_tech
+        concepts_inspection = self.inspect_concepts(materials_tech, config)
         messages: list = []
         if concepts_inspection is not None:
             messages.extend(concepts_inspection)
-        if (
-            not self.configuration["materials_tech"]["differentiated"]
-            or self.error.miss_info() in messages
-        ):
+        if not config["differentiated"] or self.error.miss_info() in messages:
             return messages if messages else None
         if not self.has_material(materials_tech):
             messages.append(self.error.miss_mat())
@@ -690,10 +1580,10 @@ class LIDOInspector(MetadataInspector):
         if not self.has_subelems(measurements_set):
             return [self.error.empty_elem("measurementsSet")]
         measurement_type: str = self.meas_type(
-            measurements_set.find("{*}measurementType")
+            self.child(measurements_set, "measurementType")
         )
-        measurement_unit = measurements_set.find("{*}measurementUnit")
-        measurement_value = measurements_set.find("{*}measurementValue")
+        measurement_unit = self.child(measurements_set, "measurementUnit")
+        measurement_value = self.child(measurements_set, "measurementValue")
         messages: list = []
         if not measurement_type:
             messages.append(self.error.miss_meas_type())
@@ -703,20 +1593,23 @@ class LIDOInspector(MetadataInspector):
             messages.append(self.error.miss_meas_value(measurement_type))
         return messages
 
-    def inspect_object_measurements(self, lido_object) -> list | None:
+    def inspect_object_measurements(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect objects measurements.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["object_measurements"]["inspect"]:
+        if config is None and not self.configuration["object_measurements"]["inspect"]:
             return None
-        measurements_sets = lido_object.findall(
-            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}objectMeasurementsWrap/{*}objectMeasurementsSet/{*}objectMeasurements/{*}measurementsSet"
-        )
+        record: LIDORecord = self.lido_record(lido_object)
+        measurements_sets: list = record.measurements_sets
         if not measurements_sets:
             return [self.error.miss_info()]
         messages: list = []
@@ -724,18 +1617,22 @@ class LIDOInspector(MetadataInspector):
             messages.extend(self.inspect_measurements_set(measurements_set))
         return messages if messages else None
 
-    def inspect_event_type(self, event_type) -> list:
+    def inspect_event_type(self, event_type, config: dict | None = None) -> list:
         """
         Inspect event type.
 
         :param event_type: XML element of supposed event type
         :type event_type: etree._Element
+        :param config: Configuration of the specific inspection, the configuration of the events if None
+        :type config: dict | None
         :return: List of error messages
         :rtype: list
         """
         if not self.has_subelems(event_type):
             return [self.error.miss_event_type()]
-        return self.inspect_concept(event_type, self.configuration["event"])
+        return self.inspect_concept(
+            event_type, self.configuration["event"] if config is None else config
+        )
 
     def place_id(self, parent) -> str:
         """
@@ -746,7 +1643,11 @@ class LIDOInspector(MetadataInspector):
         :return: placeID
         :rtype: str
         """
-        return self.text(parent.find("{*}placeID")) if self.has_subelems(parent) else ""
+        return (
+            self.text(self.child(parent, "placeID"))
+            if self.has_subelems(parent)
+            else ""
+        )
 
     def inspect_place(self, place, event_type, config: dict) -> list:
         """
@@ -796,7 +1697,11 @@ class LIDOInspector(MetadataInspector):
         :return: actorID
         :rtype: str
         """
-        return self.text(parent.find("{*}actorID")) if self.has_subelems(parent) else ""
+        return (
+            self.text(self.child(parent, "actorID"))
+            if self.has_subelems(parent)
+            else ""
+        )
 
     def inspect_actor(self, actor, event_type, config: dict) -> list:
         """
@@ -853,16 +1758,73 @@ class LIDOInspector(MetadataInspector):
         if not self.has_subelems(date):
             return [self.error.miss_date(self.term(event_type))]
         messages: list = []
-        if not self.text(date.find("{*}earliestDate")):
+        if not self.text(self.child(date, "earliestDate")):
             messages.append(self.error.miss_earl_date(self.term(event_type)))
-        if not self.text(date.find("{*}latestDate")):
+        if not self.text(self.child(date, "latestDate")):
             messages.append(self.error.miss_lat_date(self.term(event_type)))
         return messages
 
+    def date_checks(self, today: date | None = None) -> dict:
+        """
+        Check the dates of the events of all records at once with NumPy (see DateChecks).
+
+        The earliest and latest dates of the events are flagged as missing if one of them is
+        missing or not a valid ISO 8601 date (see date_bounds), as future and as inverted if
+        the earliest date is after the latest date. Events of the type 'Event
+        (non-specified)' are skipped like with inspect_date. The checks leave the inspections
+        unchanged.
+
+        :param today: Current day, date.today() if None
+        :type today: datetime.date | None
+        :return: Sets of the positions of the flagged records in lido_objects per check ('missing', 'future' and 'inverted')
+        :rtype: dict
+        :raises ImportError: If NumPy is not installed
+        """
+        bounds: list = []
+        starts: list = []
+        records: list = []
+        for position, lido_object in enumerate(self.lido_objects):
+            for event in self.lido_record(lido_object).events:
+                if self.term(self.child(event, "eventType")) in [
+                    "Event (non-specified)"
+                ]:
+                    continue
+                event_date = self.find(event, "{*}eventDate/{*}date")
+                if event_date is None:
+                    bounds.append((None, None))
+                    starts.append(None)
+                else:
+                    latest: str = self.text(
+                        self.child(event_date, "latestDate")
+                    ).strip()
+                    bounds.append(
+                        (
+                            self.date_bounds(
+                                self.text(
+                                    self.child(event_date, "earliestDate")
+                                ).strip()
+                            )[0],
+                            self.date_bounds(latest)[1],
+                        )
+                    )
+                    starts.append(self.date_bounds(latest, True)[1])
+                records.append(position)
+        checks = DateChecks(bounds, records, starts)
+        return {
+            "missing": checks.records(
+                checks.missing_earliest() | checks.missing_latest()
+            ),
+            "future": checks.records(checks.future(today)),
+            "inverted": checks.records(checks.inverted()),
+        }
+
     def summarize_event_messages(self, messages: list, event_type: str) -> list:
         """
         Summarize several event-specific error messages (missing actor, place and date).
 
+        The messages are recognized by the keys of their templates (see Error.message), so
+        no messages are built for comparing them.
+
         :param messages: Error messages of an event
         :type messages: list
         :param event_type: XML element of corresponding event type
@@ -870,91 +1832,96 @@ class LIDOInspector(MetadataInspector):
         :return: List of error messages
         :rtype: list
         """
-        if (
-            self.error.miss_actor(event_type) in messages
-            and self.error.miss_place(event_type) in messages
-            and self.error.miss_date(event_type) in messages
-        ):
+        summarized: set = {"miss_actor", "miss_place", "miss_date"}
+        keys: set = {getattr(message, "key", None) for message in messages}
+        if summarized <= keys:
             messages.append(self.error.miss_event_info(event_type))
         return [
             message
             for message in messages
-            if message != self.error.miss_actor(event_type)
-            and message != self.error.miss_place(event_type)
-            and message != self.error.miss_date(event_type)
+            if getattr(message, "key", None) not in summarized
         ]
 
-    def inspect_event(self, event) -> list:
+    def inspect_event(self, event, config: dict | None = None) -> list:
         """
         Inspect event.
 
         :param event: XML element of supposed event
         :type event: etree._Element
+        :param config: Configuration of the specific inspection, the configuration of the events if None
+        :type config: dict | None
         :return: List of error messages
         :rtype: list
         """
         if not self.has_subelems(event):
             return [self.error.empty_elem("event")]
+        if config is None:
+            config = self.configuration["event"]
         messages: list = []
-        event_type = event.find("{*}eventType")
-        messages.extend(self.inspect_event_type(event_type))
+        event_type = self.child(event, "eventType")
+        messages.extend(self.inspect_event_type(event_type, config))
         messages.extend(
             self.inspect_actors(
-                event.findall("{*}eventActor/{*}actorInRole/{*}actor"),
+                self.findall(event, "{*}eventActor/{*}actorInRole/{*}actor"),
                 event_type,
-                self.configuration["event"],
+                config,
             )
         )
         messages.extend(
             self.inspect_places(
-                event.findall("{*}eventPlace/{*}place"),
+                self.findall(event, "{*}eventPlace/{*}place"),
                 event_type,
-                self.configuration["event"],
+                config,
             )
         )
         messages.extend(
-            self.inspect_date(event.find("{*}eventDate/{*}date"), event_type)
+            self.inspect_date(self.find(event, "{*}eventDate/{*}date"), event_type)
         )
         return self.summarize_event_messages(messages, self.term(event_type))
 
-    def inspect_events(self, lido_object) -> list | None:
+    def inspect_events(self, lido_object, config: dict | None = None) -> list | None:
         """
         Inspect events.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["event"]["inspect"]:
-            return None
-        events: list = lido_object.findall(
-            "{*}descriptiveMetadata/{*}eventWrap/{*}eventSet/{*}event"
-        )
+        if config is None:
+            config = self.configuration["event"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        events: list = record.events
         if not events:
             return [self.error.miss_info()]
         messages: list = []
         for event in events:
-            messages.extend(self.inspect_event(event))
+            messages.extend(self.inspect_event(event, config))
         return messages if messages else None
 
-    def inspect_subject_concepts(self, lido_object) -> list | None:
+    def inspect_subject_concepts(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect subject concepts.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["subject_concept"]["inspect"]:
-            return None
-        return self.inspect_concepts(
-            lido_object.findall(
-                "{*}descriptiveMetadata/{*}objectRelationWrap/{*}subjectWrap/{*}subjectSet/{*}subject/{*}subjectConcept"
-            ),
-            self.configuration["subject_concept"],
-        )
+        if config is None:
+            config = self.configuration["subject_concept"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        return self.inspect_concepts(record.subject_concepts, config)
 
     def inspect_resource_set(self, resource_set) -> list:
         """
@@ -969,30 +1936,35 @@ class LIDOInspector(MetadataInspector):
             return [self.error.empty_elem("resourceSet")]
         messages: list = []
         link_resource: str = self.text(
-            resource_set.find("{*}resourceRepresentation/{*}linkResource")
+            self.find(resource_set, "{*}resourceRepresentation/{*}linkResource")
         )
         if not link_resource:
             messages.append(self.error.miss_link())
-        if not self.text(resource_set.find("{*}rightsResource/{*}rightsType/{*}term")):
+        if not self.text(
+            self.find(resource_set, "{*}rightsResource/{*}rightsType/{*}term")
+        ):
             messages.append(self.error.miss_rights(link_resource))
-        if not self.text(resource_set.find("{*}resourceType/{*}term")):
+        if not self.text(self.find(resource_set, "{*}resourceType/{*}term")):
             messages.append(self.error.miss_res_type(link_resource))
         return messages
 
-    def inspect_resource_sets(self, lido_object) -> list | None:
+    def inspect_resource_sets(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect resource sets.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["resource"]["inspect"]:
+        if config is None and not self.configuration["resource"]["inspect"]:
             return None
-        resource_sets = lido_object.findall(
-            "{*}administrativeMetadata/{*}resourceWrap/{*}resourceSet"
-        )
+        record: LIDORecord = self.lido_record(lido_object)
+        resource_sets: list = record.resource_sets
         if not resource_sets:
             return [self.error.miss_info()]
         messages: list = []
@@ -1000,21 +1972,25 @@ class LIDOInspector(MetadataInspector):
             messages.extend(self.inspect_resource_set(resource_set))
         return messages if messages else None
 
-    def inspect_record_type(self, lido_object) -> list | None:
+    def inspect_record_type(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect record type.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["record_type"]["inspect"]:
-            return None
-        messages: list = self.inspect_concept(
-            lido_object.find("{*}administrativeMetadata/{*}recordWrap/{*}recordType"),
-            self.configuration["record_type"],
-        )
+        if config is None:
+            config = self.configuration["record_type"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        messages: list = self.inspect_concept(record.first(record.record_types), config)
         return messages if messages else None
 
     def legal_body_id(self, parent) -> str:
@@ -1027,25 +2003,30 @@ class LIDOInspector(MetadataInspector):
         :rtype: str
         """
         return (
-            self.text(parent.find("{*}legalBodyID"))
+            self.text(self.child(parent, "legalBodyID"))
             if self.has_subelems(parent)
             else ""
         )
 
-    def inspect_repository_name(self, lido_object) -> list | None:
+    def inspect_repository_name(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect repository name.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["repository_name"]["inspect"]:
-            return None
-        repository_name = lido_object.find(
-            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}repositoryWrap/{*}repositorySet/{*}repositoryName"
-        )
+        if config is None:
+            config = self.configuration["repository_name"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        repository_name = record.first(record.repository_names)
         if not self.has_subelems(repository_name):
             return [self.error.miss_info()]
         messages: list = []
@@ -1053,17 +2034,19 @@ class LIDOInspector(MetadataInspector):
             self.inspect_entity(
                 self.value(repository_name),
                 self.legal_body_id(repository_name),
-                self.configuration["repository_name"],
+                config,
             )
         )
         return messages if messages else None
 
-    def inspect_record_source(self, record_source) -> list:
+    def inspect_record_source(self, record_source, config: dict | None = None) -> list:
         """
         Inspect record source.
 
         :param record_source: XML element of supposed record source
         :type record_source: etree._Element
+        :param config: Configuration of the specific inspection, the configuration of the record sources if None
+        :type config: dict | None
         :return: List of error messages
         :rtype: list
         """
@@ -1072,68 +2055,78 @@ class LIDOInspector(MetadataInspector):
         return self.inspect_entity(
             self.value(record_source),
             self.legal_body_id(record_source),
-            self.configuration["record_source"],
+            self.configuration["record_source"] if config is None else config,
         )
 
-    def inspect_record_sources(self, lido_object) -> list | None:
+    def inspect_record_sources(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect record sources.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["record_source"]["inspect"]:
-            return None
-        record_sources = lido_object.findall(
-            "{*}administrativeMetadata/{*}recordWrap/{*}recordSource"
-        )
+        if config is None:
+            config = self.configuration["record_source"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        record_sources: list = record.record_sources
         if not record_sources:
             return [self.error.miss_info()]
         messages: list = []
         for record_source in record_sources:
-            messages.extend(self.inspect_record_source(record_source))
+            messages.extend(self.inspect_record_source(record_source, config))
         return messages if messages else None
 
-    def inspect_record_rights(self, lido_object) -> list | None:
+    def inspect_record_rights(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect record rights.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["record_rights"]["inspect"]:
-            return None
-        return self.inspect_concepts(
-            lido_object.findall(
-                "{*}administrativeMetadata/{*}recordWrap/{*}recordRights/{*}rightsType"
-            ),
-            self.configuration["record_rights"],
-        )
+        if config is None:
+            config = self.configuration["record_rights"]
+            if not config["inspect"]:
+                return None
+        record: LIDORecord = self.lido_record(lido_object)
+        return self.inspect_concepts(record.record_rights, config)
 
-    def inspect_record_info_set(self, lido_object) -> list | None:
+    def inspect_record_info_set(
+        self, lido_object, config: dict | None = None
+    ) -> list | None:
         """
         Inspect record information.
 
-        :param lido_object: Record of an object in LIDO-XML
-        :type lido_object: etree._Element
-        :return: List of error messages, None if there are no errors
+        :param lido_object: Record of an object in LIDO-XML or its extracted fields
+        :type lido_object: etree._Element | LIDORecord
+        :param config: Compiled configuration of the setting (see compile_configuration), the configuration of the setting if None
+        :type config: dict | None
+        :return: List of error messages, None if there are no errors or the setting is not inspected
         :rtype: list | None
         """
-        if not self.configuration["record_info"]["inspect"]:
+        if config is None and not self.configuration["record_info"]["inspect"]:
             return None
-        record_info_set = lido_object.find(
-            "{*}administrativeMetadata/{*}recordWrap/{*}recordInfoSet"
-        )
+        record: LIDORecord = self.lido_record(lido_object)
+        record_info_set = record.first(record.record_info_sets)
         if not self.has_subelems(record_info_set):
             return [self.error.miss_info()]
         messages: list = []
-        if not self.has_text(record_info_set.find("{*}recordInfoLink")):
+        if not self.has_text(self.child(record_info_set, "recordInfoLink")):
             messages.append(self.error.miss_link())
-        if not self.has_text(record_info_set.find("{*}recordMetadataDate")):
+        if not self.has_text(self.child(record_info_set, "recordMetadataDate")):
             messages.append(
                 self.error.miss_date("http://terminology.lido-schema.org/lido00472")
             )
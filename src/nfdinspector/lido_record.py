@@ -0,0 +1,219 @@
+from .metadata_inspector import MetadataInspector
+
+
+class LIDORecord:
+    """
+    Fields of a LIDO record that are inspected by LIDOInspector.
+
+    Every field is a list of the matching elements in document order, like with findall and
+    the wildcard namespace {*}. The namespace shared by the elements of the record is
+    detected once per document by LIDOInspector and passed in. If it is known, all fields
+    are extracted with a single XPath bound to it, which is the union of the paths of the
+    fields, and the matches are sorted into the fields by local name. Otherwise the children
+    of every element on the paths are grouped by local name once, so shared path prefixes
+    like descriptiveMetadata/objectIdentificationWrap are only walked once per record.
+    """
+
+    __slots__ = (
+        "lido_object",
+        "namespace",
+        "lido_rec_ids",
+        "categories",
+        "work_ids",
+        "repository_names",
+        "title_sets",
+        "description_sets",
+        "measurements_sets",
+        "object_work_types",
+        "classifications",
+        "events",
+        "subject_concepts",
+        "materials_tech",
+        "record_types",
+        "record_sources",
+        "record_rights",
+        "record_info_sets",
+        "resource_sets",
+    )
+
+    paths: tuple = (
+        ("lido_rec_ids", "{*}lidoRecID"),
+        ("categories", "{*}category"),
+        (
+            "work_ids",
+            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}repositoryWrap/{*}repositorySet/{*}workID",
+        ),
+        (
+            "repository_names",
+            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}repositoryWrap/{*}repositorySet/{*}repositoryName",
+        ),
+        (
+            "title_sets",
+            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}titleWrap/{*}titleSet",
+        ),
+        (
+            "description_sets",
+            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}objectDescriptionWrap/{*}objectDescriptionSet",
+        ),
+        (
+            "measurements_sets",
+            "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}objectMeasurementsWrap/{*}objectMeasurementsSet/{*}objectMeasurements/{*}measurementsSet",
+        ),
+        (
+            "object_work_types",
+            "{*}descriptiveMetadata/{*}objectClassificationWrap/{*}objectWorkTypeWrap/{*}objectWorkType",
+        ),
+        (
+            "classifications",
+            "{*}descriptiveMetadata/{*}objectClassificationWrap/{*}classificationWrap/{*}classification",
+        ),
+        ("events", "{*}descriptiveMetadata/{*}eventWrap/{*}eventSet/{*}event"),
+        (
+            "subject_concepts",
+            "{*}descriptiveMetadata/{*}objectRelationWrap/{*}subjectWrap/{*}subjectSet/{*}subject/{*}subjectConcept",
+        ),
+        ("materials_tech", ".//{*}materialsTech/{*}termMaterialsTech"),
+        ("record_types", "{*}administrativeMetadata/{*}recordWrap/{*}recordType"),
+        ("record_sources", "{*}administrativeMetadata/{*}recordWrap/{*}recordSource"),
+        (
+            "record_rights",
+            "{*}administrativeMetadata/{*}recordWrap/{*}recordRights/{*}rightsType",
+        ),
+        (
+            "record_info_sets",
+            "{*}administrativeMetadata/{*}recordWrap/{*}recordInfoSet",
+        ),
+        ("resource_sets", "{*}administrativeMetadata/{*}resourceWrap/{*}resourceSet"),
+    )
+    _fields: dict = {path[path.rfind("}") + 1 :]: field for field, path in paths}
+    _union: str = " | ".join(path for _, path in paths)
+
+    def __init__(self, lido_object, namespace: str | None = None) -> None:
+        """
+        Extract the fields of a LIDO record.
+
+        :param lido_object: Record of an object in LIDO-XML
+        :type lido_object: etree._Element
+        :param namespace: Namespace shared by all elements of the record ('' for none), None if unknown or mixed, then the wildcard paths are used
+        :type namespace: str | None
+        """
+        self.lido_object = lido_object
+        self.namespace: str | None = namespace
+        if namespace is None:
+            self.group_fields(lido_object)
+            return
+        fields: dict = {field: [] for field, _ in self.paths}
+        for element in MetadataInspector.compiled_path(self._union, namespace)(
+            lido_object
+        ):
+            tag: str = element.tag
+            fields[self._fields[tag[tag.rfind("}") + 1 :]]].append(element)
+        for field, elements in fields.items():
+            setattr(self, field, elements)
+
+    def group_fields(self, lido_object) -> None:
+        """
+        Extract the fields of a LIDO record by grouping the children on their paths by local name.
+
+        :param lido_object: Record of an object in LIDO-XML
+        :type lido_object: etree._Element
+        """
+        lido: dict = self.children([lido_object])
+        descriptive: dict = self.children(lido.get("descriptiveMetadata", []))
+        identification: dict = self.children(
+            descriptive.get("objectIdentificationWrap", [])
+        )
+        classification: dict = self.children(
+            descriptive.get("objectClassificationWrap", [])
+        )
+        repository_set: dict = self.path(
+            identification, "repositoryWrap", "repositorySet"
+        )
+        administrative: dict = self.children(lido.get("administrativeMetadata", []))
+        record_wrap: dict = self.children(administrative.get("recordWrap", []))
+        self.lido_rec_ids: list = lido.get("lidoRecID", [])
+        self.categories: list = lido.get("category", [])
+        self.work_ids: list = repository_set.get("workID", [])
+        self.repository_names: list = repository_set.get("repositoryName", [])
+        self.title_sets: list = self.path(identification, "titleWrap").get(
+            "titleSet", []
+        )
+        self.description_sets: list = self.path(
+            identification, "objectDescriptionWrap"
+        ).get("objectDescriptionSet", [])
+        self.measurements_sets: list = self.path(
+            identification,
+            "objectMeasurementsWrap",
+            "objectMeasurementsSet",
+            "objectMeasurements",
+        ).get("measurementsSet", [])
+        self.object_work_types: list = self.path(
+            classification, "objectWorkTypeWrap"
+        ).get("objectWorkType", [])
+        self.classifications: list = self.path(
+            classification, "classificationWrap"
+        ).get("classification", [])
+        self.events: list = self.path(descriptive, "eventWrap", "eventSet").get(
+            "event", []
+        )
+        self.subject_concepts: list = self.path(
+            descriptive, "objectRelationWrap", "subjectWrap", "subjectSet", "subject"
+        ).get("subjectConcept", [])
+        self.materials_tech: list = lido_object.findall(
+            ".//{*}materialsTech/{*}termMaterialsTech"
+        )
+        self.record_types: list = record_wrap.get("recordType", [])
+        self.record_sources: list = record_wrap.get("recordSource", [])
+        self.record_rights: list = self.path(record_wrap, "recordRights").get(
+            "rightsType", []
+        )
+        self.record_info_sets: list = record_wrap.get("recordInfoSet", [])
+        self.resource_sets: list = self.path(administrative, "resourceWrap").get(
+            "resourceSet", []
+        )
+
+    @staticmethod
+    def children(elements: list) -> dict:
+        """
+        Group the child elements of multiple elements by local name.
+
+        :param elements: XML elements
+        :type elements: list
+        :return: Lists of child elements in document order per local name
+        :rtype: dict
+        """
+        children: dict = {}
+        for element in elements:
+            for child in element:
+                tag = child.tag
+                if isinstance(tag, str):
+                    children.setdefault(tag[tag.rfind("}") + 1 :], []).append(child)
+        return children
+
+    @staticmethod
+    def path(children: dict, *names: str) -> dict:
+        """
+        Follow a path of local names and group the child elements at its end by local name.
+
+        :param children: Grouped child elements at the start of the path (see children)
+        :type children: dict
+        :param names: Local names of the path
+        :type names: str
+        :return: Lists of child elements in document order per local name
+        :rtype: dict
+        """
+        for name in names:
+            children = LIDORecord.children(children.get(name, []))
+        return children
+
+    @staticmethod
+    def first(elements: list):
+        """
+        Get the first of multiple elements like find.
+
+        :param elements: XML elements
+        :type elements: list
+        :return: First element, None if there are none
+        :rtype: etree._Element | None
+        """
+        return elements[0] if elements else None
@@ -2,14 +2,66 @@ import os
 import json
 import csv
 import re
+import bz2
+import calendar
+import gzip
+import hashlib
+import lzma
+import tarfile
+import zipfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from collections import deque
+from fnmatch import fnmatch
+from functools import lru_cache
+from itertools import chain, islice, repeat
+from types import MappingProxyType
 from lxml import etree
+from . import __version__
 from .error import Error
 
 
 class MetadataInspector:
     """Super class for various metadata standard-specific inspectors."""
 
+    xml_patterns: tuple = (
+        "*.xml",
+        "*.xml.gz",
+        "*.xml.bz2",
+        "*.xml.xz",
+        "*.zip",
+        "*.tar",
+        "*.tar.gz",
+        "*.tgz",
+        "*.tar.bz2",
+        "*.tar.xz",
+    )
+    tar_suffixes: tuple = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+    read_exceptions: tuple = (
+        OSError,
+        EOFError,
+        ValueError,
+        lzma.LZMAError,
+        tarfile.TarError,
+        zipfile.BadZipFile,
+        etree.LxmlError,
+    )
+    parser_options: dict = {
+        "remove_blank_text": True,
+        "ns_clean": True,
+        "huge_tree": False,
+        "resolve_entities": True,
+        "no_network": True,
+    }
+    _parser_pool = threading.local()
+    _compiled_paths: dict = {}
+    _partial_date = re.compile(r"(\d{4})(?:-(\d{2}))?")
+    _uniform_namespaces: dict = {}
+    attribute_namespaces: frozenset = frozenset(
+        {"http://www.w3.org/2001/XMLSchema-instance", "http://www.w3.org/1999/xlink"}
+    )
+
     def __init__(self, error_lang: str = "en") -> None:
         """
         Construct MetadataInspector with specific error language.
@@ -19,8 +71,13 @@ class MetadataInspector:
         """
         self._error = Error(error_lang)
         self._inspections: list = []
+        self._read_errors: list = []
         self._rdf_namespace: str = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
         self._xlink_namespace: str = "http://www.w3.org/1999/xlink"
+        self._namespace: str | None = None
+        self._patterns: MappingProxyType = MappingProxyType({})
+        self._configuration_digest: str = ""
+        self._cache = None
 
     @property
     def error(self) -> Error:
@@ -40,6 +97,15 @@ class MetadataInspector:
     def inspections(self, inspections: list) -> None:
         self._inspections = inspections
 
+    @property
+    def read_errors(self) -> list:
+        """Get or set the list of files that could not be read. The list contains tuples of file path and error message."""
+        return self._read_errors
+
+    @read_errors.setter
+    def read_errors(self, read_errors: list) -> None:
+        self._read_errors = read_errors
+
     @property
     def rdf_namespace(self) -> str:
         """Get the RDF namespace when needed for reading attributes."""
@@ -50,47 +116,741 @@ class MetadataInspector:
         """Get the XLINK namespace when needed for reading attributes."""
         return self._xlink_namespace
 
+    @property
+    def namespace(self) -> str | None:
+        """Get or set the namespace of the inspected elements ('' for none). Paths are bound to it, wildcard paths are used if None."""
+        return self._namespace
+
+    @namespace.setter
+    def namespace(self, namespace: str | None) -> None:
+        self._namespace = namespace
+
+    @property
+    def cache(self):
+        """Get or set the InspectionCache for reusing inspections of records with the same content, no caching if None."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache) -> None:
+        self._cache = cache
+
+    @property
+    def patterns(self) -> MappingProxyType:
+        """Get the compiled regular expressions of the configuration by pattern string (see compile_patterns)."""
+        return self._patterns
+
+    @staticmethod
+    def compile_pattern(pattern: str):
+        """
+        Compile a regular expression of the configuration.
+
+        :param pattern: Regular expression
+        :type pattern: str
+        :return: Compiled regular expression
+        :rtype: re.Pattern
+        :raises ValueError: If the regular expression is invalid
+        """
+        try:
+            return re.compile(pattern)
+        except (re.error, TypeError) as exception:
+            raise ValueError(f"invalid pattern {pattern!r}: {exception}") from None
+
+    @staticmethod
+    def compile_patterns(configuration: dict) -> MappingProxyType:
+        """
+        Compile all regular expressions of a configuration.
+
+        The regular expressions are the values of 'pattern' and 'patterns' settings at any
+        depth of the configuration. Empty patterns are not compiled, they match everything.
+
+        :param configuration: Configuration of an inspector
+        :type configuration: dict
+        :return: Read-only mapping of the compiled regular expressions by pattern string
+        :rtype: MappingProxyType
+        :raises ValueError: If a regular expression is invalid
+        """
+        patterns: dict = {}
+        settings: list = [configuration]
+        while settings:
+            for key, value in settings.pop().items():
+                if key == "pattern":
+                    values: list = [value]
+                elif key == "patterns":
+                    values = list(value.values())
+                elif isinstance(value, dict):
+                    settings.append(value)
+                    continue
+                else:
+                    continue
+                for pattern in values:
+                    if pattern and pattern not in patterns:
+                        patterns[pattern] = MetadataInspector.compile_pattern(pattern)
+        return MappingProxyType(patterns)
+
+    def pattern(self, pattern: str):
+        """
+        Get the compiled regular expression of a pattern string of the configuration.
+
+        Patterns changed after compiling the configuration are compiled on demand.
+
+        :param pattern: Regular expression
+        :type pattern: str
+        :return: Compiled regular expression
+        :rtype: re.Pattern
+        :raises ValueError: If the regular expression is invalid
+        """
+        compiled = self._patterns.get(pattern)
+        return self.compile_pattern(pattern) if compiled is None else compiled
+
+    def compile_setting(self, setting: dict) -> dict:
+        """
+        Copy a setting of the configuration with its regular expressions compiled.
+
+        The values of 'pattern' and 'patterns' are replaced by the compiled regular
+        expressions (see pattern), so the checks do not look them up per record. Empty
+        patterns are kept, they match everything.
+
+        :param setting: Setting of the configuration
+        :type setting: dict
+        :return: Copy of the setting with compiled regular expressions
+        :rtype: dict
+        :raises ValueError: If a regular expression is invalid
+        """
+        compiled: dict = dict(setting)
+        if compiled.get("pattern"):
+            compiled["pattern"] = self.pattern(compiled["pattern"])
+        if "patterns" in compiled:
+            compiled["patterns"] = {
+                key: self.pattern(value) if value else value
+                for key, value in compiled["patterns"].items()
+            }
+        return compiled
+
+    def matches(self, pattern, text: str) -> bool:
+        """
+        Check if a text matches a regular expression of the configuration completely.
+
+        Compiled regular expressions (see compile_setting) are used directly, pattern
+        strings are compiled on demand (see pattern).
+
+        :param pattern: Compiled regular expression or pattern string, empty patterns match everything
+        :type pattern: re.Pattern | str
+        :param text: Text that is checked
+        :type text: str
+        :return: True if the text matches, False if not
+        :rtype: bool
+        :raises ValueError: If the regular expression is invalid
+        """
+        if not pattern:
+            return True
+        if isinstance(pattern, str):
+            pattern = self.pattern(pattern)
+        return pattern.fullmatch(text) is not None
+
+    @staticmethod
+    def detect_namespace(element, exclude: str | None = None) -> str | None:
+        """
+        Detect the namespace shared by an element and all its descendants.
+
+        :param element: XML element
+        :type element: etree._Element
+        :param exclude: Local name of child elements whose subtrees are not checked (e.g. subordinate components)
+        :type exclude: str | None
+        :return: Namespace ('' for none), None if the elements belong to different namespaces
+        :rtype: str | None
+        """
+        namespace: str = etree.QName(element).namespace or ""
+        key: tuple = (namespace, exclude)
+        uniform = MetadataInspector._uniform_namespaces.get(key)
+        if uniform is None:
+            elements: str = (
+                "descendant-or-self::*"
+                if exclude is None
+                else f"(self::* | *[local-name() != '{exclude}']/descendant-or-self::*)"
+            )
+            test: str = "self::n:*" if namespace else "namespace-uri() = ''"
+            matching: str = (
+                "descendant-or-self::n:*"
+                if exclude is None and namespace
+                else f"{elements}[{test}]"
+            )
+            uniform = etree.XPath(
+                f"count({elements}) = count({matching})",
+                namespaces={"n": namespace} if namespace else None,
+            )
+            MetadataInspector._uniform_namespaces[key] = uniform
+        return namespace if uniform(element) else None
+
+    @staticmethod
+    def declared_namespace(element, declared, exclude: str | None = None) -> str | None:
+        """
+        Get the namespace shared by the elements of a streamed record from the namespaces declared in its document.
+
+        Elements can only belong to declared namespaces, so other elements than the ones of
+        the namespace of the record are only possible if other namespaces are declared,
+        apart from namespaces that only define attributes (see attribute_namespaces). The
+        record is not walked then. Unqualified elements inside qualified ones cannot be told
+        from the declarations, though, so otherwise the namespace is detected in the record
+        (see detect_namespace).
+
+        :param element: XML element of a streamed record
+        :type element: etree._Element
+        :param declared: Namespace URIs declared in the document so far (see iter_xml_file)
+        :type declared: Iterable[str]
+        :param exclude: Local name of child elements whose subtrees are not checked (see detect_namespace)
+        :type exclude: str | None
+        :return: Namespace ('' for none), None if other namespaces are declared or the elements of the record belong to different namespaces
+        :rtype: str | None
+        """
+        namespace: str = etree.QName(element).namespace or ""
+        for uri in declared:
+            if uri != namespace and uri not in MetadataInspector.attribute_namespaces:
+                return None
+        return MetadataInspector.detect_namespace(element, exclude)
+
+    @staticmethod
+    def compiled_path(path: str, namespace: str):
+        """
+        Get a path with wildcard namespaces like '{*}did/{*}unitid' as XPath bound to a namespace.
+
+        The compiled XPath objects are cached per path and namespace.
+
+        :param path: Path with wildcard namespaces
+        :type path: str
+        :param namespace: Namespace of the elements on the path ('' for none)
+        :type namespace: str
+        :return: Compiled XPath
+        :rtype: etree.XPath
+        """
+        key: tuple = (path, namespace)
+        compiled = MetadataInspector._compiled_paths.get(key)
+        if compiled is None:
+            xpath: str = path.replace("{*}*", "*").replace(
+                "{*}", "n:" if namespace else ""
+            )
+            compiled = etree.XPath(
+                xpath, namespaces={"n": namespace} if namespace else None
+            )
+            MetadataInspector._compiled_paths[key] = compiled
+        return compiled
+
+    def find(self, element, path: str):
+        """
+        Find the first element matching a path with wildcard namespaces like '{*}did/{*}unitid'.
+
+        If the namespace of the inspected elements is known, the compiled path bound to it is
+        used, otherwise the wildcard path.
+
+        :param element: XML element to start from
+        :type element: etree._Element
+        :param path: Path with wildcard namespaces
+        :type path: str
+        :return: First matching element, None if there is none
+        :rtype: etree._Element | None
+        """
+        if self._namespace is None:
+            return element.find(path)
+        compiled = MetadataInspector._compiled_paths.get((path, self._namespace))
+        if compiled is None:
+            compiled = self.compiled_path(path, self._namespace)
+        elements: list = compiled(element)
+        return elements[0] if elements else None
+
+    def child(self, element, name: str):
+        """
+        Find the first child element with a local name like find with the path '{*}name'.
+
+        If the namespace of the inspected elements is known, the children are compared with
+        the name in this namespace, which is faster than a compiled path for a single step.
+
+        :param element: XML element to start from
+        :type element: etree._Element
+        :param name: Local name of the child element
+        :type name: str
+        :return: First matching child element, None if there is none
+        :rtype: etree._Element | None
+        """
+        if self._namespace is None:
+            return element.find(f"{{*}}{name}")
+        tag: str = f"{{{self._namespace}}}{name}" if self._namespace else name
+        for child in element:
+            if child.tag == tag:
+                return child
+        return None
+
+    def findall(self, element, path: str) -> list:
+        """
+        Find all elements matching a path with wildcard namespaces like '{*}did/{*}unitdate' (see find).
+
+        :param element: XML element to start from
+        :type element: etree._Element
+        :param path: Path with wildcard namespaces
+        :type path: str
+        :return: Matching elements in document order
+        :rtype: list
+        """
+        if self._namespace is None:
+            return element.findall(path)
+        compiled = MetadataInspector._compiled_paths.get((path, self._namespace))
+        if compiled is None:
+            compiled = self.compiled_path(path, self._namespace)
+        return compiled(element)
+
     @staticmethod
-    def read_xml(xml_str: str):
+    def configure_parser(options: dict) -> None:
         """
-        Parse XML from a string.
+        Alter the default options of the XML parsers.
 
-        :param xml_str: String with XML syntax
-        :type xml_str: str
+        The options apply to all inspectors and are passed on to worker processes.
+
+        :param options: Parser options (remove_blank_text, ns_clean, huge_tree, resolve_entities, no_network)
+        :type options: dict
+        """
+        unknown: set = set(options) - set(MetadataInspector.parser_options)
+        if unknown:
+            raise ValueError(f"unknown parser options: {', '.join(sorted(unknown))}")
+        MetadataInspector.parser_options = {
+            **MetadataInspector.parser_options,
+            **options,
+        }
+
+    @staticmethod
+    def xml_parser(parser_options: dict | None = None):
+        """
+        Get a reusable XML parser.
+
+        Creating a parser is expensive compared to parsing a small record, so the parsers are
+        pooled per thread and per set of options. A parser must not be shared between threads.
+
+        :param parser_options: Parser options, the default options (see configure_parser) if None
+        :type parser_options: dict | None
+        :return: XML parser of the current thread
+        :rtype: etree.XMLParser
+        """
+        options: dict = (
+            MetadataInspector.parser_options
+            if parser_options is None
+            else {**MetadataInspector.parser_options, **parser_options}
+        )
+        pool = MetadataInspector._parser_pool.__dict__.setdefault("parsers", {})
+        key: tuple = tuple(options.items())
+        if key not in pool:
+            pool[key] = etree.XMLParser(**options)
+        return pool[key]
+
+    @staticmethod
+    def read_xml(xml_str):
+        """
+        Parse XML from a string, a bytes-like object or a binary file object.
+
+        Bytes, memoryviews and file objects are passed to the parser as they are, so raw
+        payloads do not need to be decoded first. The encoding is taken from the XML
+        declaration in this case.
+
+        :param xml_str: String, bytes or memoryview with XML syntax or binary file object
+        :type xml_str: str | bytes | memoryview | BinaryIO
         :return: Root element of an ElementTree
         :rtype: etree._Element
         """
-        parser = etree.XMLParser(remove_blank_text=True, ns_clean=True)
+        parser = MetadataInspector.xml_parser()
+        if hasattr(xml_str, "read"):
+            return etree.parse(xml_str, parser).getroot()
         return etree.fromstring(xml_str, parser)
 
+    @staticmethod
+    def open_xml_sources(file_path: str):
+        """
+        Open all XML documents in a file for parsing.
+
+        Plain files are passed on as path. Compressed files (.gz, .bz2, .xz) are decompressed
+        while reading, and the XML members of archives (.zip, .tar, .tar.gz, .tgz, .tar.bz2,
+        .tar.xz) are read directly from the archive, so no temporary files are needed.
+        Every source must be parsed before the next one is requested.
+
+        :param file_path: File path to a XML file, compressed XML file or archive
+        :type file_path: str
+        :return: Generator of tuples of document name and source (file path or binary stream)
+        :rtype: Iterator[tuple]
+        """
+        name: str = file_path.lower()
+        if name.endswith(MetadataInspector.tar_suffixes):
+            with tarfile.open(file_path, "r|*") as archive:
+                for member in archive:
+                    if member.isfile() and fnmatch(member.name, "*.xml"):
+                        yield f"{file_path}/{member.name}", archive.extractfile(member)
+        elif name.endswith(".zip"):
+            with zipfile.ZipFile(file_path) as archive:
+                for member in archive.infolist():
+                    if not member.is_dir() and fnmatch(member.filename, "*.xml"):
+                        with archive.open(member) as stream:
+                            yield f"{file_path}/{member.filename}", stream
+        elif name.endswith((".gz", ".bz2", ".xz")):
+            opener = {"gz": gzip.open, "bz2": bz2.open, "xz": lzma.open}[
+                name.rsplit(".", 1)[1]
+            ]
+            with opener(file_path, "rb") as stream:
+                yield file_path, stream
+        else:
+            yield file_path, file_path
+
+    @staticmethod
+    def iter_xml_documents(file_path: str, parser_options: dict | None = None):
+        """
+        Parse all XML documents in a file.
+
+        :param file_path: File path to a XML file, compressed XML file or archive
+        :type file_path: str
+        :param parser_options: Parser options, the default options (see configure_parser) if None
+        :type parser_options: dict | None
+        :return: Generator of root elements
+        :rtype: Iterator[etree._Element]
+        """
+        parser = MetadataInspector.xml_parser(parser_options)
+        for _, source in MetadataInspector.open_xml_sources(file_path):
+            yield etree.parse(source, parser).getroot()
+
     @staticmethod
     def read_xml_file(file_path: str):
         """
         Parse XML from a file.
 
-        :param file_path: File path to a XML file
+        Compressed files and archives with a single XML document are read directly.
+
+        :param file_path: File path to a XML file, compressed XML file or archive
         :type file_path: str
         :return: Root element of an ElementTree
         :rtype: etree._Element
         """
-        parser = etree.XMLParser(remove_blank_text=True, ns_clean=True)
-        return etree.parse(file_path, parser).getroot()
+        roots = MetadataInspector.iter_xml_documents(file_path)
+        try:
+            root = next(roots, None)
+            if root is None:
+                raise ValueError(f"no XML document in {file_path}")
+            if next(roots, None) is not None:
+                raise ValueError(f"more than one XML document in {file_path}")
+        finally:
+            roots.close()
+        return root
+
+    @staticmethod
+    def iterparse(source, events: tuple, tag):
+        """
+        Parse XML incrementally.
+
+        :param source: File path to a XML file or binary stream (see open_xml_sources)
+        :type source: str | BinaryIO
+        :param events: Parser events to report ('start', 'end' and/or 'start-ns')
+        :type events: tuple
+        :param tag: Tag or sequence of tags of the reported elements (wildcards like '{*}lido' are allowed)
+        :type tag: str | tuple
+        :return: Iterator of events and XML elements
+        :rtype: Iterator[tuple]
+        """
+        options: dict = {
+            option: value
+            for option, value in MetadataInspector.parser_options.items()
+            if option != "ns_clean"
+        }
+        return etree.iterparse(source, events=events, tag=tag, **options)
+
+    @staticmethod
+    def iter_xml_file(file_path: str, tag: str, declared: list | None = None):
+        """
+        Parse XML from a file incrementally and yield all elements with a specific tag.
+
+        Preceding siblings are removed before an element is yielded and the element itself
+        is cleared as soon as the next element is requested, so the memory usage does not
+        grow with the file size. References to yielded elements must therefore not be kept.
+        All XML documents of compressed files and archives are parsed in turn.
+
+        :param file_path: File path to a XML file, compressed XML file or archive
+        :type file_path: str
+        :param tag: Tag of the yielded elements (wildcards like '{*}lido' are allowed)
+        :type tag: str
+        :param declared: List that is filled with the namespace URIs declared in the current document before an element is yielded (see declared_namespace)
+        :type declared: list | None
+        :return: Generator of XML elements
+        :rtype: Iterator[etree._Element]
+        """
+        events: tuple = ("end",) if declared is None else ("start-ns", "end")
+        for _, source in MetadataInspector.open_xml_sources(file_path):
+            if declared is not None:
+                declared.clear()
+            for event, element in MetadataInspector.iterparse(source, events, tag):
+                if event == "start-ns":
+                    declared.append(element[1])
+                    continue
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+                yield element
+                element.clear(keep_tail=True)
+
+    @staticmethod
+    def read_xml_records(
+        file_path: str,
+        record_tag: str | None = None,
+        parser_options: dict | None = None,
+    ) -> tuple:
+        """
+        Parse XML from a file and serialize its records.
+
+        Parsed trees cannot be passed between processes, so this is the unit of work for
+        reading files in a process pool. The namespace of every record is detected once per
+        document (see detect_namespace), since the records are parsed separately afterwards.
+        Errors are returned instead of raised.
+
+        :param file_path: File path to a XML file, compressed XML file or archive
+        :type file_path: str
+        :param record_tag: Tag of the records to extract, root elements are serialized if None
+        :type record_tag: str | None
+        :param parser_options: Parser options, the default options (see configure_parser) if None
+        :type parser_options: dict | None
+        :return: List of serialized records, list of the namespaces of their documents and error message (None if the file could be read)
+        :rtype: tuple
+        """
+        records: list = []
+        namespaces: list = []
+        try:
+            for root in MetadataInspector.iter_xml_documents(file_path, parser_options):
+                namespace: str | None = MetadataInspector.detect_namespace(root)
+                for record in [root] if record_tag is None else root.iter(record_tag):
+                    records.append(etree.tostring(record))
+                    namespaces.append(namespace)
+        except MetadataInspector.read_exceptions as exception:
+            return [], [], f"{exception}"
+        return records, namespaces, None
+
+    @staticmethod
+    def iter_xml_paths(
+        files_path: str,
+        include: tuple | None = None,
+        exclude: tuple = (),
+        recursive: bool = False,
+    ):
+        """
+        Yield the paths of XML files in a folder lazily.
+
+        The glob patterns are matched against the path relative to files_path
+        (e.g. 'export/*.xml'). Entries are yielded in sorted order per folder.
+
+        :param files_path: File path to a folder with XML files
+        :type files_path: str
+        :param include: Glob patterns of the files to yield, XML files and supported compressed files and archives if None
+        :type include: tuple | None
+        :param exclude: Glob patterns of files and folders to skip
+        :type exclude: tuple, default ()
+        :param recursive: Descend into subfolders
+        :type recursive: bool, default False
+        :return: Generator of file paths
+        :rtype: Iterator[str]
+        """
+        if include is None:
+            include = MetadataInspector.xml_patterns
+        folders: list = [(files_path, "")]
+        while folders:
+            folder, relative_folder = folders.pop()
+            with os.scandir(folder) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+            subfolders: list = []
+            for entry in entries:
+                relative_path: str = f"{relative_folder}{entry.name}"
+                if any(fnmatch(relative_path, pattern) for pattern in exclude):
+                    continue
+                if entry.is_dir():
+                    if recursive:
+                        subfolders.append((entry.path, f"{relative_path}/"))
+                elif any(fnmatch(relative_path, pattern) for pattern in include):
+                    yield entry.path
+            folders.extend(reversed(subfolders))
+
+    @staticmethod
+    def iter_xml_files(
+        files_path: str,
+        record_tag: str | None = None,
+        include: tuple | None = None,
+        exclude: tuple = (),
+        recursive: bool = False,
+        errors: list | None = None,
+    ):
+        """
+        Parse XML from multiple XML files in a folder lazily.
+
+        Only one file is parsed at a time, so the memory usage depends on the largest file
+        and not on the number of files.
+
+        :param files_path: File path to a folder with XML files
+        :type files_path: str
+        :param record_tag: Tag of the records to yield (e.g. '{*}lido'), root elements are yielded if None
+        :type record_tag: str | None
+        :param include: Glob patterns of the files to parse, XML files and supported compressed files and archives if None
+        :type include: tuple | None
+        :param exclude: Glob patterns of files and folders to skip
+        :type exclude: tuple, default ()
+        :param recursive: Descend into subfolders
+        :type recursive: bool, default False
+        :param errors: List for tuples of file path and error message of unreadable files, errors are raised if None
+        :type errors: list | None
+        :return: Generator of root elements or records
+        :rtype: Iterator[etree._Element]
+        """
+        for file_path in MetadataInspector.iter_xml_paths(
+            files_path, include, exclude, recursive
+        ):
+            try:
+                for root in MetadataInspector.iter_xml_documents(file_path):
+                    if record_tag is None:
+                        yield root
+                    else:
+                        yield from root.iter(record_tag)
+            except MetadataInspector.read_exceptions as exception:
+                if errors is None:
+                    raise
+                errors.append((file_path, f"{exception}"))
 
     @staticmethod
-    def read_xml_files(files_path: str) -> list:
+    def read_xml_files(
+        files_path: str,
+        workers: int | None = None,
+        record_tag: str | None = None,
+        errors: list | None = None,
+        include: tuple | None = None,
+        exclude: tuple = (),
+        recursive: bool = False,
+        namespaces: dict | None = None,
+    ) -> list:
         """
         Parse XML from multiple XML files in a folder.
 
+        With workers, the files are parsed in a process pool and the records are extracted
+        there. The order of the results follows the sorted file paths in both cases.
+        Use iter_xml_files to avoid holding all parsed files at once.
+
         :param file_path: File path to a folder with XML files
         :type file_path: str
-        :return: List of root elements of multiple ElementTrees
+        :param workers: Number of worker processes, the files are parsed sequentially if None
+        :type workers: int | None
+        :param record_tag: Tag of the records to extract (e.g. '{*}lido'), root elements are returned if None
+        :type record_tag: str | None
+        :param errors: List for tuples of file path and error message of unreadable files, errors are raised if None
+        :type errors: list | None
+        :param include: Glob patterns of the files to parse, XML files and supported compressed files and archives if None
+        :type include: tuple | None
+        :param exclude: Glob patterns of files and folders to skip
+        :type exclude: tuple, default ()
+        :param recursive: Descend into subfolders
+        :type recursive: bool, default False
+        :param namespaces: Dict that is filled with the namespaces of the documents of records parsed separately with workers (see collect_xml_records)
+        :type namespaces: dict | None
+        :return: List of root elements of multiple ElementTrees or of the extracted records
         :rtype: list
         """
-        return [
-            MetadataInspector.read_xml_file(f"{files_path}/{file_name}")
-            for file_name in os.listdir(files_path)
-            if file_name.endswith(".xml")
-        ]
+        if workers is None:
+            return list(
+                MetadataInspector.iter_xml_files(
+                    files_path, record_tag, include, exclude, recursive, errors
+                )
+            )
+        file_paths: list = list(
+            MetadataInspector.iter_xml_paths(files_path, include, exclude, recursive)
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                MetadataInspector.read_xml_records,
+                file_paths,
+                repeat(record_tag),
+                repeat(MetadataInspector.parser_options),
+                chunksize=max(1, len(file_paths) // (workers * 4)),
+            )
+            return MetadataInspector.collect_xml_records(
+                file_paths, results, errors, namespaces
+            )
+
+    @staticmethod
+    def map_ordered(executor, function, items, chunksize: int = 1, buffersize: int = 1):
+        """
+        Map a function over items in a process pool and yield the results in order.
+
+        Unlike Executor.map, the items are submitted lazily in chunks and at most buffersize
+        chunks are in flight, so the first results are yielded before all items have been
+        submitted and the memory usage does not grow with the number of items. Chunks not
+        yet started are cancelled if the generator is closed early.
+
+        :param executor: Process pool
+        :type executor: concurrent.futures.ProcessPoolExecutor
+        :param function: Picklable function of one item
+        :type function: Callable
+        :param items: Picklable items
+        :type items: Iterable
+        :param chunksize: Number of items per task
+        :type chunksize: int, default 1
+        :param buffersize: Maximum number of chunks in flight
+        :type buffersize: int, default 1
+        :return: Generator of the results in the order of the items
+        :rtype: Iterator
+        """
+        items = iter(items)
+        futures: deque = deque()
+        try:
+            while True:
+                while len(futures) < buffersize:
+                    chunk: list = list(islice(items, chunksize))
+                    if not chunk:
+                        break
+                    futures.append(
+                        executor.submit(MetadataInspector.map_chunk, function, chunk)
+                    )
+                if not futures:
+                    return
+                yield from futures.popleft().result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    @staticmethod
+    def map_chunk(function, chunk: list) -> list:
+        """
+        Apply a function to a chunk of items in a worker process (see map_ordered).
+
+        :param function: Function of one item
+        :type function: Callable
+        :param chunk: Items
+        :type chunk: list
+        :return: Results in the order of the items
+        :rtype: list
+        """
+        return [function(item) for item in chunk]
+
+    @staticmethod
+    def collect_xml_records(
+        file_paths: list, results, errors: list | None, namespaces: dict | None = None
+    ) -> list:
+        """
+        Parse the serialized records of multiple XML files.
+
+        :param file_paths: File paths to XML files
+        :type file_paths: list
+        :param results: Results of read_xml_records in the order of file_paths
+        :type results: Iterable[tuple]
+        :param errors: List for tuples of file path and error message of unreadable files, errors are raised if None
+        :type errors: list | None
+        :param namespaces: Dict that is filled with the namespace of the document of every parsed record
+        :type namespaces: dict | None
+        :return: List of parsed records
+        :rtype: list
+        """
+        elements: list = []
+        for file_path, (records, record_namespaces, error) in zip(file_paths, results):
+            if error is not None:
+                if errors is None:
+                    raise OSError(f"{file_path}: {error}")
+                errors.append((file_path, error))
+                continue
+            for record, namespace in zip(records, record_namespaces):
+                element = MetadataInspector.read_xml(record)
+                if namespaces is not None:
+                    namespaces[element] = namespace
+                elements.append(element)
+        return elements
 
     def exists(self, element) -> bool:
         """
@@ -112,7 +872,7 @@ class MetadataInspector:
         :return: True if element has subelements, False if not
         :rtype: bool
         """
-        return True if self.exists(element) and len(element) else False
+        return element is not None and len(element) > 0
 
     def has_text(self, element) -> bool:
         """
@@ -123,11 +883,7 @@ class MetadataInspector:
         :return: True if element has text, False if not
         :rtype: bool
         """
-        return (
-            True
-            if self.exists(element) and element.text is not None and len(element.text)
-            else False
-        )
+        return element is not None and bool(element.text)
 
     def text(self, element) -> str:
         """
@@ -138,7 +894,7 @@ class MetadataInspector:
         :return: Text from an XML Element
         :rtype: str
         """
-        return element.text if self.has_text(element) else ""
+        return (element.text or "") if element is not None else ""
 
     def has_attribute(self, element, attribute_name: str) -> bool:
         """
@@ -195,7 +951,7 @@ class MetadataInspector:
         :type label: str
         :param entity_id: ID of an entity
         :type entity_id: str
-        :param config: Configuration of the specific inspection.
+        :param config: Configuration of the specific inspection, its patterns may be compiled (see compile_setting)
         :type config: dict
         :return: List of error messages
         :rtype: list
@@ -207,13 +963,10 @@ class MetadataInspector:
             messages.append(self.error.miss_ref(label))
         if "patterns" not in config:
             return messages
-        if config["patterns"]["label"] and not re.fullmatch(
-            rf"{config['patterns']['label']}", label
-        ):
+        patterns: dict = config["patterns"]
+        if not self.matches(patterns["label"], label):
             messages.append(self.error.pattern(label))
-        if config["patterns"]["ref"] and not re.fullmatch(
-            rf"{config['patterns']['ref']}", entity_id
-        ):
+        if not self.matches(patterns["ref"], entity_id):
             messages.append(self.error.pattern(entity_id))
         return messages
 
@@ -232,19 +985,73 @@ class MetadataInspector:
             return None
         return date_obj
 
-    def date_range(self, date_str: str) -> dict:
+    @staticmethod
+    def date_bound(date_str: str, latest: bool = False):
+        """
+        Get the first or last day of a date string (ISO 8601) with the precision of a day, a month or a year.
+
+        :param date_str: Date string like '1900-05-01', '1900-05' or '1900'
+        :type date_str: str
+        :param latest: Get the last day of the month or year instead of the first
+        :type latest: bool, default False
+        :return: Date object if valid ISO 8601 format, None if not valid
+        :rtype: datetime.date | None
+        """
+        match = MetadataInspector._partial_date.fullmatch(date_str)
+        try:
+            if match is None:
+                return date.fromisoformat(date_str)
+            year: int = int(match[1])
+            month: int = int(match[2]) if match[2] else 12 if latest else 1
+            day: int = calendar.monthrange(year, month)[1] if latest else 1
+            return date(year, month, day)
+        except ValueError:
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def date_bounds(date_str: str, starts: bool = False) -> tuple:
+        """
+        Get the earliest and latest date of a date string or interval (ISO 8601).
+
+        Dates with the precision of a month or a year span the whole month or year. Intervals
+        can be open at either end ('1900/..' or '1900/'), the open end is None then. The
+        results are cached, since records repeat the same dates many times.
+
+        :param date_str: Date string or interval of two date strings separated by '/'
+        :type date_str: str
+        :param starts: Get the first day of the latest date instead of the last, which compares the latest date with a day at its own precision
+        :type starts: bool, default False
+        :return: Tuple of the earliest and latest date, both None if a date is not valid
+        :rtype: tuple
+        """
+        parts: list = date_str.split("/")
+        if len(parts) > 2:
+            return None, None
+        bounds: list = []
+        for part, latest in zip((parts[0], parts[-1]), (False, True)):
+            if len(parts) == 2 and part in ("", ".."):
+                bounds.append(None)
+                continue
+            bound = MetadataInspector.date_bound(part, latest and not starts)
+            if bound is None:
+                return None, None
+            bounds.append(bound)
+        return tuple(bounds)
+
+    def date_range(self, date_str: str, starts: bool = False) -> dict:
         """
-        Split a date to earliest and latest date.
+        Split a date to earliest and latest date (see date_bounds).
 
         :param date_str: Date string (ISO 8601)
         :type date_str: str
+        :param starts: Get the first day of the latest date instead of the last
+        :type starts: bool, default False
         :return: Dict with date objects where earliest and latest date are separated
         :rtype: dict
         """
-        return {
-            "earliest_date": self.date_object(date_str.split("/")[0]),
-            "latest_date": self.date_object(date_str.split("/")[-1]),
-        }
+        earliest, latest = self.date_bounds(date_str, starts)
+        return {"earliest_date": earliest, "latest_date": latest}
 
     def create_element(self, tag_name: str = "element", text: str = ""):
         """
@@ -261,31 +1068,160 @@ class MetadataInspector:
         element.text = text
         return element
 
-    def to_json(self, file_path: str, indent: int | str | None = None) -> None:
+    @staticmethod
+    def record_digest(element) -> str:
+        """
+        Get a digest of the canonical form (C14N) of an XML element.
+
+        Records with the same digest have the same content, regardless of attribute order,
+        quoting or namespace prefixes declared elsewhere in the document.
+
+        :param element: XML element
+        :type element: etree._Element
+        :return: Hexadecimal BLAKE2b digest of 16 bytes
+        :rtype: str
+        """
+        return hashlib.blake2b(
+            etree.tostring(element, method="c14n", with_tail=False), digest_size=16
+        ).hexdigest()
+
+    def configuration_digest(self) -> str:
+        """
+        Get a digest of the configuration of the inspector.
+
+        :return: Hexadecimal BLAKE2b digest of 16 bytes
+        :rtype: str
+        """
+        return hashlib.blake2b(
+            json.dumps(self.configuration, sort_keys=True).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def cache_key(self, digest: str) -> tuple:
+        """
+        Get the key of the inspection of a record in the InspectionCache.
+
+        :param digest: Digest of the record (see record_digest)
+        :type digest: str
+        :return: Record digest, configuration digest, error language and package version
+        :rtype: tuple
+        """
+        return (digest, self._configuration_digest, self.error.language, __version__)
+
+    def inspection_state_header(self) -> dict:
+        """
+        Get the header of an inspection state, which decides whether stored inspections can be reused.
+
+        :return: Package version, error language and configuration digest
+        :rtype: dict
+        """
+        return {
+            "version": __version__,
+            "error_lang": self.error.language,
+            "configuration": self.configuration_digest(),
+        }
+
+    def load_inspection_state(self, state_path: str) -> dict:
+        """
+        Load the stored inspections of an incremental inspection.
+
+        The inspections are only returned if they were made with the same package version,
+        error language and configuration.
+
+        :param state_path: File path to the JSON state file
+        :type state_path: str
+        :return: Lists of digest and inspection per record ID, empty if the file is missing or outdated
+        :rtype: dict
+        """
+        try:
+            with open(state_path, encoding="utf-8") as file:
+                state: dict = json.load(file)
+            if state["header"] != self.inspection_state_header():
+                return {}
+            return state["records"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def save_inspection_state(self, state_path: str, records: dict) -> None:
+        """
+        Save the inspections of an incremental inspection.
+
+        The file is replaced atomically, so an interrupted run leaves the previous state.
+
+        :param state_path: File path to the JSON state file
+        :type state_path: str
+        :param records: Lists of digest and inspection per record ID
+        :type records: dict
+        """
+        temp_path: str = f"{state_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"header": self.inspection_state_header(), "records": records},
+                file,
+                ensure_ascii=False,
+            )
+        os.replace(temp_path, state_path)
+
+    def to_json(
+        self, file_path: str, indent: int | str | None = None, inspections=None
+    ) -> None:
         """
         Generate a JSON file of the inspections.
 
+        The inspections are written one by one, so a generator like iter_inspections can be
+        written without keeping all inspections in memory.
+
         :param file_path: File path for the JSON file
         :type file_path: str
         :param indent: Indent level of the JSON file
         :type indent: int | str | None
+        :param inspections: Inspections to write, the inspections of the inspector if None
+        :type inspections: Iterable[dict] | None
         """
+        if inspections is None:
+            inspections = self.inspections
+        if indent is None:
+            separator, prefix, end = ", ", "", ""
+        else:
+            prefix = " " * indent if isinstance(indent, int) else indent
+            separator, end = ",\n", "\n"
         with open(file_path, "w", encoding="utf-8") as outfile:
-            json.dump(self.inspections, outfile, indent=indent, ensure_ascii=False)
+            outfile.write("[")
+            empty: bool = True
+            for inspection in inspections:
+                outfile.write(end if empty else separator)
+                empty = False
+                outfile.write(
+                    prefix
+                    + json.dumps(inspection, indent=indent, ensure_ascii=False).replace(
+                        "\n", "\n" + prefix
+                    )
+                )
+            outfile.write("]" if empty else end + "]")
 
-    def to_csv(self, file_path: str, delimiter: str = ",") -> None:
+    def to_csv(self, file_path: str, delimiter: str = ",", inspections=None) -> None:
         """
         Generate a CSV file of the inspections.
 
+        The columns are the keys of the first inspection. The inspections are written one by
+        one, so a generator like iter_inspections can be written without keeping all
+        inspections in memory.
+
         :param file_path: File path for the CSV file
         :type file_path: str
         :param delimiter: Delimiter for the columns in the CSV file
         :type delimiter: str
+        :param inspections: Inspections to write, the inspections of the inspector if None
+        :type inspections: Iterable[dict] | None
         """
+        inspections = iter(self.inspections if inspections is None else inspections)
+        first: dict | None = next(inspections, None)
         with open(file_path, "w", newline="", encoding="utf-8") as outfile:
+            if first is None:
+                return
             writer = csv.DictWriter(
-                outfile, fieldnames=self.inspections[0].keys(), delimiter=delimiter
+                outfile, fieldnames=first.keys(), delimiter=delimiter
             )
             if writer.fieldnames:
                 writer.writeheader()
-            writer.writerows(self.inspections)
+            writer.writerows(chain([first], inspections))
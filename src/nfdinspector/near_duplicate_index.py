@@ -0,0 +1,253 @@
+import re
+import zlib
+from array import array
+from .duplicate_index import DuplicateIndex
+
+
+class NearDuplicateIndex:
+    """
+    MinHash index with locality-sensitive hashing for finding near duplicate texts.
+
+    Texts are normalized (case, punctuation and blanks are ignored) and split into overlapping
+    character shingles. Every text gets a MinHash signature of bands times rows values, so
+    the share of equal values estimates the Jaccard similarity of the shingles of two texts.
+    The signature is computed with a single hash per shingle, which is assigned to one of
+    the values (one permutation hashing), so the cost grows with the length of the text and
+    not with the size of the signature. Only texts that have all values of at least one band
+    in common are compared, so the cost of adding a text does not grow with the number of
+    texts, as long as most texts are dissimilar.
+
+    Texts that are similar to a different text are near duplicates. Identical texts are not
+    near duplicates of each other (see DuplicateIndex), but texts that only differ in case,
+    punctuation or blanks are.
+
+    The texts are not kept, only their signatures and the digests of the normalized texts.
+    Every text is added with its record, and the text of a similar record is taken from the
+    record again when it becomes a near duplicate. Without a function for getting the text
+    of a record, the records are the texts themselves.
+    """
+
+    _non_word = re.compile(r"\W+")
+
+    def __init__(
+        self,
+        similarity: float = 0.8,
+        bands: int = 20,
+        rows: int = 6,
+        shingle_size: int = 5,
+        text=None,
+    ) -> None:
+        """
+        Construct NearDuplicateIndex.
+
+        The probability that two texts are compared is 1 - (1 - s ** rows) ** bands for a
+        similarity s, so more bands find more near duplicates and more rows compare less
+        dissimilar texts.
+
+        :param similarity: Minimum estimated Jaccard similarity of near duplicates
+        :type similarity: float, default 0.8
+        :param bands: Number of bands of the signatures
+        :type bands: int, default 20
+        :param rows: Number of values per band
+        :type rows: int, default 6
+        :param shingle_size: Number of characters per shingle
+        :type shingle_size: int, default 5
+        :param text: Function that gets the text of a record, the records are the texts if None
+        :type text: Callable | None, default None
+        :raises ValueError: If similarity is not between 0 and 1 or a number is not positive
+        """
+        if not 0 < similarity <= 1:
+            raise ValueError(f"similarity must be between 0 and 1: {similarity}")
+        if min(bands, rows, shingle_size) < 1:
+            raise ValueError(
+                f"bands, rows and shingle_size must be positive: {bands}, {rows}, {shingle_size}"
+            )
+        self._similarity: float = similarity
+        self._bands: int = bands
+        self._rows: int = rows
+        self._shingle_size: int = shingle_size
+        self._text = text
+        self._positions: dict = {}
+        self._records: list = []
+        self._near_positions: set = set()
+        self._signatures: list = []
+        self._buckets: list = [{} for _ in range(bands)]
+        self._near_duplicates: set = set()
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._near_duplicates
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def similarity(self) -> float:
+        """Get the minimum estimated Jaccard similarity of near duplicates."""
+        return self._similarity
+
+    @property
+    def bands(self) -> int:
+        """Get the number of bands of the signatures."""
+        return self._bands
+
+    @property
+    def rows(self) -> int:
+        """Get the number of values per band."""
+        return self._rows
+
+    @property
+    def near_duplicates(self) -> set:
+        """Get the set of near duplicate texts. The set is kept up to date by add."""
+        return self._near_duplicates
+
+    def normalize(self, text: str) -> str:
+        """
+        Normalize a text for comparing it.
+
+        :param text: Text to normalize
+        :type text: str
+        :return: Text in lower case without punctuation and with single blanks
+        :rtype: str
+        """
+        return self._non_word.sub(" ", text.lower()).strip()
+
+    def signature(self, normalized: str) -> array:
+        """
+        Get the MinHash signature of a normalized text.
+
+        Every shingle is hashed once and its hash is kept as the value of one of the
+        positions of the signature, if it is the minimum there. Empty positions take the
+        value of the next position with a value, offset by the distance, so equal shingles
+        still lead to equal values.
+
+        :param normalized: Normalized text (see normalize)
+        :type normalized: str
+        :return: bands times rows values
+        :rtype: array
+        """
+        size: int = self._bands * self._rows
+        encoded: bytes = normalized.encode("utf-8")
+        shingle_size: int = self._shingle_size
+        crc32 = zlib.crc32
+        values: list = [None] * size
+        for value in {
+            crc32(encoded[start : start + shingle_size])
+            for start in range(max(1, len(encoded) - shingle_size + 1))
+        }:
+            value = (value * 0x9E3779B1) & 0xFFFFFFFF
+            position, value = value % size, value // size
+            current: int | None = values[position]
+            if current is None or value < current:
+                values[position] = value
+        for position in range(size):
+            if values[position] is not None:
+                continue
+            for distance in range(1, size):
+                value = values[(position + distance) % size]
+                if value is not None:
+                    values[position] = value + (distance << 32)
+                    break
+        return array("Q", values)
+
+    def record_text(self, position: int) -> str:
+        """
+        Get the text of an added record.
+
+        :param position: Number of the record in the order of adding
+        :type position: int
+        :return: Text of the record
+        :rtype: str
+        """
+        record = self._records[position]
+        return record if self._text is None else self._text(record)
+
+    def estimate(self, signature: array, other: array) -> float:
+        """
+        Estimate the Jaccard similarity of two texts from their signatures.
+
+        :param signature: Signature of a text (see signature)
+        :type signature: array
+        :param other: Signature of another text
+        :type other: array
+        :return: Share of equal values
+        :rtype: float
+        """
+        return sum(map(int.__eq__, signature, other)) / len(signature)
+
+    def add(self, text: str, record=None) -> set:
+        """
+        Add a text and find its near duplicates.
+
+        :param text: Text to add, ignored if it has no words
+        :type text: str
+        :param record: Record of the text, which is kept instead of the text if the index has a function for getting the text of a record
+        :type record: Any, default None
+        :return: Texts that have become near duplicates
+        :rtype: set
+        """
+        normalized: str = self.normalize(text)
+        if not normalized or text in self._near_duplicates:
+            return set()
+        digest: bytes = DuplicateIndex.digest(normalized)
+        position: int | None = self._positions.get(digest)
+        if position is not None:
+            other: str = self.record_text(position)
+            if other == text:
+                return set()
+            changed: set = {text, other} - self._near_duplicates
+            self._near_duplicates.update(changed)
+            self._near_positions.add(position)
+            return changed
+        signature: array = self.signature(normalized)
+        position = len(self._records)
+        candidates: set = set()
+        for band, buckets in enumerate(self._buckets):
+            key: int = hash(
+                tuple(signature[band * self._rows : (band + 1) * self._rows])
+            )
+            bucket: list | None = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [position]
+            else:
+                candidates.update(bucket)
+                bucket.append(position)
+        changed = set()
+        for candidate in candidates:
+            near: bool = candidate in self._near_positions
+            if text in changed and near:
+                continue
+            if (
+                self.estimate(signature, self._signatures[candidate])
+                >= self._similarity
+            ):
+                changed.add(text)
+                if not near:
+                    changed.add(self.record_text(candidate))
+                    self._near_positions.add(candidate)
+        if changed:
+            self._near_positions.add(position)
+        self._near_duplicates.update(changed)
+        self._positions[digest] = position
+        self._records.append(text if self._text is None else record)
+        self._signatures.append(signature)
+        return changed
+
+    def update(self, texts, records=None) -> set:
+        """
+        Add multiple texts and find their near duplicates.
+
+        :param texts: Texts to add
+        :type texts: Iterable[str]
+        :param records: Records of the texts in the same order (see add)
+        :type records: Iterable | None, default None
+        :return: Texts that have become near duplicates
+        :rtype: set
+        """
+        changed: set = set()
+        if records is None:
+            for text in texts:
+                changed.update(self.add(text))
+        else:
+            for text, record in zip(texts, records):
+                changed.update(self.add(text, record))
+        return changed
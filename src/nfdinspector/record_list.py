@@ -0,0 +1,72 @@
+class RecordList(list):
+    """
+    List of records that counts its changes.
+
+    Every method that changes the list increments version, so it can be found out whether
+    the list has been changed since an earlier look at it by comparing a single number
+    instead of all records (see LIDOInspector.discard_outdated_indexes).
+    """
+
+    _version: int = 0
+
+    def __init__(self, records=()) -> None:
+        """
+        Construct RecordList from records.
+
+        :param records: Records of the list
+        :type records: Iterable, default ()
+        """
+        super().__init__(records)
+
+    @property
+    def version(self) -> int:
+        """Get the number of changes of the list."""
+        return self._version
+
+    def __setitem__(self, index, value) -> None:
+        self._version += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index) -> None:
+        self._version += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, records):
+        self._version += 1
+        return super().__iadd__(records)
+
+    def __imul__(self, number: int):
+        self._version += 1
+        return super().__imul__(number)
+
+    def append(self, record) -> None:
+        self._version += 1
+        super().append(record)
+
+    def extend(self, records) -> None:
+        self._version += 1
+        super().extend(records)
+
+    def insert(self, index: int, record) -> None:
+        self._version += 1
+        super().insert(index, record)
+
+    def pop(self, index: int = -1):
+        self._version += 1
+        return super().pop(index)
+
+    def remove(self, record) -> None:
+        self._version += 1
+        super().remove(record)
+
+    def clear(self) -> None:
+        self._version += 1
+        super().clear()
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        self._version += 1
+        super().sort(key=key, reverse=reverse)
+
+    def reverse(self) -> None:
+        self._version += 1
+        super().reverse()
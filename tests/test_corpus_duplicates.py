@@ -0,0 +1,52 @@
+import os
+import pytest
+from nfdinspector.corpus_duplicates import CorpusDuplicates
+
+
+class Test_CorpusDuplicates:
+
+    def test_merge(self, tmp_path):
+        corpus = CorpusDuplicates(str(tmp_path / "runs"), 2)
+        assert (
+            corpus.add_shard(
+                [(0, "a", 0), (1, "a", 0), (0, "b", 1), (0, "", 2), (0, "c", 3)]
+            )
+            == 0
+        )
+        assert (
+            corpus.add_shard([(0, "c", 0), (0, "", 1), (1, "b", 2), (0, "d", 3)]) == 1
+        )
+        assert corpus.add_shard([(0, "d", 0), (0, "d", 1)]) == 2
+        assert corpus.shards == 3
+        assert len(corpus.runs) == 5
+        assert all(os.path.exists(run) for run in corpus.runs)
+        assert corpus.duplicates(0) == {}
+        corpus.merge()
+        assert corpus.duplicates(0) == {0: {3}}
+        assert corpus.duplicates(1) == {0: {0, 3}}
+        assert corpus.duplicates(2) == {0: {0, 1}}
+        assert corpus.duplicates(3) == {}
+        runs = corpus.runs
+        corpus.clear()
+        assert not any(os.path.exists(run) for run in runs)
+        assert corpus.shards == 0
+        assert corpus.duplicates(1) == {}
+        with pytest.raises(ValueError):
+            CorpusDuplicates(str(tmp_path), 0)
+        with pytest.raises(ValueError):
+            CorpusDuplicates(str(tmp_path), 1, 1)
+
+    def test_merge_passes(self, tmp_path):
+        corpus = CorpusDuplicates(str(tmp_path / "runs"), 1, 2)
+        assert corpus.fan_in == 2
+        corpus.add_shard([(0, "a", 0), (0, "b", 1), (0, "c", 2)])
+        corpus.add_shard([(0, "c", 0), (0, "d", 1), (0, "a", 2)])
+        runs = corpus.runs
+        assert len(runs) == 6
+        corpus.merge()
+        assert len(corpus.runs) == 2
+        assert not any(os.path.exists(run) for run in runs)
+        assert all(os.path.exists(run) for run in corpus.runs)
+        assert corpus.duplicates(0) == {0: {0, 2}}
+        assert corpus.duplicates(1) == {0: {0, 2}}
+        assert len(os.listdir(tmp_path / "runs")) == 2
@@ -0,0 +1,65 @@
+import pytest
+from datetime import date
+from nfdinspector.date_checks import DateChecks
+
+numpy = pytest.importorskip("numpy")
+
+
+class Test_DateChecks:
+
+    def test_checks(self):
+        checks = DateChecks(
+            [
+                (date(1900, 1, 1), date(1950, 12, 31)),
+                (None, None),
+                (date(1960, 1, 1), date(1950, 1, 1)),
+                (date(2999, 1, 1), None),
+                (None, date(1940, 1, 1)),
+            ],
+            [0, 0, 1, 2, 3],
+        )
+        assert len(checks) == 5
+        assert checks.missing().tolist() == [False, True, False, False, False]
+        assert checks.missing_earliest().tolist() == [False, True, False, False, True]
+        assert checks.missing_latest().tolist() == [False, True, False, True, False]
+        assert checks.future(date(2000, 1, 1)).tolist() == [
+            False,
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert checks.inverted().tolist() == [False, False, True, False, False]
+        assert checks.records(checks.missing_earliest()) == {0, 3}
+        assert checks.contained(
+            numpy.array([4, 1, 2, 0]), numpy.array([0, 0, 4, 3])
+        ).tolist() == [True, True, False, False]
+        assert checks.consistent([2, 2, 4], [4, 3, 0], [0, 0, 1], 3).tolist() == [
+            False,
+            True,
+            False,
+        ]
+
+    def test_future_starts(self):
+        checks = DateChecks(
+            [
+                (date(2000, 1, 1), date(2000, 12, 31)),
+                (date(2000, 10, 1), date(2000, 10, 31)),
+                (date(1900, 1, 1), date(2001, 12, 31)),
+                (date(2000, 12, 31), date(2000, 12, 31)),
+            ],
+            [0, 1, 2, 3],
+            [date(2000, 1, 1), date(2000, 10, 1), date(2001, 1, 1), date(2000, 12, 31)],
+        )
+        assert checks.future(date(2000, 10, 18)).tolist() == [
+            False,
+            False,
+            True,
+            True,
+        ]
+
+    def test_empty(self):
+        checks = DateChecks([], [])
+        assert len(checks) == 0
+        assert checks.records(checks.future()) == set()
+        assert checks.consistent([], [], [], 0).tolist() == []
@@ -0,0 +1,53 @@
+import pytest
+from nfdinspector.duplicate_index import DuplicateIndex
+
+
+class Test_DuplicateIndex:
+
+    def test_add_remove(self):
+        index = DuplicateIndex(["a", "b", "", ""])
+        assert len(index) == 2
+        assert index.count("") == 0
+        assert index.duplicates == set()
+        assert index.add("a") is True
+        assert index.add("a") is False
+        assert index.count("a") == 3
+        assert "a" in index
+        assert "b" not in index
+        assert index.remove("a") is False
+        assert index.remove("a") is True
+        assert "a" not in index
+        assert index.remove("a") is False
+        assert index.count("a") == 0
+        assert len(index) == 1
+        with pytest.raises(KeyError):
+            index.remove("a")
+
+    def test_update(self):
+        index = DuplicateIndex()
+        duplicates = index.duplicates
+        assert index.update(["a", "b", "a", "c"]) == {"a"}
+        assert index.update(["b", "c", "a"]) == {"b", "c"}
+        assert duplicates == {"a", "b", "c"}
+        assert index.difference_update(["a", "b", "b"]) == {"b"}
+        assert duplicates == {"a", "c"}
+        index.clear()
+        assert len(index) == 0
+        assert duplicates == set()
+
+    def test_hash_table(self):
+        index = DuplicateIndex()
+        assert len(DuplicateIndex.digest("ä")) == DuplicateIndex.digest_size
+        texts = [f"Text {number}" for number in range(1000)]
+        assert index.update(texts) == set()
+        assert index.update(texts[::2]) == set(texts[::2])
+        assert len(index) == 1000
+        assert all(index.count(text) == 2 for text in texts[::2])
+        assert all(index.count(text) == 1 for text in texts[1::2])
+        assert index.difference_update(texts[:500]) == set(texts[:500:2])
+        assert len(index) == 750
+        assert all(index.count(text) == 0 for text in texts[1:500:2])
+        assert all(index.count(text) == 1 for text in texts[:500:2])
+        assert index.duplicates == set(texts[500::2])
+        index.update(texts[1:500:2])
+        assert all(index.count(text) == 1 for text in texts[:500])
@@ -1,15 +1,323 @@
+import bz2
+import json
 import pytest
 from lxml import etree
 from datetime import date
 from nfdinspector.ead_inspector import EADInspector
+from nfdinspector.inspection_cache import InspectionCache
 
 
 def xml(xml_string):
     return etree.fromstring(xml_string)
 
 
+def ead_component(level, unitid, unitdate, *subcomponents):
+    return (
+        f"<c level='{level}' id='id_{unitid}'><did><unitid>{unitid}</unitid>"
+        f"<unittitle>Akte {unitid}</unittitle>"
+        f"<unitdate normal='{unitdate}'>{unitdate}</unitdate>"
+        "<physdesc><genreform normal='Akten'>Akten</genreform><extent>1</extent></physdesc>"
+        "<langmaterial><language langcode='ger'>Deutsch</language></langmaterial></did>"
+        + "".join(subcomponents)
+        + "</c>"
+    )
+
+
+def ead_corpus(rights_first=True, components=None):
+    rights = (
+        "<userestrict type='ead'><p><extref xlink:href='https://creativecommons.org/publicdomain/zero/1.0/'>"
+        "CC0</extref></p></userestrict>"
+    )
+    dsc = (
+        "<dsc>"
+        + ead_component(
+            "collection",
+            "1",
+            "1900/1950",
+            ead_component(
+                "series",
+                "1.1",
+                "1900/1920",
+                ead_component("file", "1.1.1", "1901/1905"),
+                ead_component("file", "1.1.2", "1960-01-01"),
+            ),
+            ead_component(
+                "series",
+                "1.2",
+                "1930-01-01/1950-12-31",
+                ead_component("file", "1.2.1", "1940-01-01/1955-01-01"),
+                ead_component("item", "1.2.2", "2999-01-01"),
+            ),
+        )
+        + ead_component("file", "2", "1980-01-01/1990-01-01")
+        + "</dsc>"
+    )
+    if components is not None:
+        dsc = f"<dsc>{components}</dsc>"
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?>\n"
+        "<ead xmlns='urn:isbn:1-931666-22-9' xmlns:xlink='http://www.w3.org/1999/xlink'>"
+        "<eadheader><eadid>1</eadid></eadheader><archdesc level='collection'><did><unittitle>Bestand</unittitle></did>"
+        + (rights + dsc if rights_first else dsc + rights)
+        + "</archdesc></ead>"
+    )
+
+
 class Test_EADInspector:
 
+    def test_inspect_ead_file(self, tmp_path):
+        for rights_first in [True, False]:
+            file_path = tmp_path / "ead.xml"
+            file_path.write_text(ead_corpus(rights_first), encoding="utf-8")
+            ei = EADInspector()
+            ei.read_ead_file(str(file_path))
+            ei.inspect()
+            expected = ei.inspections
+            ei = EADInspector()
+            ei.inspect_ead_file(str(file_path))
+            assert ei.inspections == expected
+            assert [inspection["id"] for inspection in ei.inspections] == [
+                "id_1",
+                "id_1.1",
+                "id_1.1.1",
+                "id_1.1.2",
+                "id_1.2",
+                "id_1.2.1",
+                "id_1.2.2",
+                "id_2",
+            ]
+            assert (
+                ei.error.inconsistent_date("1.1.2", "1960-01-01/1960-01-01")
+                in ei.inspections[0]["unitdate"]
+            )
+            assert ei.inspections[0]["userestrict"] is None
+        compressed_path = tmp_path / "ead.xml.bz2"
+        compressed_path.write_bytes(bz2.compress(file_path.read_bytes()))
+        ei = EADInspector()
+        ei.inspect_ead_file(str(compressed_path))
+        assert ei.inspections == expected
+
+    def test_inspect_ead_file_repeated_unitids(self, tmp_path):
+        file_path = tmp_path / "ead.xml"
+        file_path.write_text(
+            ead_corpus(
+                components=ead_component(
+                    "collection",
+                    "1",
+                    "1900/1950",
+                    ead_component("file", "A", "1905"),
+                    ead_component("file", "B", "1960"),
+                    ead_component("file", "A", "1970"),
+                    ead_component("file", "C", "1980"),
+                    ead_component("file", "C", "1990"),
+                )
+            ),
+            encoding="utf-8",
+        )
+        ei = EADInspector()
+        ei.read_ead_file(str(file_path))
+        ei.inspect()
+        expected = ei.inspections
+        ei = EADInspector()
+        ei.inspect_ead_file(str(file_path))
+        assert ei.inspections == expected
+        assert ei.inspections[0]["unitdate"] == [
+            ei.error.inconsistent_date("A", "1970-01-01/1970-12-31"),
+            ei.error.inconsistent_date("B", "1960-01-01/1960-12-31"),
+            ei.error.inconsistent_date("C", "1990-01-01/1990-12-31"),
+        ]
+
+    def test_inspect_workers(self):
+        ei = EADInspector()
+        ei.read_ead(ead_corpus().encode("utf-8"))
+        spine, frontier, _ = ei.partition_components(2)
+        assert spine == []
+        assert [ei.attr(c, "id") for c in frontier] == ["id_1", "id_2"]
+        spine, frontier, _ = ei.partition_components(3)
+        assert [ei.attr(c, "id") for c in spine] == ["id_1"]
+        assert [ei.attr(c, "id") for c in frontier] == ["id_1.1", "id_1.2", "id_2"]
+        for rights_ead in [ei.rights_ead, None]:
+            ei.rights_ead = rights_ead
+            ei.inspect()
+            expected = ei.inspections
+            for workers in [1, 2]:
+                ei.inspect(workers=workers)
+                assert ei.inspections == expected
+        assert ei.inspections[0]["userestrict"] == [ei.error.miss_rights("EAD")]
+        assert (
+            ei.error.inconsistent_date("1.1.2", "1960-01-01/1960-01-01")
+            in ei.inspections[0]["unitdate"]
+        )
+
+    def test_inspect_workers_chain(self):
+        files = [
+            ead_component("file", f"1.1.{number}", "1901-01-01") for number in range(20)
+        ]
+        for components in [
+            ead_component(
+                "collection",
+                "1",
+                "1900-01-01/1950-12-31",
+                ead_component("series", "1.1", "1900-01-01/1920-12-31", *files),
+            ),
+            ead_component(
+                "collection",
+                "1",
+                "1900-01-01/1950-12-31",
+                ead_component(
+                    "series",
+                    "1.1",
+                    "1900-01-01/1920-12-31",
+                    ead_component("file", "1.1.1", "1960-01-01"),
+                ),
+            ),
+            ead_component(
+                "collection",
+                "1",
+                "1900-01-01/1950-12-31",
+                ead_component("series", "1.1", "1900-01-01/1920-12-31"),
+            )
+            + ead_component("file", "2", "1980-01-01"),
+        ]:
+            ei = EADInspector()
+            ei.read_ead(ead_corpus(components=components).encode("utf-8"))
+            ei.inspect()
+            expected = ei.inspections
+            for workers in [1, 2]:
+                spine, frontier, children = ei.partition_components(workers * 4)
+                assert len(spine) + sum(
+                    1 + len(list(c.iterdescendants("{*}c"))) for c in frontier
+                ) == len(ei.cs)
+                ei.inspect(workers=workers)
+                assert ei.inspections == expected
+
+    def test_find_near_duplicates(self, tmp_path):
+        corpus = ead_corpus().replace(
+            "<unittitle>Akte 1.2.2</unittitle>", "<unittitle>AKTE 1-1-1</unittitle>"
+        )
+        file_path = tmp_path / "ead.xml"
+        file_path.write_text(corpus, encoding="utf-8")
+        ei = EADInspector()
+        ei.read_ead(corpus.encode("utf-8"))
+        ei.configure(
+            {
+                "unittitle": {
+                    "file": {"similar": True},
+                    "item": {"similar": True},
+                    "near_duplicates": {"similarity": 0.9},
+                }
+            }
+        )
+        assert ei.has_near_duplicate_checks()
+        assert ei.find_near_duplicates("unittitle") == {"Akte 1.1.1", "AKTE 1-1-1"}
+        assert ei.find_near_duplicates("abstract") == set()
+        ei.inspect()
+        expected = ei.inspections
+        assert expected[2]["unittitle"] == [ei.error.near_dupl()]
+        assert expected[6]["unittitle"] == [ei.error.near_dupl()]
+        assert [inspection["unittitle"] for inspection in expected].count(None) == 6
+        ei.inspect(workers=2)
+        assert ei.inspections == expected
+        ei.inspect_incremental(str(tmp_path / "state.json"))
+        assert ei.inspections == expected
+        ei.configure({"unittitle": {"item": {"similar": False}}})
+        ei.inspect_incremental(str(tmp_path / "state.json"))
+        assert ei.inspections[2]["unittitle"] is None
+        ei = EADInspector()
+        ei.configure(
+            {"unittitle": {"file": {"similar": True}, "item": {"similar": True}}}
+        )
+        ei.inspect_ead_file(str(file_path))
+        assert ei.near_duplicate_unittitles >= {"Akte 1.1.1", "AKTE 1-1-1"}
+        assert ei.inspections[6]["unittitle"] == [ei.error.near_dupl()]
+
+    def test_iter_inspections(self):
+        ei = EADInspector()
+        ei.read_ead(ead_corpus().encode("utf-8"))
+        ei.inspect()
+        expected = ei.inspections
+        ei.inspections = []
+        inspections = ei.iter_inspections()
+        assert next(inspections) == expected[0]
+        assert list(inspections) == expected[1:]
+        assert list(ei.iter_inspections(workers=2)) == expected
+        assert ei.inspections == []
+
+    def test_inspect_incremental(self, tmp_path):
+        state_path = str(tmp_path / "state.json")
+        ei = EADInspector()
+        ei.read_ead(ead_corpus().encode("utf-8"))
+        digests = ei.component_digests()
+        ei.inspect()
+        expected = ei.inspections
+        ei.inspect_incremental(state_path)
+        assert ei.inspections == expected
+        with open(state_path, encoding="utf-8") as file:
+            state = json.load(file)
+        for c_id in state["records"]:
+            state["records"][c_id][1]["extent"] = ["stored"]
+        with open(state_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        ei = EADInspector()
+        ei.read_ead(
+            ead_corpus(rights_first=False)
+            .replace("<unittitle>Akte 1.2.1<", "<unittitle>Akte<")
+            .encode("utf-8")
+        )
+        changed = {"id_1", "id_1.2", "id_1.2.1"}
+        new_digests = ei.component_digests()
+        assert [
+            ei.attr(c, "id") for c in ei.cs if new_digests[c] not in digests.values()
+        ] == [c_id for c_id in state["records"] if c_id in changed]
+        ei.inspect()
+        expected = ei.inspections
+        ei.inspect_incremental(state_path)
+        for c, inspection, expected_inspection in zip(ei.cs, ei.inspections, expected):
+            if ei.attr(c, "id") in changed or expected_inspection["unitdate"]:
+                assert inspection == expected_inspection
+            else:
+                assert inspection == dict(expected_inspection, extent=["stored"])
+
+    def test_reused_inspection_disabled_level(self, tmp_path):
+        corpus = ead_corpus().replace(
+            "<userestrict type='ead'><p><extref xlink:href='https://creativecommons.org/publicdomain/zero/1.0/'>"
+            "CC0</extref></p></userestrict>",
+            "",
+        )
+        config = {"unittitle": {"series": {"inspect": False, "similar": True}}}
+        ei = EADInspector()
+        ei.configure(config)
+        ei.read_ead(corpus.encode("utf-8"))
+        ei.inspect()
+        expected = ei.inspections
+        assert expected[1]["userestrict"] is None and expected[1]["unittitle"] is None
+        ei.cache = InspectionCache(str(tmp_path / "cache.sqlite"))
+        for _ in range(2):
+            ei.inspect()
+            assert ei.inspections == expected
+        state_path = str(tmp_path / "state.json")
+        for _ in range(2):
+            ei.inspect_incremental(state_path)
+            assert ei.inspections == expected
+
+    def test_namespace(self):
+        ei = EADInspector()
+        ei.read_ead(ead_corpus().encode("utf-8"))
+        assert ei.namespace == "urn:isbn:1-931666-22-9"
+        ei.inspect()
+        expected = ei.inspections
+        ei.namespace = None
+        ei.inspect()
+        assert ei.inspections == expected
+        ei.read_ead(
+            ead_corpus()
+            .replace("<dsc>", "<dsc><x:note xmlns:x='urn:x'/>")
+            .encode("utf-8")
+        )
+        assert ei.namespace is None
+        ei.inspect()
+        assert ei.inspections == expected
+
     def test_configure(self):
         ei = EADInspector()
         default_config = ei.configuration.copy()
@@ -18,6 +326,7 @@ class Test_EADInspector:
                 "unittitle": {
                     "collection": {"min_word_num": 5},
                     "class": {"inspect": False, "min_word_num": 0},
+                    "near_duplicates": {"similarity": "0.9"},
                 }
             }
         )
@@ -29,7 +338,21 @@ class Test_EADInspector:
         assert ei.configuration["unittitle"]["class"] == {
             "inspect": False,
             "min_word_num": 0,
+            "similar": False,
         }
+        assert ei.configuration["unittitle"]["near_duplicates"] == {
+            "similarity": 0.9,
+            "bands": 20,
+            "rows": 6,
+        }
+        with pytest.raises(ValueError):
+            ei.configure({"abstract": {"near_duplicates": {"similarity": 2}}})
+        with pytest.raises(ValueError):
+            ei.configure({"abstract": {"near_duplicates": {"bands": 0}}})
+        assert (
+            ei.configuration["abstract"]["near_duplicates"]
+            == default_config["abstract"]["near_duplicates"]
+        )
         assert (
             ei.configuration["unittitle"]["file"] == default_config["unittitle"]["file"]
         )
@@ -59,6 +382,64 @@ class Test_EADInspector:
             == default_config["unittitle"]["class"]
         )
 
+    def test_compile_configuration(self):
+        ei = EADInspector()
+        ei.configure(
+            {
+                "unitid": {"pattern": r"^BBB \d+$"},
+                "index": {"patterns": {"label": "^[A-Z]", "ref": ""}},
+            }
+        )
+        assert ei.configuration["unitid"]["pattern"] == r"^BBB \d+$"
+        assert ei.configuration["index"]["patterns"] == {"label": "^[A-Z]", "ref": ""}
+        assert set(ei.patterns) == {r"^BBB \d+$", "^[A-Z]"}
+        with pytest.raises(ValueError):
+            ei.configure({"origination": {"patterns": {"label": "[", "ref": ""}}})
+        ei.configuration["unitid"]["pattern"] = "(a"
+        with pytest.raises(ValueError):
+            ei.inspect()
+
+    def test_plans(self):
+        ei = EADInspector()
+        assert set(ei.plans) == set(ei.levels)
+        ei.read_ead(ead_corpus().encode("utf-8"))
+        ei.inspect()
+        inspections: list = ei.inspections
+        file_plan: list = [key for key, *_ in ei.plans["file"]]
+        ei.configure(
+            {
+                setting: {"series": {"inspect": False}}
+                for _, setting, _, _ in ei.inspection_checks
+                if setting
+            }
+        )
+        assert [key for key, *_ in ei.plans["series"]] == ["id", "unitid"]
+        assert [key for key, *_ in ei.plans["file"]] == file_plan
+        configs: dict = {key: config for key, _, _, config in ei.plans["file"]}
+        assert configs["id"] == () and configs["unitdate"] == ({"inspect": True},)
+        assert configs["origination"] == (
+            {"inspect": True, "ref": True, "patterns": {"label": "", "ref": ""}},
+        )
+        assert (
+            configs["genreform"][0]["normal"] == ei.configuration["genreform"]["normal"]
+        )
+        ei.configure({"index": {"patterns": {"label": "^[A-Z]", "ref": ""}}})
+        assert ei.plans["file"][-2][3][0]["patterns"]["label"] is ei.patterns["^[A-Z]"]
+        assert ei.plans["collection"][-2][3][0]["min_num"] == 5
+        c = xml("<c level='series'><did/></c>")
+        assert ei.inspect_unittitle(c, "series") is None
+        assert ei.inspect_userestrict(c, "series") is None
+        assert ei.inspect_unittitle(
+            c, "series", {"inspect": True, "min_word_num": 1}
+        ) == [ei.error.miss_info()]
+        ei.inspect()
+        for c, before, after in zip(ei.cs, inspections, ei.inspections):
+            assert list(after) == list(before)
+            if ei.level(c) == "series":
+                assert after == dict(before, **dict.fromkeys(list(before)[2:]))
+            else:
+                assert after == before
+
     def test_configure_level(self):
         ei = EADInspector()
         default_config = ei.configuration.copy()
@@ -66,7 +447,8 @@ class Test_EADInspector:
             "unittitle",
             {
                 "collection": {"min_word_num": 5},
-                "class": {"inspect": 0, "min_word_num": "0"},
+                "class": {"inspect": 0, "min_word_num": "0", "similar": 1},
+                "near_duplicates": {"rows": 4.0, "unknown": 1},
             },
         )
         assert ei.configuration["unittitle"]["collection"]["min_word_num"] == 5
@@ -77,7 +459,10 @@ class Test_EADInspector:
         assert ei.configuration["unittitle"]["class"] == {
             "inspect": False,
             "min_word_num": 0,
+            "similar": True,
         }
+        assert ei.configuration["unittitle"]["near_duplicates"]["rows"] == 4
+        assert "unknown" not in ei.configuration["unittitle"]["near_duplicates"]
         assert (
             ei.configuration["unittitle"]["file"] == default_config["unittitle"]["file"]
         )
@@ -251,6 +636,76 @@ class Test_EADInspector:
             ],
         }
 
+    def test_unitdate_envelopes(self):
+        ei = EADInspector()
+        ei.compile_configuration()
+        root = xml(
+            ead_component(
+                "collection",
+                "1",
+                "1900-01-01/1950-12-31",
+                ead_component(
+                    "series",
+                    "1.1",
+                    "1900-01-01/1920-12-31",
+                    ead_component(
+                        "file",
+                        "1.1.1",
+                        "1901-01-01/1905-12-31",
+                        ead_component("item", "1.1.1.1", "1890-01-01"),
+                    ),
+                    ead_component("file", "1.2.1", "1910-01-01/1960-12-31"),
+                ),
+                ead_component(
+                    "series",
+                    "1.2",
+                    "1930-01-01/1950-12-31",
+                    ead_component("file", "1.2.1", "1940-01-01/1945-12-31"),
+                ),
+            )
+        )
+        cs = [root, *root.iterdescendants("c")]
+        envelopes = ei.unitdate_envelopes(cs)
+        assert envelopes[root]["envelope"] == {
+            "earliest_date": date(1890, 1, 1),
+            "latest_date": date(1960, 12, 31),
+        }
+        assert envelopes[root]["ambiguous"]
+        assert not envelopes[cs[2]]["ambiguous"]
+        assert ei.enveloped_unitdates(cs[2], envelopes) == {
+            "1.1.1.1": envelopes[cs[3]]["dates"]
+        }
+        assert ei.enveloped_unitdates(cs[1], envelopes) == {}
+        assert ei.enveloped_unitdates(root, envelopes) == ei.subordinate_unitdates(root)
+        for c in cs:
+            assert ei.inspect_unitdates(
+                c, ei.level(c), ei.enveloped_unitdates(c, envelopes)
+            ) == ei.inspect_unitdates(c, ei.level(c))
+
+    def test_date_checks(self):
+        pytest.importorskip("numpy")
+        ei = EADInspector()
+        ei.read_ead(ead_corpus().encode("utf-8"))
+        checks = ei.date_checks()
+        assert checks["missing"] == set()
+        assert checks["inverted"] == set()
+        assert checks["future"] == {6}
+        assert checks["inconsistent"] == {
+            position
+            for position, c in enumerate(ei.cs)
+            if ei.inspect_unitdates_consistency(ei.findall(c, "{*}did/{*}unitdate"), c)
+        }
+        assert checks["inconsistent"] == {0, 1, 4}
+        assert checks["future"] == {
+            position
+            for position, c in enumerate(ei.cs)
+            if any(
+                ei.is_future(ei.date_range(ei.attr(unitdate, "normal"), starts=True))
+                for unitdate in ei.findall(c, "{*}did/{*}unitdate")
+            )
+        }
+        assert ei.date_checks(date(1900, 6, 1))["future"] == {0, 1, 2, 3, 4, 5, 6, 7}
+
     def test_normalized_unitdates(self):
         ei = EADInspector()
         assert ei.normalized_unitdates([xml("<unitdate normal='2015-01-01'/>")]) == [
@@ -662,6 +1117,8 @@ class Test_EADInspector:
         ei = EADInspector()
         assert ei.inspect_date(xml("<elem normal='2015-01-01'/>")) == []
         assert ei.inspect_date(xml("<elem normal='2015-01-01/2015-01-15'/>")) == []
+        assert ei.inspect_date(xml("<elem normal='1900/..'/>")) == []
+        assert ei.inspect_date(xml("<elem normal='1900-05'/>")) == []
         assert ei.error.miss_norm_date("01.01.2015") in ei.inspect_date(
             xml("<elem>01.01.2015</elem>")
         )
@@ -678,6 +1135,16 @@ class Test_EADInspector:
             xml("<elem normal='3000-01-01'/>")
         )
 
+    def test_inspect_date_current(self):
+        ei = EADInspector()
+        today = date.today()
+        assert ei.inspect_date(xml(f"<elem normal='{today:%Y}'/>")) == []
+        assert ei.inspect_date(xml(f"<elem normal='{today:%Y-%m}'/>")) == []
+        assert ei.inspect_date(xml(f"<elem normal='1900/{today:%Y-%m}'/>")) == []
+        assert ei.error.future(f"1900/{today.year + 1}") in ei.inspect_date(
+            xml(f"<elem normal='1900/{today.year + 1}'/>")
+        )
+
     def test_inspect_dates(self):
         ei = EADInspector()
         assert ei.inspect_dates([xml("<elem normal='2015-01-01'/>")]) == []
@@ -0,0 +1,27 @@
+import json
+import pickle
+from nfdinspector.error import Error, Message
+
+
+class Test_Error:
+
+    def test_message(self):
+        error = Error("en")
+        assert error.miss_actor("t") == "missing actor (t)"
+        assert error.miss_actor("t").key == "miss_actor"
+        assert error.miss_info() is error.miss_info()
+        assert error.inconsistent_date("1", "2000/2001") == (
+            "inconsistent date (1: 2000/2001)"
+        )
+        assert error.dist("{x}") == "not distinct from {x}"
+        error.language = "de"
+        assert error.miss_info() == "Angabe fehlt"
+        assert Error("fr").miss_info() == "missing information"
+
+    def test_serialize(self):
+        message = Error("de").miss_place("t")
+        copy = pickle.loads(pickle.dumps(message))
+        assert isinstance(copy, Message)
+        assert copy == message and copy.key == "miss_place"
+        assert not hasattr(message, "__dict__")
+        assert json.loads(json.dumps([message])) == ["Ort fehlt (t)"]
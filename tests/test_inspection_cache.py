@@ -0,0 +1,102 @@
+import pytest
+from nfdinspector.inspection_cache import InspectionCache
+from nfdinspector.lido_inspector import LIDOInspector
+from nfdinspector.ead_inspector import EADInspector
+from test_lido_inspector import lido_corpus, lido_record, lido_wrap
+from test_ead_inspector import ead_corpus
+
+
+def key(number):
+    return (f"{number:032x}", "config", "en", "0.0")
+
+
+class Test_InspectionCache:
+
+    def test_get_put(self, tmp_path):
+        file_path = str(tmp_path / "cache.sqlite")
+        with InspectionCache(file_path) as cache:
+            assert cache.get(key(1)) is None
+            cache.put(key(1), {"id": "1", "title": ["ä"]})
+            cache.put(key(1), {"id": "1", "title": None})
+            assert cache.get(key(1)) == {"id": "1", "title": None}
+            assert cache.get((*key(1)[:3], "0.1")) is None
+            assert cache.stats == {"hits": 1, "misses": 2, "evictions": 0, "entries": 1}
+            cache.reset_stats()
+            assert cache.stats["hits"] == 0
+        with InspectionCache(file_path) as cache:
+            assert cache.stats["entries"] == 1
+            assert cache.get(key(1)) == {"id": "1", "title": None}
+            cache.clear()
+            assert cache.get(key(1)) is None
+            assert cache.stats["entries"] == 0
+        with pytest.raises(ValueError):
+            InspectionCache(file_path, 0)
+
+    def test_evict(self):
+        cache = InspectionCache(":memory:", 10)
+        for number in range(10):
+            cache.put(key(number), {"id": str(number)})
+        assert cache.get(key(0)) is not None
+        cache.put(key(10), {"id": "10"})
+        assert cache.stats["entries"] == 9
+        assert cache.stats["evictions"] == 2
+        assert cache.get(key(0)) is not None
+        assert cache.get(key(1)) is None
+        assert cache.get(key(2)) is None
+        assert cache.get(key(3)) is not None
+        cache.close()
+
+    def test_lido_inspector(self, tmp_path):
+        cache = InspectionCache(str(tmp_path / "cache.sqlite"))
+        li = LIDOInspector()
+        li.read_lido(lido_corpus().encode("utf-8"))
+        li.inspect()
+        expected = li.inspections
+        li.cache = cache
+        li.inspect()
+        assert li.inspections == expected
+        assert cache.stats == {"hits": 0, "misses": 4, "evictions": 0, "entries": 4}
+        li.inspect()
+        assert li.inspections == expected
+        assert cache.stats["hits"] == 4
+        li = LIDOInspector()
+        li.cache = cache
+        li.read_lido(
+            lido_wrap(
+                lido_record("DE-1_2", "Bildnis eines Mannes", "Eine Landschaft"),
+                lido_record("DE-1_5", "Bildnis eines Mannes", "Eine Landschaft"),
+            ).encode("utf-8")
+        )
+        li.inspect()
+        assert cache.stats["hits"] == 5
+        assert li.inspections[0] == dict(
+            expected[1], objectDescription=li.inspections[1]["objectDescription"]
+        )
+        assert li.error.not_uniq() in li.inspections[1]["objectDescription"]
+        assert li.error.not_uniq() in li.inspections[0]["objectDescription"]
+        li.configure({"title": {"min_word_num": 5}})
+        li.inspect()
+        assert cache.stats["entries"] == 7
+        li.error.language = "de"
+        li.inspect()
+        assert cache.stats["entries"] == 9
+        cache.close()
+
+    def test_ead_inspector(self):
+        cache = InspectionCache(":memory:")
+        ei = EADInspector()
+        ei.read_ead(ead_corpus().encode("utf-8"))
+        ei.inspect()
+        expected = ei.inspections
+        ei.cache = cache
+        ei.inspect()
+        ei.inspect()
+        assert ei.inspections == expected
+        assert cache.stats["misses"] == len(expected)
+        assert cache.stats["hits"] == len(expected)
+        assert cache.stats["entries"] == len(expected)
+        ei.rights_ead = None
+        ei.inspect()
+        assert ei.inspections[0]["userestrict"] == [ei.error.miss_rights("EAD")]
+        assert cache.stats["hits"] == 2 * len(expected)
+        cache.close()
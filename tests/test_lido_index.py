@@ -0,0 +1,78 @@
+import os
+import pytest
+from nfdinspector.lido_index import LIDOIndex
+from nfdinspector.lido_inspector import LIDOInspector
+from test_lido_inspector import lido_corpus, lido_record, lido_wrap
+
+
+class Test_LIDOIndex:
+
+    def test_build(self, tmp_path):
+        file_path = tmp_path / "lido.xml"
+        file_path.write_text(lido_corpus(), encoding="utf-8")
+        index = LIDOIndex(str(file_path))
+        index.build()
+        assert [record[0] for record in index.records] == [
+            "DE-1_1",
+            "DE-1_2",
+            "DE-1_3",
+            "DE-1_4",
+        ]
+        data = file_path.read_bytes()
+        for rec_id, offset, length in index.records:
+            record = data[offset : offset + length]
+            assert record.startswith(b"<lido:lido>")
+            assert record.endswith(b"</lido:lido>")
+            assert f">{rec_id}<".encode() in record
+        (tmp_path / "empty.xml").write_bytes(b"")
+        index = LIDOIndex(str(tmp_path / "empty.xml"))
+        index.build()
+        assert index.records == []
+        with pytest.raises(ValueError):
+            LIDOIndex(str(tmp_path / "lido.xml.gz")).build()
+
+    def test_open(self, tmp_path):
+        file_path = tmp_path / "lido.xml"
+        file_path.write_text(lido_corpus(), encoding="utf-8")
+        index = LIDOIndex.open(str(file_path))
+        assert os.path.exists(index.index_path)
+        loaded = LIDOIndex(str(file_path))
+        loaded.load()
+        assert loaded.records == index.records
+        assert loaded.rec_ids == index.rec_ids
+        file_path.write_text(
+            lido_wrap(
+                lido_record("DE-1_5", "Gemälde", ""),
+                lido_record("DE-1_5", "Gemälde", "Eine Landschaft"),
+            ),
+            encoding="utf-8",
+        )
+        with pytest.raises(ValueError):
+            loaded.load()
+        index = LIDOIndex.open(str(file_path))
+        assert list(index.rec_ids) == ["DE-1_5"]
+        assert len(index.read_records(["DE-1_5"])) == 2
+
+    def test_read_lido_objects(self, tmp_path):
+        file_path = tmp_path / "lido.xml"
+        file_path.write_text(lido_corpus(), encoding="utf-8")
+        index = LIDOIndex.open(str(file_path))
+        lido_objects = index.read_lido_objects(["DE-1_3", "DE-1_1"])
+        assert [obj.find("{*}lidoRecID").text for obj in lido_objects] == [
+            "DE-1_1",
+            "DE-1_3",
+        ]
+        with pytest.raises(KeyError):
+            index.read_lido_objects(["DE-1_9"])
+        li = LIDOInspector()
+        li.read_lido_file(str(file_path))
+        li.inspect()
+        expected = li.inspections
+        li = LIDOInspector()
+        li.read_lido_records(str(file_path), ["DE-1_2", "DE-1_4"])
+        li.inspect()
+        assert [inspection["lidoRecID"] for inspection in li.inspections] == [
+            "DE-1_2",
+            "DE-1_4",
+        ]
+        assert li.inspections[1] == expected[3]
@@ -1,14 +1,341 @@
+import gzip
+import io
+import json
+import zipfile
 import pytest
+from datetime import date
 from lxml import etree
 from nfdinspector.lido_inspector import LIDOInspector
+from nfdinspector.corpus_duplicates import CorpusDuplicates
 
 
 def xml(xml_string):
     return etree.fromstring(xml_string)
 
 
+def lido_record(rec_id, title, description):
+    return (
+        "<lido:lido>"
+        f"<lido:lidoRecID lido:type='local'>{rec_id}</lido:lidoRecID>"
+        "<lido:category><lido:conceptID>http://terminology.lido-schema.org/lido00096</lido:conceptID>"
+        "<lido:term>Man-Made Object</lido:term></lido:category>"
+        "<lido:descriptiveMetadata xml:lang='de'>"
+        "<lido:objectClassificationWrap><lido:objectWorkTypeWrap><lido:objectWorkType>"
+        "<lido:conceptID>http://vocab.getty.edu/aat/300033618</lido:conceptID><lido:term>Gemälde</lido:term>"
+        "</lido:objectWorkType></lido:objectWorkTypeWrap></lido:objectClassificationWrap>"
+        "<lido:objectIdentificationWrap>"
+        f"<lido:titleWrap><lido:titleSet><lido:appellationValue>{title}</lido:appellationValue></lido:titleSet></lido:titleWrap>"
+        "<lido:repositoryWrap><lido:repositorySet><lido:repositoryName><lido:legalBodyID>ISIL</lido:legalBodyID>"
+        "<lido:legalBodyName><lido:appellationValue>Museum</lido:appellationValue></lido:legalBodyName></lido:repositoryName>"
+        f"<lido:workID>{rec_id}</lido:workID></lido:repositorySet></lido:repositoryWrap>"
+        f"<lido:objectDescriptionWrap><lido:objectDescriptionSet><lido:descriptiveNoteValue>{description}</lido:descriptiveNoteValue></lido:objectDescriptionSet></lido:objectDescriptionWrap>"
+        "<lido:objectMeasurementsWrap><lido:objectMeasurementsSet><lido:objectMeasurements><lido:measurementsSet>"
+        "<lido:measurementType>Höhe</lido:measurementType><lido:measurementUnit>cm</lido:measurementUnit>"
+        "<lido:measurementValue>10</lido:measurementValue></lido:measurementsSet></lido:objectMeasurements></lido:objectMeasurementsSet></lido:objectMeasurementsWrap>"
+        "</lido:objectIdentificationWrap>"
+        "<lido:eventWrap><lido:eventSet><lido:event><lido:eventType><lido:term>Herstellung</lido:term></lido:eventType>"
+        "<lido:eventDate><lido:date><lido:earliestDate>1900</lido:earliestDate><lido:latestDate>1950</lido:latestDate></lido:date></lido:eventDate>"
+        "</lido:event></lido:eventSet></lido:eventWrap>"
+        "</lido:descriptiveMetadata>"
+        "<lido:administrativeMetadata xml:lang='de'><lido:recordWrap>"
+        f"<lido:recordID lido:type='local'>{rec_id}</lido:recordID>"
+        "<lido:recordType><lido:term>item</lido:term></lido:recordType>"
+        "<lido:recordSource><lido:legalBodyName><lido:appellationValue>Museum</lido:appellationValue></lido:legalBodyName></lido:recordSource>"
+        "<lido:recordInfoSet><lido:recordInfoLink>https://example.org/</lido:recordInfoLink></lido:recordInfoSet>"
+        "</lido:recordWrap></lido:administrativeMetadata>"
+        "</lido:lido>"
+    )
+
+
+def lido_wrap(*records):
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?>\n"
+        "<lido:lidoWrap xmlns:lido='http://www.lido-schema.org' "
+        "xmlns:xsi='http://www.w3.org/2001/XMLSchema-instance'>\n"
+        + "\n".join(records)
+        + "\n</lido:lidoWrap>\n"
+    )
+
+
+def lido_corpus():
+    return lido_wrap(
+        lido_record("DE-1_1", "Bildnis eines Mannes", "Ein Gemälde " * 25),
+        lido_record("DE-1_2", "Bildnis eines Mannes", "Eine Landschaft"),
+        lido_record("DE-1_3", "Gemälde", "Ein Gemälde " * 25),
+        lido_record("DE-1_4", "Stillleben mit  Blumen", ""),
+    )
+
+
 class Test_LIDOInspector:
 
+    def test_read_lido(self):
+        payload = lido_corpus().encode("utf-8")
+        for source in [payload, memoryview(payload), io.BytesIO(payload)]:
+            li = LIDOInspector()
+            li.read_lido(source)
+            assert len(li.lido_objects) == 4
+            assert li.lido_objects[0].find("{*}lidoRecID").text == "DE-1_1"
+
+    def test_inspect_workers(self):
+        li = LIDOInspector()
+        li.read_lido(lido_corpus().encode("utf-8"))
+        li.configure_setting("title", {"min_word_num": 3})
+        li.inspect()
+        expected = li.inspections
+        li.inspect(workers=2)
+        assert li.inspections == expected
+        assert li.error.not_uniq() in li.inspections[1]["title"]
+        assert li.error.not_uniq() in li.inspections[2]["objectDescription"]
+        li = LIDOInspector("de")
+        li.read_lido(lido_corpus().encode("utf-8"))
+        li.inspect(workers=3)
+        assert li.error.not_uniq() in li.inspections[0]["title"]
+        assert li.inspections[3]["objectDescription"] == ["Angabe fehlt"]
+
+    def test_iter_inspections(self, tmp_path):
+        file_path = tmp_path / "lido.xml"
+        file_path.write_text(lido_corpus(), encoding="utf-8")
+        li = LIDOInspector()
+        li.read_lido(lido_corpus().encode("utf-8"))
+        li.inspect()
+        expected = li.inspections
+        li = LIDOInspector()
+        li.read_lido(lido_corpus().encode("utf-8"))
+        inspections = li.iter_inspections()
+        assert next(inspections) == expected[0]
+        assert list(inspections) == expected[1:]
+        assert list(li.iter_inspections(workers=2)) == expected
+        assert li.inspections == []
+        assert list(li.iter_lido_stream([str(file_path)])) == expected
+        li.to_json(tmp_path / "lido.json", inspections=li.iter_inspections(workers=2))
+        assert json.loads((tmp_path / "lido.json").read_text("utf-8")) == expected
+
+    def test_iter_lido_stream_mixed(self, tmp_path):
+        mixed = lido_wrap(
+            lido_record("DE-1_1", "Bildnis einer Frau", "Ein Porträt")
+            .replace("<lido:category>", "<category>")
+            .replace("</lido:category>", "</category>")
+            .replace(
+                "<lido:term>Man-Made Object</lido:term>", "<term>Man-Made Object</term>"
+            )
+        )
+        file_path = tmp_path / "lido.xml"
+        file_path.write_text(mixed, encoding="utf-8")
+        li = LIDOInspector()
+        li.read_lido(mixed.encode("utf-8"))
+        li.inspect()
+        assert li.inspections[0]["category"] is None
+        assert list(li.iter_lido_stream([str(file_path)])) == li.inspections
+
+    def test_add_remove_lido_objects(self):
+        li = LIDOInspector()
+        li.read_lido(
+            lido_wrap(
+                lido_record("DE-1_1", "Bildnis eines Mannes", "Ein Gemälde " * 25),
+                lido_record("DE-1_2", "Landschaft mit Fluss", "Eine Landschaft"),
+            ).encode("utf-8")
+        )
+        li.inspect()
+        assert li.inspections[0]["title"] is None
+        batch = LIDOInspector.read_xml(
+            lido_wrap(
+                lido_record("DE-1_3", "Bildnis eines Mannes", "Eine Landschaft"),
+                lido_record("DE-1_4", "Gemälde", "Ein Gemälde"),
+            ).encode("utf-8")
+        ).findall("{*}lido")
+        assert li.add_lido_objects(batch) == (
+            {"Bildnis eines Mannes"},
+            {"Eine Landschaft"},
+        )
+        assert len(li.lido_objects) == 4
+        assert li.title_index.count("Bildnis eines Mannes") == 2
+        li.inspect()
+        assert li.error.not_uniq() in li.inspections[0]["title"]
+        assert li.error.not_uniq() in li.inspections[2]["title"]
+        assert li.error.not_uniq() in li.inspections[1]["objectDescription"]
+        assert li.find_duplicate_titles() == li.title_index.duplicates
+        assert li.remove_lido_objects(batch[:1]) == (
+            {"Bildnis eines Mannes"},
+            {"Eine Landschaft"},
+        )
+        assert len(li.lido_objects) == 3
+        li.inspect()
+        assert li.inspections[0]["title"] is None
+        assert li.find_duplicate_descriptions() == li.description_index.duplicates
+        with pytest.raises(ValueError):
+            li.remove_lido_objects(batch[:1])
+        li.lido_objects.append(batch[0])
+        li.inspect()
+        assert li.error.not_uniq() in li.inspections[0]["title"]
+        assert li.error.not_uniq() in li.inspections[3]["title"]
+        li.lido_objects[3] = batch[1]
+        li.inspect()
+        assert li.inspections[0]["title"] is None
+        assert li.title_index.count("Bildnis eines Mannes") == 1
+        li.read_lido(lido_wrap().encode("utf-8"))
+        assert len(li.title_index) == 0
+
+    def test_inspect_incremental(self, tmp_path):
+        state_path = str(tmp_path / "state.json")
+        records = [
+            lido_record("DE-1_1", "Bildnis eines Mannes", "Ein Gemälde " * 25),
+            lido_record("DE-1_2", "Landschaft mit Fluss", "Eine Landschaft"),
+            lido_record("DE-1_3", "Gemälde", "Ein Gemälde " * 25),
+        ]
+        li = LIDOInspector()
+        li.read_lido(lido_wrap(*records).encode("utf-8"))
+        li.inspect()
+        expected = li.inspections
+        li.inspect_incremental(state_path)
+        assert li.inspections == expected
+        with open(state_path, encoding="utf-8") as file:
+            state = json.load(file)
+        assert list(state["records"]) == ["DE-1_1", "DE-1_2", "DE-1_3"]
+        state["records"]["DE-1_2"][1]["category"] = ["stored"]
+        state["records"]["DE-1_2"][1]["title"] = ["stored"]
+        state["records"]["DE-1_3"][1]["category"] = ["stored"]
+        with open(state_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        records[0] = lido_record("DE-1_1", "Landschaft mit Fluss", "Ein Gemälde")
+        records.append(lido_record("DE-1_4", "Gemälde", ""))
+        li = LIDOInspector()
+        li.read_lido(lido_wrap(*records).encode("utf-8"))
+        li.inspect()
+        expected = li.inspections
+        li.inspect_incremental(state_path)
+        assert li.inspections[1]["category"] == ["stored"]
+        assert li.inspections[2]["category"] == ["stored"]
+        assert li.inspections[1]["title"] == expected[1]["title"]
+        assert li.error.not_uniq() in li.inspections[1]["title"]
+        assert li.error.not_uniq() in li.inspections[2]["title"]
+        assert (
+            li.inspections[2]["objectDescription"] == expected[2]["objectDescription"]
+        )
+        for inspection, expected_inspection in zip(li.inspections, expected):
+            assert list(inspection) == list(expected_inspection)
+        assert li.inspections[0] == expected[0]
+        assert li.inspections[3] == expected[3]
+        li.inspect_incremental(state_path)
+        assert li.inspections[1]["category"] == ["stored"]
+        li.configure({"category": {"ref": False}})
+        li.inspect()
+        expected = li.inspections
+        li.inspect_incremental(state_path)
+        assert li.inspections == expected
+
+    def test_read_lido_files(self, tmp_path):
+        (tmp_path / "1.xml").write_text(lido_corpus(), encoding="utf-8")
+        (tmp_path / "2.xml").write_text(
+            lido_wrap(lido_record("DE-1_5", "Bildnis eines Mannes", "")),
+            encoding="utf-8",
+        )
+        (tmp_path / "3.xml").write_text("<lido:lidoWrap>", encoding="utf-8")
+        inspections = []
+        for workers in [None, 2]:
+            li = LIDOInspector()
+            li.read_lido_files(str(tmp_path), workers=workers)
+            li.inspect()
+            assert li.lido_record(li.lido_objects[0]).namespace == li.lido_namespace
+            assert [error[0] for error in li.read_errors] == [f"{tmp_path}/3.xml"]
+            inspections.append(li.inspections)
+        assert [inspection["lidoRecID"] for inspection in inspections[0]] == [
+            "DE-1_1",
+            "DE-1_2",
+            "DE-1_3",
+            "DE-1_4",
+            "DE-1_5",
+        ]
+        assert inspections[0] == inspections[1]
+
+    def test_inspect_lido_files(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "1.xml").write_text(lido_corpus(), encoding="utf-8")
+        (tmp_path / "2.xml").write_text(
+            lido_wrap(lido_record("DE-1_5", "Gemälde", "")), encoding="utf-8"
+        )
+        (tmp_path / "3.xml").write_text("<lido:lidoWrap>", encoding="utf-8")
+        li = LIDOInspector()
+        li.read_lido_files(str(tmp_path), recursive=True)
+        li.inspect()
+        expected = li.inspections
+        li = LIDOInspector()
+        li.inspect_lido_files(str(tmp_path), recursive=True)
+        assert li.inspections == expected
+        assert [inspection["lidoRecID"] for inspection in li.inspections] == [
+            "DE-1_5",
+            "DE-1_1",
+            "DE-1_2",
+            "DE-1_3",
+            "DE-1_4",
+        ]
+        assert li.error.not_uniq() in li.inspections[0]["title"]
+        assert [error[0] for error in li.read_errors] == [str(tmp_path / "3.xml")]
+        li.inspect_lido_files(str(tmp_path), exclude=("a",), recursive=True)
+        assert len(li.inspections) == 1
+        li.inspect_lido_files(str(tmp_path))
+        assert len(li.inspections) == 1
+
+    def test_inspect_lido_file(self, tmp_path):
+        file_path = tmp_path / "lido.xml"
+        file_path.write_text(lido_corpus(), encoding="utf-8")
+        li = LIDOInspector()
+        li.read_lido_file(str(file_path))
+        li.inspect()
+        expected = li.inspections
+        li = LIDOInspector()
+        li.inspect_lido_file(str(file_path))
+        assert li.inspections == expected
+        assert li.lido_objects == []
+        assert li.duplicate_titles == {"Bildnis eines Mannes"}
+        assert li.duplicate_descriptions == {"Ein Gemälde " * 25}
+        assert li.error.not_uniq() in li.inspections[0]["title"]
+        assert li.error.not_uniq() in li.inspections[2]["objectDescription"]
+        assert li.inspections[3]["objectDescription"] == [li.error.miss_info()]
+        file_path.write_text(
+            lido_corpus().replace(
+                "<lido:term>Man-Made Object</lido:term></lido:category>",
+                "<skos:Concept xmlns:skos='http://www.w3.org/2004/02/skos/core#'>"
+                "<skos:prefLabel>Man-Made Object</skos:prefLabel></skos:Concept></lido:category>",
+            ),
+            encoding="utf-8",
+        )
+        li = LIDOInspector()
+        li.read_lido_file(str(file_path))
+        li.inspect()
+        expected = li.inspections
+        assert li.lido_record(li.lido_objects[0]).namespace is None
+        li = LIDOInspector()
+        li.inspect_lido_file(str(file_path))
+        assert li.inspections == expected
+
+    def test_inspect_compressed_lido_file(self, tmp_path):
+        file_path = tmp_path / "lido.xml.gz"
+        file_path.write_bytes(gzip.compress(lido_corpus().encode("utf-8")))
+        li = LIDOInspector()
+        li.read_lido_file(str(file_path))
+        li.inspect()
+        expected = li.inspections
+        assert len(expected) == 4
+        li = LIDOInspector()
+        li.inspect_lido_file(str(file_path))
+        assert li.inspections == expected
+        with zipfile.ZipFile(tmp_path / "lido.zip", "w") as archive:
+            archive.writestr("1.xml", lido_corpus())
+            archive.writestr("2.xml", lido_wrap(lido_record("DE-1_5", "Gemälde", "")))
+        li = LIDOInspector()
+        li.inspect_lido_files(str(tmp_path), include=("*.zip",))
+        assert [inspection["lidoRecID"] for inspection in li.inspections] == [
+            "DE-1_1",
+            "DE-1_2",
+            "DE-1_3",
+            "DE-1_4",
+            "DE-1_5",
+        ]
+        assert li.error.not_uniq() in li.inspections[4]["title"]
+        li = LIDOInspector()
+        li.read_lido_file(str(tmp_path / "lido.zip"))
+        assert len(li.lido_objects) == 5
+
     def test_configure(self):
         li = LIDOInspector()
         default_config = li.configuration.copy()
@@ -18,6 +345,9 @@ class Test_LIDOInspector:
                     "inspect": True,
                     "unique": False,
                     "distinct_from_type": True,
+                    "similar": 1,
+                    "similarity": "0.9",
+                    "bands": 10.0,
                     "min_word_num": 3,
                     "max_word_num": "5",
                 },
@@ -31,6 +361,10 @@ class Test_LIDOInspector:
         assert li.configuration["title"] == {
             "inspect": True,
             "unique": False,
+            "similar": True,
+            "similarity": 0.9,
+            "bands": 10,
+            "rows": 6,
             "distinct_from_type": True,
             "min_word_num": 3,
             "max_word_num": 5,
@@ -64,6 +398,10 @@ class Test_LIDOInspector:
         assert li.configuration["title"] == {
             "inspect": True,
             "unique": False,
+            "similar": False,
+            "similarity": 0.8,
+            "bands": 20,
+            "rows": 6,
             "distinct_from_type": default_config["title"]["distinct_from_type"],
             "min_word_num": 2,
             "max_word_num": default_config["title"]["max_word_num"],
@@ -77,6 +415,51 @@ class Test_LIDOInspector:
         li.configure_setting("classification", {})
         assert li.configuration["classification"] == default_config["classification"]
 
+    def test_compile_configuration(self):
+        li = LIDOInspector()
+        assert [key for key, _, _ in li.checks] == list(
+            li.inspect_record(li.lido_record(xml("<lido/>")))
+        )
+        li.configure(
+            {
+                "work_id": {"pattern": r"^\d+$"},
+                "category": {"patterns": {"label": "^[A-Z]", "ref": ""}},
+                "event": {"inspect": False},
+                "record_info": {"inspect": False},
+            }
+        )
+        assert set(li.patterns) == {r"^\d+$", "^[A-Z]"}
+        assert li.pattern("^[A-Z]") is li.patterns["^[A-Z]"]
+        checks: dict = {key: arguments for key, _, arguments in li.checks}
+        assert "event" not in checks and "recordInfoSet" not in checks
+        assert checks["lidoRecID"] == ()
+        assert checks["objectMeasurements"] == ({"inspect": True},)
+        assert checks["workID"][0]["pattern"] is li.patterns[r"^\d+$"]
+        assert checks["category"][0]["patterns"] == {
+            "label": li.patterns["^[A-Z]"],
+            "ref": "",
+        }
+        assert li.configuration["category"]["patterns"]["label"] == "^[A-Z]"
+        inspection: dict = li.inspect_lido_object(xml("<lido/>"))
+        assert list(inspection)[-1] == "recordInfoSet"
+        assert inspection["event"] is None and inspection["recordInfoSet"] is None
+        assert li.inspect_events(xml("<lido/>")) is None
+        assert li.inspect_record_info_set(xml("<lido/>")) is None
+        assert li.inspect_record_info_set(xml("<lido/>"), {"inspect": True}) == [
+            li.error.miss_info()
+        ]
+        li.configuration["event"]["inspect"] = True
+        li.lido_objects = [xml("<lido/>")]
+        li.inspect()
+        assert li.inspections[0]["event"] is not None
+        with pytest.raises(ValueError):
+            li.configure({"work_id": {"pattern": "["}})
+        with pytest.raises(ValueError):
+            li.configure({"record_type": {"patterns": {"label": "", "ref": "(a"}}})
+        li.configuration["work_id"]["pattern"] = "*"
+        with pytest.raises(ValueError):
+            li.inspect()
+
     def test_find_duplicates(self):
         li = LIDOInspector()
         wrap = [
@@ -228,6 +611,116 @@ class Test_LIDOInspector:
         assert "test test" not in li.find_duplicate_descriptions()
         assert "test test test test" not in li.find_duplicate_descriptions()
 
+    def test_find_near_duplicates(self, tmp_path):
+        corpus = lido_wrap(
+            lido_record("DE-1_1", "Bildnis eines Mannes", "Ein Gemälde " * 25),
+            lido_record("DE-1_2", "Bildnis eines Mannes.", "Ein Gemälde " * 25),
+            lido_record("DE-1_3", "Landschaft mit Fluss", "Eine Landschaft"),
+            lido_record("DE-1_4", "Landschaft mit Fluss", "Eine Landschaft!"),
+        )
+        file_path = tmp_path / "lido.xml"
+        file_path.write_text(corpus, encoding="utf-8")
+        li = LIDOInspector()
+        li.read_lido(corpus.encode("utf-8"))
+        li.inspect()
+        assert li.near_duplicate_titles == set()
+        assert li.inspections[0]["title"] is None
+        li.configure(
+            {"title": {"similar": True}, "object_description": {"similar": True}}
+        )
+        assert li.find_near_duplicate_titles() == {
+            "Bildnis eines Mannes",
+            "Bildnis eines Mannes.",
+        }
+        assert li.find_near_duplicate_descriptions() == {
+            "Eine Landschaft",
+            "Eine Landschaft!",
+        }
+        li.inspect()
+        expected = li.inspections
+        assert li.error.near_dupl() in expected[0]["title"]
+        assert li.error.near_dupl() in expected[1]["title"]
+        assert expected[2]["title"] == [li.error.not_uniq()]
+        assert li.error.near_dupl() in expected[3]["objectDescription"]
+        assert li.error.near_dupl() not in expected[0]["objectDescription"]
+        li.inspect(workers=2)
+        assert li.inspections == expected
+        li.inspect_lido_stream([str(file_path)])
+        assert li.inspections == expected
+        li.read_lido(corpus.encode("utf-8"))
+        li.inspect_incremental(str(tmp_path / "state.json"))
+        assert li.inspections == expected
+        li.configure({"title": {"similar": False}})
+        li.inspect()
+        assert li.inspections[0]["title"] is None
+        li.configure({"title": {"similar": True, "similarity": 0}})
+        with pytest.raises(ValueError):
+            li.inspect()
+
+    def test_spill_duplicates(self, tmp_path):
+        records = [
+            lido_record("DE-1_1", "Bildnis eines Mannes", "Ein Gemälde " * 25),
+            lido_record("DE-1_2", "Bildnis eines Mannes", "Eine Landschaft"),
+            lido_record("DE-1_3", "Gemälde", "Ein Gemälde " * 25),
+            lido_record("DE-1_4", "Stillleben mit  Blumen", ""),
+        ]
+        li = LIDOInspector()
+        li.read_lido(lido_wrap(*records).encode("utf-8"))
+        li.inspect()
+        expected = li.inspections
+        corpus = CorpusDuplicates(str(tmp_path / "runs"))
+        li = LIDOInspector()
+        li.read_lido(lido_wrap(*records[::2]).encode("utf-8"))
+        assert li.spill_duplicates(corpus) == 0
+        li.inspect()
+        first = li.inspections
+        assert first[0]["title"] is None
+        file_path = tmp_path / "lido.xml"
+        file_path.write_text(lido_wrap(*records[1::2]), encoding="utf-8")
+        assert li.spill_duplicates(corpus, [str(file_path)]) == 1
+        li.inspect_lido_stream([str(file_path)])
+        second = li.inspections
+        corpus.merge()
+        li.apply_corpus_duplicates(corpus, 0, first)
+        li.apply_corpus_duplicates(corpus, 1)
+        assert first == expected[::2]
+        assert second == expected[1::2]
+        li.apply_corpus_duplicates(corpus, 1)
+        assert second == expected[1::2]
+        broken_path = tmp_path / "broken.xml"
+        broken_path.write_text(lido_wrap(*records[1::2])[:-20], encoding="utf-8")
+        assert li.spill_duplicates(corpus, [str(broken_path)]) == 2
+        assert [error[0] for error in li.read_errors] == [str(broken_path)]
+        li.find_stream_duplicates([str(file_path), str(broken_path)])
+        assert [error[0] for error in li.read_errors] == [str(broken_path)]
+        li.inspect_lido_stream([str(broken_path)])
+        assert [error[0] for error in li.read_errors] == [str(broken_path)]
+
+    def test_date_checks(self):
+        pytest.importorskip("numpy")
+        li = LIDOInspector()
+        li.read_lido(
+            lido_wrap(
+                lido_record("DE-1_1", "Bildnis einer Frau", "Ein Porträt"),
+                lido_record("DE-1_2", "Bildnis eines Mannes", "Ein Porträt")
+                .replace(">1900<", ">1960<")
+                .replace(">1950<", ">2999-05<"),
+                lido_record("DE-1_3", "Eine Landschaft", "Ein Gemälde").replace(
+                    "<lido:latestDate>1950</lido:latestDate>", ""
+                ),
+                lido_record("DE-1_4", "Ein Stillleben", "Ein Gemälde").replace(
+                    ">1900<", ">1960<"
+                ),
+            ).encode("utf-8")
+        )
+        assert li.date_checks() == {"missing": {2}, "future": {1}, "inverted": {3}}
+        assert li.date_checks(date(1955, 1, 1)) == {
+            "missing": {2},
+            "future": {1, 3},
+            "inverted": {3},
+        }
+        assert li.date_checks(date(1950, 6, 1))["future"] == {1, 3}
+
     def test_inspect_lido_rec_id(self):
         li = LIDOInspector()
         assert (
@@ -0,0 +1,81 @@
+from lxml import etree
+from nfdinspector.lido_inspector import LIDOInspector
+from nfdinspector.lido_record import LIDORecord
+from test_lido_inspector import lido_corpus
+
+
+class Test_LIDORecord:
+
+    def test_fields(self):
+        root = etree.fromstring(lido_corpus().encode("utf-8"))
+        lido_object = root.find("{*}lido")
+        record = LIDORecord(lido_object)
+        assert record.lido_object is lido_object
+        for field, path in [
+            ("lido_rec_ids", "{*}lidoRecID"),
+            ("categories", "{*}category"),
+            (
+                "work_ids",
+                "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}repositoryWrap/{*}repositorySet/{*}workID",
+            ),
+            (
+                "title_sets",
+                "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}titleWrap/{*}titleSet",
+            ),
+            (
+                "measurements_sets",
+                "{*}descriptiveMetadata/{*}objectIdentificationWrap/{*}objectMeasurementsWrap/{*}objectMeasurementsSet/{*}objectMeasurements/{*}measurementsSet",
+            ),
+            ("events", "{*}descriptiveMetadata/{*}eventWrap/{*}eventSet/{*}event"),
+            (
+                "record_sources",
+                "{*}administrativeMetadata/{*}recordWrap/{*}recordSource",
+            ),
+            (
+                "resource_sets",
+                "{*}administrativeMetadata/{*}resourceWrap/{*}resourceSet",
+            ),
+        ]:
+            assert getattr(record, field) == lido_object.findall(path)
+        assert record.first(record.title_sets) is record.title_sets[0]
+        assert record.first(record.resource_sets) is None
+
+    def test_children(self):
+        root = etree.fromstring(
+            "<root xmlns:a='urn:a'><a:b>1</a:b><!-- c --><b>2</b><c/></root>"
+        )
+        children = LIDORecord.children([root, root.find("c")])
+        assert [child.text for child in children["b"]] == ["1", "2"]
+        assert list(children) == ["b", "c"]
+        assert LIDORecord.path(children, "c", "d") == {}
+
+    def test_namespace(self):
+        root = etree.fromstring(lido_corpus().encode("utf-8"))
+        li = LIDOInspector()
+        assert (
+            li.lido_record(root.find("{*}lido")).namespace
+            == "http://www.lido-schema.org"
+        )
+        assert LIDORecord(root.find("{*}lido")).namespace is None
+        lido_object = etree.fromstring(
+            "<lido xmlns:skos='http://www.w3.org/2004/02/skos/core#'><category>"
+            "<skos:Concept><skos:prefLabel>Man-Made Object</skos:prefLabel></skos:Concept>"
+            "</category></lido>"
+        )
+        record = li.lido_record(lido_object)
+        assert record.namespace is None
+        li.namespace = "urn:x"
+        li.inspect_lido_object(record)
+        assert li.namespace == "urn:x"
+        li.namespace = None
+        assert li.term(record.categories[0]) == "Man-Made Object"
+
+    def test_inspect(self):
+        li = LIDOInspector()
+        li.read_lido(lido_corpus().encode("utf-8"))
+        li.inspect()
+        for lido_object, inspection in zip(li.lido_objects, li.inspections):
+            record = LIDORecord(lido_object)
+            assert li.inspect_lido_object(record) == inspection
+            assert li.inspect_title(record) == li.inspect_title(lido_object)
+            assert li.inspect_events(record) == inspection["event"]
@@ -1,5 +1,15 @@
+import bz2
+import csv
+import json
+import gzip
+import io
+import threading
+import lzma
+import tarfile
+import zipfile
 import pytest
 from lxml import etree
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from nfdinspector.metadata_inspector import MetadataInspector
 
@@ -19,6 +29,287 @@ class Test_MetadataInspector:
         assert mi.read_xml("<root></root>").find("elem") == None
         assert mi.read_xml("<root></root>").text == None
         assert mi.read_xml("<root>text</root>").text == "text"
+        assert mi.read_xml(b"<root>text</root>").text == "text"
+        assert mi.read_xml(memoryview(b"<root>text</root>")).text == "text"
+        assert mi.read_xml(io.BytesIO(b"<root>text</root>")).text == "text"
+        payload = "<?xml version='1.0' encoding='ISO-8859-1'?><root>Gemälde</root>"
+        assert mi.read_xml(payload.encode("iso-8859-1")).text == "Gemälde"
+
+    def test_iter_xml_file(self, tmp_path):
+        file_path = tmp_path / "records.xml"
+        file_path.write_text(
+            "<root xmlns='urn:test'><rec>1</rec><other/><rec>2</rec><rec>3</rec></root>"
+        )
+        texts = []
+        for element in MetadataInspector.iter_xml_file(str(file_path), "{*}rec"):
+            texts.append(element.text)
+            assert element.getprevious() is None
+        assert texts == ["1", "2", "3"]
+
+    def test_open_xml_sources(self, tmp_path):
+        document = b"<root><rec>1</rec><rec>2</rec></root>"
+        (tmp_path / "1.xml.gz").write_bytes(gzip.compress(document))
+        (tmp_path / "2.xml.bz2").write_bytes(bz2.compress(document))
+        (tmp_path / "3.xml.xz").write_bytes(lzma.compress(document))
+        with zipfile.ZipFile(tmp_path / "4.zip", "w") as archive:
+            archive.writestr("a.xml", document)
+            archive.writestr("b.txt", "text")
+            archive.writestr("sub/c.xml", b"<root><rec>3</rec></root>")
+        (tmp_path / "5.xml").write_bytes(document)
+        with tarfile.open(tmp_path / "6.tar.gz", "w:gz") as archive:
+            archive.add(tmp_path / "5.xml", "d.xml")
+        for file_name in ["1.xml.gz", "2.xml.bz2", "3.xml.xz", "6.tar.gz"]:
+            file_path = str(tmp_path / file_name)
+            assert MetadataInspector.read_xml_file(file_path).find("rec").text == "1"
+            assert [
+                element.text
+                for element in MetadataInspector.iter_xml_file(file_path, "rec")
+            ] == ["1", "2"]
+        file_path = str(tmp_path / "4.zip")
+        assert [name for name, _ in MetadataInspector.open_xml_sources(file_path)] == [
+            f"{file_path}/a.xml",
+            f"{file_path}/sub/c.xml",
+        ]
+        with pytest.raises(ValueError):
+            MetadataInspector.read_xml_file(file_path)
+        assert MetadataInspector.read_xml_records(file_path, "rec") == (
+            [b"<rec>1</rec>", b"<rec>2</rec>", b"<rec>3</rec>"],
+            ["", "", ""],
+            None,
+        )
+        (tmp_path / "7.xml.gz").write_bytes(b"<root/>")
+        errors = []
+        records = MetadataInspector.read_xml_files(
+            str(tmp_path), record_tag="rec", errors=errors
+        )
+        assert [record.text for record in records] == ["1", "2"] * 3 + [
+            "1",
+            "2",
+            "3",
+            "1",
+            "2",
+            "1",
+            "2",
+        ]
+        assert [error[0] for error in errors] == [str(tmp_path / "7.xml.gz")]
+
+    def test_iter_xml_paths(self, tmp_path):
+        for relative_path in [
+            "b.xml",
+            "a.xml",
+            "c.txt",
+            "sub/d.xml",
+            "sub/old/e.xml",
+            "z/f.xml",
+        ]:
+            (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / relative_path).write_text("<root/>")
+        paths = lambda *args: [
+            path[len(str(tmp_path)) + 1 :]
+            for path in MetadataInspector.iter_xml_paths(str(tmp_path), *args)
+        ]
+        assert paths() == ["a.xml", "b.xml"]
+        assert paths(None, (), True) == [
+            "a.xml",
+            "b.xml",
+            "sub/d.xml",
+            "sub/old/e.xml",
+            "z/f.xml",
+        ]
+        assert paths(("*.xml",), ("sub/old",), True) == [
+            "a.xml",
+            "b.xml",
+            "sub/d.xml",
+            "z/f.xml",
+        ]
+        assert paths(("sub/*.xml",), ("*/old/*",), True) == ["sub/d.xml"]
+        assert paths(("*.txt", "a.*")) == ["a.xml", "c.txt"]
+
+    def test_iter_xml_files(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "1.xml").write_text("<root><rec>1</rec><rec>2</rec></root>")
+        (tmp_path / "sub" / "2.xml").write_text("<root><rec>3</rec></root>")
+        (tmp_path / "sub" / "3.xml").write_text("<root>")
+        records = MetadataInspector.iter_xml_files(
+            str(tmp_path), "rec", recursive=True, errors=[]
+        )
+        assert next(records).text == "1"
+        assert [record.text for record in records] == ["2", "3"]
+        assert [
+            record.text
+            for record in MetadataInspector.iter_xml_files(str(tmp_path), "rec")
+        ] == ["1", "2"]
+        errors = []
+        roots = list(
+            MetadataInspector.iter_xml_files(
+                str(tmp_path), recursive=True, errors=errors
+            )
+        )
+        assert [root.tag for root in roots] == ["root", "root"]
+        assert errors[0][0] == str(tmp_path / "sub" / "3.xml")
+
+    def test_xml_parser(self):
+        parser = MetadataInspector.xml_parser()
+        assert MetadataInspector.xml_parser() is parser
+        assert MetadataInspector.xml_parser({"huge_tree": True}) is not parser
+        parsers = []
+        thread = threading.Thread(
+            target=lambda: parsers.append(MetadataInspector.xml_parser())
+        )
+        thread.start()
+        thread.join()
+        assert parsers[0] is not parser
+        default_options = MetadataInspector.parser_options
+        with pytest.raises(ValueError):
+            MetadataInspector.configure_parser({"recover": True})
+        try:
+            MetadataInspector.configure_parser(
+                {"remove_blank_text": False, "resolve_entities": False}
+            )
+            assert MetadataInspector.xml_parser() is not parser
+            root = MetadataInspector.read_xml("<root> <elem/></root>")
+            assert root.text == " "
+            root = MetadataInspector.read_xml(
+                "<!DOCTYPE root [<!ENTITY e 'text'>]><root>&e;</root>"
+            )
+            assert root.text is None
+        finally:
+            MetadataInspector.parser_options = default_options
+        assert MetadataInspector.read_xml("<root> <elem/></root>").text is None
+
+    def test_read_xml_files(self, tmp_path):
+        for number in range(5):
+            (tmp_path / f"{number}.xml").write_text(
+                f"<root><rec>{number}a</rec><rec>{number}b</rec></root>"
+            )
+        (tmp_path / "broken.xml").write_text("<root><rec>")
+        (tmp_path / "other.txt").write_text("<root/>")
+        with pytest.raises(etree.XMLSyntaxError):
+            MetadataInspector.read_xml_files(str(tmp_path))
+        errors = []
+        roots = MetadataInspector.read_xml_files(str(tmp_path), errors=errors)
+        assert [root.find("rec").text for root in roots] == [
+            "0a",
+            "1a",
+            "2a",
+            "3a",
+            "4a",
+        ]
+        assert [error[0] for error in errors] == [f"{tmp_path}/broken.xml"]
+        for workers in [None, 2]:
+            errors = []
+            records = MetadataInspector.read_xml_files(
+                str(tmp_path), workers=workers, record_tag="rec", errors=errors
+            )
+            assert [record.text for record in records] == [
+                f"{number}{letter}" for number in range(5) for letter in "ab"
+            ]
+            assert len(errors) == 1
+        with pytest.raises(OSError):
+            MetadataInspector.read_xml_files(str(tmp_path), workers=2)
+
+    def test_detect_namespace(self):
+        mi = MetadataInspector()
+        assert mi.detect_namespace(xml("<a xmlns='urn:a'><b><c/></b></a>")) == "urn:a"
+        assert mi.detect_namespace(xml("<a><b><c/></b></a>")) == ""
+        assert (
+            mi.detect_namespace(xml("<a xmlns='urn:a'><b><c xmlns=''/></b></a>"))
+            is None
+        )
+        assert mi.detect_namespace(xml("<a><b><c xmlns='urn:c'/></b></a>")) is None
+        mixed = xml("<c xmlns='urn:a'><did/><c xmlns='urn:c'/></c>")
+        assert mi.detect_namespace(mixed) is None
+        assert mi.detect_namespace(mixed, "c") == "urn:a"
+
+    def test_declared_namespace(self, tmp_path):
+        xsi = "http://www.w3.org/2001/XMLSchema-instance"
+        assert (
+            MetadataInspector.declared_namespace(
+                xml("<a xmlns='urn:a'/>"), ["urn:a", xsi]
+            )
+            == "urn:a"
+        )
+        assert (
+            MetadataInspector.declared_namespace(
+                xml("<a xmlns='urn:a'/>"), ["urn:a", "urn:b"]
+            )
+            is None
+        )
+        assert MetadataInspector.declared_namespace(xml("<a/>"), []) == ""
+        assert (
+            MetadataInspector.declared_namespace(
+                xml("<a:a xmlns:a='urn:a'><b/></a:a>"), ["urn:a"]
+            )
+            is None
+        )
+        assert (
+            MetadataInspector.declared_namespace(
+                xml("<a:c xmlns:a='urn:a'><a:did/><c/></a:c>"), ["urn:a"], "c"
+            )
+            == "urn:a"
+        )
+        file_path = tmp_path / "1.xml"
+        file_path.write_text(
+            "<root xmlns='urn:a'><rec/><rec xmlns:b='urn:b'><b:x/></rec><rec/></root>"
+        )
+        declared = []
+        assert [
+            MetadataInspector.declared_namespace(element, declared)
+            for element in MetadataInspector.iter_xml_file(
+                str(file_path), "{*}rec", declared
+            )
+        ] == ["urn:a", None, None]
+
+    def test_compile_patterns(self):
+        patterns = MetadataInspector.compile_patterns(
+            {
+                "a": {"pattern": r"^\d+$"},
+                "b": {"patterns": {"label": "", "ref": "^x"}, "c": {"pattern": "^x"}},
+                "d": {"normal": ["y"]},
+            }
+        )
+        assert set(patterns) == {r"^\d+$", "^x"}
+        assert patterns["^x"].fullmatch("x")
+        with pytest.raises(TypeError):
+            patterns["^y"] = None
+        with pytest.raises(ValueError):
+            MetadataInspector.compile_patterns(
+                {"a": {"pattern": "a{2"}, "b": {"pattern": "("}}
+            )
+        mi = MetadataInspector()
+        assert mi.pattern(r"\d").fullmatch("1")
+        with pytest.raises(ValueError):
+            mi.pattern("[")
+
+    def test_find(self):
+        mi = MetadataInspector()
+        root = xml(
+            "<a xmlns='urn:a'><b><c>1</c></b><b><c>2</c><c>3</c></b><d type='x'><c>4</c></d></a>"
+        )
+        results = []
+        for namespace in [None, "urn:a"]:
+            mi.namespace = namespace
+            results.append(
+                (
+                    mi.find(root, "{*}b/{*}c").text,
+                    [c.text for c in mi.findall(root, "{*}b/{*}c")],
+                    [c.text for c in mi.findall(root, ".//{*}c")],
+                    mi.find(root, "{*}d[@type='x']/{*}*").text,
+                    mi.find(root, "{*}e"),
+                    mi.findall(root, "{*}e"),
+                    mi.child(root, "d").get("type"),
+                    mi.child(root, "c"),
+                )
+            )
+        assert (
+            results[0]
+            == results[1]
+            == ("1", ["1", "2", "3"], ["1", "2", "3", "4"], "4", None, [], "x", None)
+        )
+        mi.namespace = ""
+        assert mi.find(xml("<a><b>1</b></a>"), "{*}b").text == "1"
+        assert mi.child(xml("<a><!-- b --><b>1</b></a>"), "b").text == "1"
+        assert mi.compiled_path("{*}b", "urn:a") is mi.compiled_path("{*}b", "urn:a")
 
     def test_exists(self):
         mi = MetadataInspector()
@@ -210,6 +501,33 @@ class Test_MetadataInspector:
             "latest_date": None,
         }
 
+    def test_date_bounds(self):
+        assert MetadataInspector.date_bounds("1900") == (
+            date(1900, 1, 1),
+            date(1900, 12, 31),
+        )
+        assert MetadataInspector.date_bounds("2004-02") == (
+            date(2004, 2, 1),
+            date(2004, 2, 29),
+        )
+        assert MetadataInspector.date_bounds("1900-05/1950") == (
+            date(1900, 5, 1),
+            date(1950, 12, 31),
+        )
+        assert MetadataInspector.date_bounds("1900/..") == (date(1900, 1, 1), None)
+        assert MetadataInspector.date_bounds("1900-05/1950", starts=True) == (
+            date(1900, 5, 1),
+            date(1950, 1, 1),
+        )
+        assert MetadataInspector.date_bounds("/1950-06") == (None, date(1950, 6, 30))
+        assert MetadataInspector.date_bounds("1900-13") == (None, None)
+        assert MetadataInspector.date_bounds("2015-01-01/1.1.2015") == (None, None)
+        assert MetadataInspector.date_bounds("1900/1910/1920") == (None, None)
+        assert MetadataInspector.date_bounds("") == (None, None)
+        assert MetadataInspector.date_bounds("1900") is MetadataInspector.date_bounds(
+            "1900"
+        )
+
     def test_create_element(self):
         mi = MetadataInspector()
         assert mi.create_element("elem", "text").tag == "elem"
@@ -219,6 +537,45 @@ class Test_MetadataInspector:
         assert mi.create_element(text="text").tag == "element"
         assert mi.create_element("elem").text == ""
 
+    def test_map_ordered(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = MetadataInspector.map_ordered(
+                executor, abs, (-number for number in range(100)), 7, 3
+            )
+            assert next(results) == 0
+            assert list(results) == list(range(1, 100))
+            assert list(MetadataInspector.map_ordered(executor, abs, [])) == []
+
+    def test_to_json(self, tmp_path):
+        mi = MetadataInspector()
+        mi.inspections = [
+            {"id": "1", "title": ["Fehler\n"]},
+            {"id": "ä", "title": None},
+        ]
+        for indent in [None, 0, 4, "\t"]:
+            for inspections in [None, iter(mi.inspections)]:
+                mi.to_json(tmp_path / "out.json", indent, inspections)
+                assert (tmp_path / "out.json").read_text(
+                    encoding="utf-8"
+                ) == json.dumps(mi.inspections, indent=indent, ensure_ascii=False)
+            mi.to_json(tmp_path / "out.json", indent, iter([]))
+            assert (tmp_path / "out.json").read_text() == "[]"
+
+    def test_to_csv(self, tmp_path):
+        mi = MetadataInspector()
+        mi.inspections = [{"id": "1", "title": "a"}, {"id": "2", "title": None}]
+        mi.to_csv(tmp_path / "1.csv", ";")
+        mi.to_csv(tmp_path / "2.csv", ";", (i for i in mi.inspections))
+        with open(tmp_path / "2.csv", newline="", encoding="utf-8") as file:
+            assert list(csv.reader(file, delimiter=";")) == [
+                ["id", "title"],
+                ["1", "a"],
+                ["2", ""],
+            ]
+        assert (tmp_path / "1.csv").read_text() == (tmp_path / "2.csv").read_text()
+        mi.to_csv(tmp_path / "3.csv", inspections=iter([]))
+        assert (tmp_path / "3.csv").read_text() == ""
+
 
 if __name__ == "__main__":
     pytest.main()
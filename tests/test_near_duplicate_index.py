@@ -0,0 +1,70 @@
+import pytest
+from nfdinspector.near_duplicate_index import NearDuplicateIndex
+
+
+def description(*words):
+    return " ".join(
+        ["Ölgemälde einer Landschaft mit Fluss, Brücke und Mühle am Abend"] * 3
+        + list(words)
+    )
+
+
+class Test_NearDuplicateIndex:
+
+    def test_add(self):
+        index = NearDuplicateIndex()
+        assert index.add("Bildnis eines Mannes") == set()
+        assert index.add("Bildnis eines Mannes") == set()
+        assert index.add("") == set()
+        assert index.add(" ... ") == set()
+        assert index.add("Landschaft mit Fluss") == set()
+        assert index.add("Bildnis eines  Mannes.") == {
+            "Bildnis eines Mannes",
+            "Bildnis eines  Mannes.",
+        }
+        assert index.add("BILDNIS EINES MANNES") == {"BILDNIS EINES MANNES"}
+        assert "Bildnis eines Mannes" in index
+        assert "Landschaft mit Fluss" not in index
+        assert len(index) == 2
+        assert index.update(
+            [description("Öl auf Leinwand"), description("Öl auf Holz")]
+        ) == {description("Öl auf Leinwand"), description("Öl auf Holz")}
+        assert index.add("Stillleben mit Blumen und Früchten") == set()
+        assert len(index.near_duplicates) == 5
+
+    def test_records(self):
+        texts = {
+            1: "Bildnis eines Mannes",
+            2: "Landschaft mit Fluss",
+            3: "Bildnis eines  Mannes.",
+            4: description("Öl auf Leinwand"),
+            5: description("Öl auf Holz"),
+        }
+        read = []
+
+        def text(record):
+            read.append(record)
+            return texts[record]
+
+        index = NearDuplicateIndex(text=text)
+        assert index.update(texts.values(), [1, 2]) == set()
+        assert read == []
+        assert index.add(texts[3], 3) == {texts[1], texts[3]}
+        assert index.add(texts[1], 1) == set()
+        assert index.update([texts[4], texts[5]], [4, 5]) == {texts[4], texts[5]}
+        assert read == [1, 4]
+        assert len(index) == 4
+
+    def test_signature(self):
+        index = NearDuplicateIndex(0.5, 4, 3, 2)
+        assert index.similarity == 0.5
+        assert (index.bands, index.rows) == (4, 3)
+        signature = index.signature(index.normalize("Bildnis eines Mannes"))
+        assert len(signature) == 12
+        assert signature == index.signature("bildnis eines mannes")
+        assert index.estimate(signature, signature) == 1.0
+        assert index.estimate(signature, index.signature("x")) < 0.5
+        assert len(index.signature("")) == 12
+        for parameters in [(0, 20, 6), (1.5, 20, 6), (0.8, 0, 6), (0.8, 20, 6, 0)]:
+            with pytest.raises(ValueError):
+                NearDuplicateIndex(*parameters)
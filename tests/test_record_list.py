@@ -0,0 +1,25 @@
+from nfdinspector.record_list import RecordList
+
+
+class Test_RecordList:
+
+    def test_version(self):
+        records = RecordList(["a", "b"])
+        assert records == ["a", "b"]
+        assert records.version == 0
+        records.append("c")
+        records.extend(["d"])
+        records.insert(0, "e")
+        records[0] = "f"
+        del records[0]
+        records += ["g"]
+        assert records.pop() == "g"
+        records.remove("d")
+        records.sort(reverse=True)
+        records.reverse()
+        assert records == ["a", "b", "c"]
+        assert records.version == 10
+        assert records[1:] == ["b", "c"]
+        assert records.version == 10
+        records.clear()
+        assert records.version == 11